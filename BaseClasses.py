@@ -5,6 +5,7 @@ import functools
 import logging
 import random
 import secrets
+import threading
 import warnings
 from argparse import Namespace
 from collections import Counter, deque
@@ -87,6 +88,7 @@ class MultiWorld():
     progression_balancing: Dict[int, Options.ProgressionBalancing]
     completion_condition: Dict[int, Callable[[CollectionState], bool]]
     indirect_connections: Dict[Region, Set[Entrance]]
+    entrance_dependencies: EntranceDependencies
     exclude_locations: Dict[int, Options.ExcludeLocations]
     priority_locations: Dict[int, Options.PriorityLocations]
     start_inventory: Dict[int, Options.StartInventory]
@@ -95,6 +97,8 @@ class MultiWorld():
     item_links: Dict[int, Options.ItemLinks]
 
     plando_item_blocks: Dict[int, List[PlandoItemBlock]]
+    sphere_cache: Optional[SphereCache] = None
+    """set once placements are final, to compute the logical spheres only once for everything that needs them"""
 
     game: Dict[int, str]
 
@@ -172,6 +176,7 @@ class MultiWorld():
         self.early_items = {player: {} for player in self.player_ids}
         self.local_early_items = {player: {} for player in self.player_ids}
         self.indirect_connections = {}
+        self.entrance_dependencies = EntranceDependencies()
         self.start_inventory_from_pool: Dict[int, Options.StartInventoryPool] = {}
         self.plando_item_blocks = {}
 
@@ -644,46 +649,12 @@ class MultiWorld():
         If there are unreachable locations, the last sphere of reachable locations is followed by an empty set,
         and then a set of all of the unreachable locations.
         """
-        state = CollectionState(self)
-        locations: Set[Location] = set()
-        events: Set[Location] = set()
-        for location in self.get_filled_locations():
-            if type(location.item.code) is int and type(location.address) is int:
-                locations.add(location)
-            else:
-                events.add(location)
-
-        while locations:
-            sphere: Set[Location] = set()
-
-            # cull events out
-            done_events: Set[Union[Location, None]] = {None}
-            while done_events:
-                done_events = set()
-                for event in events:
-                    if event.can_reach(state):
-                        state.collect(event.item, True, event)
-                        done_events.add(event)
-                events -= done_events
-
-            for location in locations:
-                if location.can_reach(state):
-                    sphere.add(location)
-
-            yield sphere
-            if not sphere:
-                if locations:
-                    yield locations  # unreachable locations
-                break
-
-            for location in sphere:
-                state.collect(location.item, True, location)
-            locations -= sphere
+        yield from (self.sphere_cache or SphereCache(self)).get_sendable_spheres()
 
     def fulfills_accessibility(self, state: Optional[CollectionState] = None):
         """Check if accessibility rules are fulfilled with current or supplied state."""
         if not state:
-            state = CollectionState(self)
+            return (self.sphere_cache or SphereCache(self)).fulfills_accessibility()
         players: Dict[str, Set[int]] = {
             "minimal": set(),
             "items": set(),
@@ -744,9 +715,542 @@ class MultiWorld():
         return False
 
 
+class SphereCache:
+    """
+    Logical spheres of a filled multiworld with a copy of the state before each sphere, computed on first use and
+    shared by get_sendable_spheres, fulfills_accessibility and Spoiler.create_playthrough, which may run in threads.
+    Reachable events are collected before each sphere, so only multiserver sendable locations form spheres.
+    """
+    multiworld: MultiWorld
+    events: List[Set[Location]]
+    """event locations collected before each sphere"""
+    spheres: List[Set[Location]]
+    """sendable locations collected in each sphere"""
+    states: List[CollectionState]
+    """copies of the state before each sphere, followed by the state with everything reachable collected"""
+    unreachable: Set[Location]
+    """filled locations that can't be reached"""
+    _lock: threading.Lock
+    _computed: bool
+
+    def __init__(self, multiworld: MultiWorld) -> None:
+        self.multiworld = multiworld
+        self.events = []
+        self.spheres = []
+        self.states = []
+        self.unreachable = set()
+        self._lock = threading.Lock()
+        self._computed = False
+
+    def compute(self) -> None:
+        with self._lock:
+            if self._computed:
+                return
+            state = CollectionState(self.multiworld)
+            locations: Set[Location] = set()
+            events: Set[Location] = set()
+            for location in self.multiworld.get_filled_locations():
+                if type(location.item.code) is int and type(location.address) is int:
+                    locations.add(location)
+                else:
+                    events.add(location)
+
+            while True:
+                self.states.append(state.copy())
+                # cull events out
+                collected_events: Set[Location] = set()
+                done_events: Set[Union[Location, None]] = {None}
+                while done_events:
+                    done_events = {event for event in events if event.can_reach(state)}
+                    for event in done_events:
+                        state.collect(event.item, True, event)
+                    events -= done_events
+                    collected_events |= done_events
+
+                sphere = {location for location in locations if location.can_reach(state)}
+                if not sphere and not collected_events:
+                    break
+                self.events.append(collected_events)
+                self.spheres.append(sphere)
+                for location in sphere:
+                    state.collect(location.item, True, location)
+                locations -= sphere
+
+            self.unreachable = locations | events
+            self._computed = True
+
+    def get_sendable_spheres(self) -> Iterator[Set[Location]]:
+        """see MultiWorld.get_sendable_spheres"""
+        self.compute()
+        for sphere in self.spheres:
+            if sphere:
+                yield sphere
+        unreachable = {location for location in self.unreachable
+                       if type(location.item.code) is int and type(location.address) is int}
+        if unreachable:
+            yield set()
+            yield unreachable
+
+    def fulfills_accessibility(self) -> bool:
+        """Check if accessibility rules are fulfilled from the multiworld's starting state."""
+        self.compute()
+        multiworld = self.multiworld
+        state = self.states[-1].copy()
+        full_players = {player for player, world in multiworld.worlds.items()
+                        if world.options.accessibility.current_key == "full"}
+        minimal_players = {player for player, world in multiworld.worlds.items()
+                           if world.options.accessibility.current_key == "minimal"}
+
+        missing = [location for location in multiworld.get_locations()
+                   if (location.player in full_players or location.advancement)
+                   and (location in self.unreachable if location.item else not location.can_reach(state))]
+        if multiworld.has_beaten_game(state) and not any(
+                location.player in full_players or (location.item and location.item.player not in minimal_players)
+                for location in missing):
+            return True
+        if missing:
+            if __debug__:
+                from Fill import FillError
+                raise FillError(f"Could not access required locations for accessibility check. Missing: {missing}",
+                                multiworld=multiworld)
+            logging.warning(f"Could not access required locations for accessibility check. Missing: {missing}")
+        return False
+
+
 PathValue = Tuple[str, Optional["PathValue"]]
 
 
+class _RuleReads:
+    """Item names and Regions of one player read by an Entrance's traversal condition during an evaluation."""
+    __slots__ = ("player", "items", "regions", "analyzable")
+
+    player: int
+    items: Set[str]
+    regions: Set[Region]
+    analyzable: bool
+
+    def __init__(self, player: int) -> None:
+        self.player = player
+        self.items = set()
+        self.regions = set()
+        self.analyzable = True
+
+    def clear(self) -> None:
+        self.items.clear()
+        self.regions.clear()
+        self.analyzable = True
+
+
+class _RecordingView:
+    """Wraps one player's prog_items Counter or reachable_regions set while a rule is evaluated.
+    Lookups by key are recorded, any other kind of access marks the rule as not analyzable."""
+    __slots__ = ("_wrapped", "_record", "_reads")
+
+    def __init__(self, wrapped: Any, record: Set[Any], reads: _RuleReads) -> None:
+        self._wrapped = wrapped
+        self._record = record
+        self._reads = reads
+
+    def __getitem__(self, key: Any) -> Any:
+        self._record.add(key)
+        return self._wrapped[key]
+
+    def __contains__(self, key: Any) -> bool:
+        self._record.add(key)
+        return key in self._wrapped
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._record.add(key)
+        return self._wrapped.get(key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._reads.analyzable = False
+        self._wrapped[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        self._reads.analyzable = False
+        del self._wrapped[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        self._reads.analyzable = False
+        return iter(self._wrapped)
+
+    def __len__(self) -> int:
+        self._reads.analyzable = False
+        return len(self._wrapped)
+
+    def __getattr__(self, name: str) -> Any:
+        self._reads.analyzable = False
+        return getattr(self._wrapped, name)
+
+
+class _RecordingMapping(_RecordingView):
+    """Stands in for CollectionState.prog_items or CollectionState.reachable_regions while a rule is evaluated.
+    Only the evaluated Entrance's player can be recorded, touching any other player is not analyzable."""
+    __slots__ = ("_player_view",)
+
+    def __init__(self, wrapped: Dict[int, Any], record: Set[Any], reads: _RuleReads) -> None:
+        super().__init__(wrapped, record, reads)
+        self._player_view = _RecordingView(wrapped[reads.player], record, reads)
+
+    def __getitem__(self, player: int) -> Any:
+        if player == self._reads.player:
+            return self._player_view
+        self._reads.analyzable = False
+        return self._wrapped[player]
+
+    def __contains__(self, player: int) -> bool:
+        return player in self._wrapped
+
+    def get(self, player: int, default: Any = None) -> Any:
+        return self[player] if player in self._wrapped else default
+
+
+class _RuleRecorder:
+    """Evaluates one player's Entrances on a CollectionState, recording what their traversal conditions read.
+    Region reads are only needed to find indirect conditions, so worlds that register them explicitly skip them."""
+    __slots__ = ("state", "dependencies", "reads", "prog_items", "reachable_regions")
+
+    def __init__(self, state: CollectionState, player: int, dependencies: EntranceDependencies,
+                 record_regions: bool) -> None:
+        self.state = state
+        self.dependencies = dependencies
+        self.reads = _RuleReads(player)
+        self.prog_items = _RecordingMapping(state.prog_items, self.reads.items, self.reads)
+        self.reachable_regions = _RecordingMapping(state.reachable_regions, self.reads.regions, self.reads) \
+            if record_regions else None
+
+    def can_reach(self, connection: Entrance) -> bool:
+        state = self.state
+        if connection.can_reach(state):
+            return True
+        # only blocked Entrances need their dependencies, so record them by evaluating the rule again
+        prog_items, reachable_regions = state.prog_items, state.reachable_regions
+        state.prog_items = self.prog_items
+        if self.reachable_regions:
+            state.reachable_regions = self.reachable_regions
+        try:
+            reachable = connection.can_reach(state)
+        finally:
+            state.prog_items, state.reachable_regions = prog_items, reachable_regions
+        self.dependencies.record(connection, self.reads)
+        self.reads.clear()
+        return reachable
+
+
+class EntranceDependencies:
+    """
+    Item names and Regions each Entrance's traversal condition has been seen reading, shared by all CollectionStates
+    of a MultiWorld. CollectionState.update_reachable_regions uses it to only retry blocked Entrances that could have
+    changed since the last update, instead of every blocked Entrance.
+
+    Dependencies accumulate over every recorded evaluation of a rule, so they are a superset of what any single
+    evaluation read. Rules that read anything but their own player's prog_items by name and Regions by membership are
+    not analyzable and are always retried, as are rules that were replaced since they were recorded.
+
+    Once frozen, nothing is recorded anymore and every CollectionState updates reachability in full, as it did without
+    dependencies, so states can be used from multiple threads.
+    """
+    rules: Dict[Entrance, Callable[[CollectionState], bool]]
+    """rule each analyzed Entrance had when its dependencies were recorded"""
+    opaque_rules: Dict[Entrance, Callable[[CollectionState], bool]]
+    """rule each Entrance had when it was found not analyzable"""
+    item_dependents: Dict[int, Dict[str, Set[Entrance]]]
+    region_dependents: Dict[Region, Set[Entrance]]
+    known_reads: Dict[Entrance, Tuple[Set[str], Set[Region]]]
+    default_collect: Optional[Callable[["AutoWorld.World", CollectionState, Item], bool]]
+    frozen: bool
+
+    def __init__(self) -> None:
+        self.rules = {}
+        self.opaque_rules = {}
+        self.item_dependents = {}
+        self.region_dependents = {}
+        self.known_reads = {}
+        self.default_collect = None
+        self.frozen = False
+
+    def freeze(self) -> None:
+        """Stops using and recording dependencies, for when CollectionStates are about to be used from multiple
+        threads, which would otherwise read and write them concurrently."""
+        self.frozen = True
+
+    def tracks(self, world: "AutoWorld.World") -> bool:
+        """Whether a world's collected items are fully described by the item names added to its prog_items.
+        Worlds that extend collect may change other counters or custom state, so they always use a full update."""
+        if self.default_collect is None:
+            from worlds.AutoWorld import World
+            self.default_collect = World.collect
+        return getattr(world.collect, "__func__", None) is self.default_collect
+
+    def record(self, entrance: Entrance, reads: _RuleReads) -> None:
+        rule = entrance.access_rule
+        if not reads.analyzable:
+            self.rules.pop(entrance, None)
+            self.opaque_rules[entrance] = rule
+            return
+        known = self.known_reads.get(entrance, None)
+        if known is None:
+            known = self.known_reads[entrance] = (set(), set())
+        elif self.rules.get(entrance, None) is not rule and self.opaque_rules.get(entrance, None) is rule:
+            return
+        known_items, known_regions = known
+        if not known_items.issuperset(reads.items):
+            item_dependents = self.item_dependents.setdefault(entrance.player, {})
+            for item in reads.items - known_items:
+                item_dependents.setdefault(item, set()).add(entrance)
+            known_items |= reads.items
+        if not known_regions.issuperset(reads.regions):
+            for region in reads.regions - known_regions:
+                self.region_dependents.setdefault(region, set()).add(entrance)
+            known_regions |= reads.regions
+        self.rules[entrance] = rule
+
+    def retry(self, player: int, items: Iterable[str], regions: Iterable[Region],
+              blocked_connections: Set[Entrance]) -> List[Entrance]:
+        """Returns the blocked Entrances that have to be re-evaluated after items changed and regions became
+        reachable."""
+        touched: Set[Entrance] = set()
+        item_dependents = self.item_dependents.get(player, {})
+        for item in items:
+            touched.update(item_dependents.get(item, ()))
+        for region in regions:
+            touched.update(self.region_dependents.get(region, ()))
+        rules = self.rules
+        return [connection for connection in blocked_connections
+                if connection in touched or rules.get(connection, None) is not connection.access_rule]
+
+
+def _mark_stale(stale: Dict[int, Union[bool, Set[str], None]], player: int, item: Optional[str]) -> None:
+    """Records in a CollectionState's stale that the count of an item name changed, or of anything if item is None."""
+    changes = stale[player]
+    if changes is False:
+        stale[player] = True if item is None else {item}
+    elif changes is not True and changes is not None:
+        if item is None:
+            stale[player] = True
+        else:
+            changes.add(item)
+
+
+class _ProgItems(Counter):
+    """
+    One player's prog_items Counter of a CollectionState, for players whose changes are tracked by item name, see
+    EntranceDependencies.tracks. Writes that don't go through CollectionState.add_item, remove_item or set_item, like
+    worlds or tests setting counts directly, mark the item as changed, so reachability gets rechecked for it.
+    """
+    stale: Optional[Dict[int, Union[bool, Set[str], None]]] = None
+    """stale of the CollectionState this Counter belongs to, None while it doesn't belong to one yet"""
+    player: int = 0
+
+    def bind(self, stale: Dict[int, Union[bool, Set[str], None]], player: int) -> _ProgItems:
+        self.stale = stale
+        self.player = player
+        return self
+
+    def __setitem__(self, item: str, count: int) -> None:
+        super().__setitem__(item, count)
+        if self.stale is not None:
+            _mark_stale(self.stale, self.player, item)
+
+    def __delitem__(self, item: str) -> None:
+        super().__delitem__(item)
+        if self.stale is not None:
+            _mark_stale(self.stale, self.player, item)
+
+    def pop(self, item: str, *default: int) -> int:
+        count = super().pop(item, *default)
+        if self.stale is not None:
+            _mark_stale(self.stale, self.player, item)
+        return count
+
+    def popitem(self) -> Tuple[str, int]:
+        item, count = super().popitem()
+        if self.stale is not None:
+            _mark_stale(self.stale, self.player, item)
+        return item, count
+
+    def setdefault(self, item: str, default: int = 0) -> int:
+        if item not in self and self.stale is not None:
+            _mark_stale(self.stale, self.player, item)
+        return super().setdefault(item, default)
+
+    def copy(self) -> _ProgItems:
+        """Returns an unbound copy, for the state it gets bound to."""
+        ret = _ProgItems.__new__(_ProgItems)
+        dict.update(ret, self)
+        return ret
+
+    def update(self, iterable: Any = None, /, **kwargs: int) -> None:
+        # Counter.update skips __setitem__ while empty
+        super().update(iterable, **kwargs)
+        if self.stale is not None:
+            _mark_stale(self.stale, self.player, None)
+
+    def clear(self) -> None:
+        super().clear()
+        if self.stale is not None:
+            _mark_stale(self.stale, self.player, None)
+
+
+class _Snapshot:
+    """One player's data at the time a CollectionState was copied, read by the states sharing it."""
+    __slots__ = ("data", "shared")
+
+    data: Any
+    shared: bool
+    """whether more than one view was created for the data, otherwise the view's state can take it over"""
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+        self.shared = False
+
+
+class _SharedView:
+    """
+    Stands in for one player's prog_items Counter or reachable_regions/blocked_connections set of a copied
+    CollectionState. Reads use the data shared with the other copies, while the first write gives the view a container
+    only its state uses, so states never copy the data of players they don't modify. The CollectionState methods that
+    modify a player replace the view with that container, see _writable.
+    """
+    __slots__ = ("_data", "_snapshot")
+
+    mutators: ClassVar[AbstractSet[str]] = frozenset({
+        "update", "subtract", "clear", "pop", "popitem", "setdefault", "add", "remove", "discard",
+        "difference_update", "intersection_update", "symmetric_difference_update",
+    })
+
+    def __init__(self, snapshot: _Snapshot) -> None:
+        self._data = snapshot.data
+        self._snapshot: Optional[_Snapshot] = snapshot
+
+    def own(self) -> Any:
+        """Returns the container of this view's state, which is taken over from the snapshot or copied from it."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self._data
+        data = snapshot.data.copy() if snapshot.shared else snapshot.data
+        self._snapshot = None
+        self._data = data
+        return data
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        return self._data == (other._data if isinstance(other, _SharedView) else other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def __reduce__(self):
+        return self._data.__reduce__()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _SharedView.mutators:
+            return getattr(self.own(), name)
+        return getattr(self._data, name)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.own()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self.own()[key]
+
+    def __iadd__(self, other: Any) -> Any:
+        data = self.own()
+        data += other
+        return data
+
+    def __isub__(self, other: Any) -> Any:
+        data = self.own()
+        data -= other
+        return data
+
+    def __ior__(self, other: Any) -> Any:
+        data = self.own()
+        data |= other
+        return data
+
+    def __iand__(self, other: Any) -> Any:
+        data = self.own()
+        data &= other
+        return data
+
+    def __add__(self, other: Any) -> Any:
+        return self._data + other
+
+    def __sub__(self, other: Any) -> Any:
+        return self._data - other
+
+    def __or__(self, other: Any) -> Any:
+        return self._data | other
+
+    def __and__(self, other: Any) -> Any:
+        return self._data & other
+
+    def __le__(self, other: Any) -> bool:
+        return self._data <= other
+
+    def __ge__(self, other: Any) -> bool:
+        return self._data >= other
+
+
+class _SharedProgItems(_SharedView):
+    """A _SharedView of a _ProgItems, which binds the container it owns to its state."""
+    __slots__ = ("_stale", "_player")
+
+    def __init__(self, snapshot: _Snapshot, stale: Dict[int, Union[bool, Set[str], None]], player: int) -> None:
+        super().__init__(snapshot)
+        self._stale = stale
+        self._player = player
+
+    def own(self) -> _ProgItems:
+        if self._snapshot is None:
+            return self._data
+        return super().own().bind(self._stale, self._player)
+
+
+def _shared_copy(data: Dict[int, Any], stale: Optional[Dict[int, Union[bool, Set[str], None]]] = None) \
+        -> Dict[int, Any]:
+    """
+    Copies a CollectionState's per player containers, sharing each player's data until it is written to.
+
+    :param stale: stale of the new CollectionState, to bind the _ProgItems of the copy to
+    """
+    ret: Dict[int, Any] = {}
+    for player, value in data.items():
+        if isinstance(value, _SharedView) and value._snapshot:
+            snapshot = value._snapshot
+            snapshot.shared = True
+        else:
+            snapshot = _Snapshot(value.copy())
+        if stale is not None and type(snapshot.data) is _ProgItems:
+            ret[player] = _SharedProgItems(snapshot, stale, player)
+        else:
+            ret[player] = _SharedView(snapshot)
+    return ret
+
+
+def _writable(data: Dict[int, Any], player: int) -> Any:
+    """Returns a player's container of a CollectionState, making sure it isn't shared with another state."""
+    value = data[player]
+    if isinstance(value, _SharedView):
+        value = data[player] = value.own()
+    return value
+
+
 class CollectionState():
     prog_items: Dict[int, Counter[str]]
     multiworld: MultiWorld
@@ -755,21 +1259,26 @@ class CollectionState():
     advancements: Set[Location]
     path: Dict[Union[Region, Entrance], PathValue]
     locations_checked: Set[Location]
-    stale: Dict[int, bool]
+    stale: Dict[int, Union[bool, Set[str], None]]
+    """False if reachability is up to date, otherwise the item names that changed since the last update,
+    or True if everything has to be rechecked. None while it is being updated, so writes of rules are ignored."""
     allow_partial_entrances: bool
     additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
     additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
 
     def __init__(self, parent: MultiWorld, allow_partial_entrances: bool = False):
         assert parent.worlds, "CollectionState created without worlds initialized in parent"
-        self.prog_items = {player: Counter() for player in parent.get_all_ids()}
+        self.stale = {player: True for player in parent.get_all_ids()}
+        dependencies = parent.entrance_dependencies
+        self.prog_items = {player: _ProgItems().bind(self.stale, player)
+                           if dependencies.tracks(parent.worlds[player]) else Counter()
+                           for player in parent.get_all_ids()}
         self.multiworld = parent
         self.reachable_regions = {player: set() for player in parent.get_all_ids()}
         self.blocked_connections = {player: set() for player in parent.get_all_ids()}
         self.advancements = set()
         self.path = {}
         self.locations_checked = set()
-        self.stale = {player: True for player in parent.get_all_ids()}
         self.allow_partial_entrances = allow_partial_entrances
         for function in self.additional_init_functions:
             function(self, parent)
@@ -778,24 +1287,43 @@ class CollectionState():
                 self.collect(item, True)
 
     def update_reachable_regions(self, player: int):
-        self.stale[player] = False
+        changes = self.stale[player]
+        self.stale[player] = None
+        try:
+            self._update_reachable_regions(player, changes)
+        finally:
+            if self.stale[player] is None:
+                self.stale[player] = False
+
+    def _update_reachable_regions(self, player: int, changes: Union[bool, Set[str]]) -> None:
         world: AutoWorld.World = self.multiworld.worlds[player]
-        reachable_regions = self.reachable_regions[player]
-        queue = deque(self.blocked_connections[player])
+        reachable_regions = _writable(self.reachable_regions, player)
+        blocked_connections = _writable(self.blocked_connections, player)
         start: Region = world.get_region(world.origin_region_name)
+        dependencies: EntranceDependencies = self.multiworld.entrance_dependencies
+        recorder: Optional[_RuleRecorder] = None
+        if not dependencies.frozen and dependencies.tracks(world):
+            recorder = _RuleRecorder(self, player, dependencies, not world.explicit_indirect_conditions)
+
+        # only retry what the changed items can affect, unless everything has to be rechecked
+        if recorder and isinstance(changes, set) and start in reachable_regions:
+            queue = deque(dependencies.retry(player, changes, (), blocked_connections))
+        else:
+            queue = deque(blocked_connections)
 
         # init on first call - this can't be done on construction since the regions don't exist yet
         if start not in reachable_regions:
             reachable_regions.add(start)
-            self.blocked_connections[player].update(start.exits)
+            blocked_connections.update(start.exits)
             queue.extend(start.exits)
 
         if world.explicit_indirect_conditions:
-            self._update_reachable_regions_explicit_indirect_conditions(player, queue)
+            self._update_reachable_regions_explicit_indirect_conditions(player, queue, recorder)
         else:
-            self._update_reachable_regions_auto_indirect_conditions(player, queue)
+            self._update_reachable_regions_auto_indirect_conditions(player, queue, recorder)
 
-    def _update_reachable_regions_explicit_indirect_conditions(self, player: int, queue: deque):
+    def _update_reachable_regions_explicit_indirect_conditions(self, player: int, queue: deque,
+                                                               recorder: Optional[_RuleRecorder] = None):
         reachable_regions = self.reachable_regions[player]
         blocked_connections = self.blocked_connections[player]
         # run BFS on all connections, and keep track of those blocked by missing items
@@ -804,7 +1332,7 @@ class CollectionState():
             new_region = connection.connected_region
             if new_region in reachable_regions:
                 blocked_connections.remove(connection)
-            elif connection.can_reach(self):
+            elif recorder.can_reach(connection) if recorder else connection.can_reach(self):
                 if self.allow_partial_entrances and not new_region:
                     continue
                 assert new_region, f"tried to search through an Entrance \"{connection}\" with no connected Region"
@@ -819,19 +1347,21 @@ class CollectionState():
                     if new_entrance in blocked_connections and new_entrance not in queue:
                         queue.append(new_entrance)
 
-    def _update_reachable_regions_auto_indirect_conditions(self, player: int, queue: deque):
+    def _update_reachable_regions_auto_indirect_conditions(self, player: int, queue: deque,
+                                                           recorder: Optional[_RuleRecorder] = None):
         reachable_regions = self.reachable_regions[player]
         blocked_connections = self.blocked_connections[player]
         new_connection: bool = True
         # run BFS on all connections, and keep track of those blocked by missing items
         while new_connection:
             new_connection = False
+            new_regions: List[Region] = []
             while queue:
                 connection = queue.popleft()
                 new_region = connection.connected_region
                 if new_region in reachable_regions:
                     blocked_connections.remove(connection)
-                elif connection.can_reach(self):
+                elif recorder.can_reach(connection) if recorder else connection.can_reach(self):
                     if self.allow_partial_entrances and not new_region:
                         continue
                     assert new_region, f"tried to search through an Entrance \"{connection}\" with no connected Region"
@@ -840,21 +1370,30 @@ class CollectionState():
                     blocked_connections.update(new_region.exits)
                     queue.extend(new_region.exits)
                     self.path[new_region] = (new_region.name, self.path.get(connection, None))
+                    new_regions.append(new_region)
                     new_connection = True
             # sweep for indirect connections, mostly Entrance.can_reach(unrelated_Region)
-            queue.extend(blocked_connections)
+            if recorder is None:
+                queue.extend(blocked_connections)
+            elif new_connection:
+                queue.extend(recorder.dependencies.retry(player, (), new_regions, blocked_connections))
 
     def copy(self) -> CollectionState:
-        ret = CollectionState(self.multiworld)
-        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
-        ret.reachable_regions = {player: region_set.copy() for player, region_set in
-                                 self.reachable_regions.items()}
-        ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
-                                   self.blocked_connections.items()}
+        # skip __init__, the precollected items are already part of the copied data
+        ret = CollectionState.__new__(CollectionState)
+        ret.multiworld = self.multiworld
+        ret.stale = {player: changes.copy() if isinstance(changes, set) else changes
+                     for player, changes in self.stale.items()}
+        # per player data is shared until a state writes to that player, see _SharedView
+        ret.prog_items = _shared_copy(self.prog_items, ret.stale)
+        ret.reachable_regions = _shared_copy(self.reachable_regions)
+        ret.blocked_connections = _shared_copy(self.blocked_connections)
         ret.advancements = self.advancements.copy()
         ret.path = self.path.copy()
         ret.locations_checked = self.locations_checked.copy()
         ret.allow_partial_entrances = self.allow_partial_entrances
+        for function in self.additional_init_functions:
+            function(ret, self.multiworld)
         for function in self.additional_copy_functions:
             ret = function(self, ret)
         return ret
@@ -1029,9 +1568,12 @@ class CollectionState():
         if location:
             self.locations_checked.add(location)
 
-        changed = self.multiworld.worlds[item.player].collect(self, item)
+        world = self.multiworld.worlds[item.player]
+        changed = world.collect(self, item)
 
-        self.stale[item.player] = True
+        # tracked worlds report their changes through add_item
+        if not self.multiworld.entrance_dependencies.tracks(world):
+            self.stale[item.player] = True
 
         if changed and not prevent_sweep:
             self.sweep_for_advancements()
@@ -1047,7 +1589,10 @@ class CollectionState():
         :param count: How many of the item to add.
         """
         assert count > 0
-        self.prog_items[player][item] += count
+        prog_items = _writable(self.prog_items, player)
+        # dict methods skip the _ProgItems hooks, so the change is only marked once
+        dict.__setitem__(prog_items, item, prog_items[item] + count)
+        self._mark_changed(item, player)
 
     def remove(self, item: Item):
         changed = self.multiworld.worlds[item.player].remove(self, item)
@@ -1066,9 +1611,13 @@ class CollectionState():
         :param count: How many of the item to remove.
         """
         assert count > 0
-        self.prog_items[player][item] -= count
-        if self.prog_items[player][item] < 1:
-            del (self.prog_items[player][item])
+        prog_items = _writable(self.prog_items, player)
+        count = prog_items[item] - count
+        if count < 1:
+            dict.pop(prog_items, item, None)
+        else:
+            dict.__setitem__(prog_items, item, count)
+        self._mark_changed(item, player)
 
     def set_item(self, item: str, player: int, count: int) -> None:
         """
@@ -1079,10 +1628,16 @@ class CollectionState():
         :param count: How many of the item to now have.
         """
         assert count >= 0
+        prog_items = _writable(self.prog_items, player)
         if count == 0:
-            del (self.prog_items[player][item])
+            dict.pop(prog_items, item, None)
         else:
-            self.prog_items[player][item] = count
+            dict.__setitem__(prog_items, item, count)
+        self._mark_changed(item, player)
+
+    def _mark_changed(self, item: str, player: int) -> None:
+        """Records that the count of an item name changed, so reachability gets rechecked for it."""
+        _mark_stale(self.stale, player, item)
 
 
 class EntranceType(IntEnum):
@@ -1611,39 +2166,27 @@ class Spoiler:
         from itertools import chain
         # get locations containing progress items
         multiworld = self.multiworld
-        prog_locations = {location for location in multiworld.get_filled_locations() if location.item.advancement}
-        state_cache: List[Optional[CollectionState]] = [None]
-        collection_spheres: List[Set[Location]] = []
-        state = CollectionState(multiworld)
-        sphere_candidates = set(prog_locations)
         logging.debug('Building up collection spheres.')
-        while sphere_candidates:
-
-            # build up spheres of collection radius.
-            # Everything in each sphere is independent from each other in dependencies and only depends on lower spheres
-
-            sphere = {location for location in sphere_candidates if state.can_reach(location)}
-
-            for location in sphere:
-                state.collect(location.item, True, location)
-
-            sphere_candidates -= sphere
-            collection_spheres.append(sphere)
-            state_cache.append(state.copy())
-
-            logging.debug('Calculated sphere %i, containing %i of %i progress items.', len(collection_spheres),
-                          len(sphere),
-                          len(prog_locations))
-            if not sphere:
-                logging.debug('The following items could not be reached: %s', ['%s (Player %d) at %s (Player %d)' % (
-                    location.item.name, location.item.player, location.name, location.player) for location in
-                                                                               sphere_candidates])
-                if any([multiworld.worlds[location.item.player].options.accessibility != 'minimal' for location in sphere_candidates]):
-                    raise RuntimeError(f'Not all progression items reachable ({sphere_candidates}). '
-                                       f'Something went terribly wrong here.')
-                else:
-                    self.unreachables = sphere_candidates
-                    break
+        sphere_cache = multiworld.sphere_cache or SphereCache(multiworld)
+        sphere_cache.compute()
+        # progress items of each sphere, including the events collected before it, with the state before it
+        state_cache: List[Optional[CollectionState]] = []
+        collection_spheres: List[Set[Location]] = []
+        for events, sphere, state in zip(sphere_cache.events, sphere_cache.spheres, sphere_cache.states):
+            sphere = {location for location in chain(events, sphere) if location.item.advancement}
+            if sphere:
+                collection_spheres.append(sphere)
+                state_cache.append(state)
+        sphere_candidates = {location for location in sphere_cache.unreachable if location.item.advancement}
+        if sphere_candidates:
+            logging.debug('The following items could not be reached: %s', ['%s (Player %d) at %s (Player %d)' % (
+                location.item.name, location.item.player, location.name, location.player) for location in
+                                                                           sphere_candidates])
+            if any([multiworld.worlds[location.item.player].options.accessibility != 'minimal' for location in sphere_candidates]):
+                raise RuntimeError(f'Not all progression items reachable ({sphere_candidates}). '
+                                   f'Something went terribly wrong here.')
+            else:
+                self.unreachables = sphere_candidates
 
         # in the second phase, we cull each sphere such that the game is still beatable,
         # reducing each range of influence to the bare minimum required inside it
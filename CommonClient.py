@@ -23,7 +23,8 @@ if __name__ == "__main__":
 
 from MultiServer import CommandProcessor
 from NetUtils import (Endpoint, decode, NetworkItem, encode, JSONtoTextParser, ClientStatus, Permission, NetworkSlot,
-                      RawJSONtoTextParser, add_json_text, add_json_location, add_json_item, JSONTypes, HintStatus, SlotType)
+                      RawJSONtoTextParser, add_json_text, add_json_location, add_json_item, JSONTypes, HintStatus, SlotType,
+                      PackedDataPackage, PackedNameToId)
 from Utils import Version, stream_input, async_start
 from worlds import network_data_package, AutoWorldRegister
 import os
@@ -236,11 +237,18 @@ class CommonContext:
 
             return self.lookup_in_game(code, self.ctx.slot_info[slot].game)
 
-        def update_game(self, game: str, name_to_id_lookup_table: typing.Dict[str, int]) -> None:
+        def update_game(self, game: str, name_to_id_lookup_table: typing.Mapping[str, int]) -> None:
             """Overrides existing lookup tables for a particular game."""
-            id_to_name_lookup_table = Utils.KeyedDefaultDict(self._unknown_item)
-            id_to_name_lookup_table.update({code: name for name, code in name_to_id_lookup_table.items()})
-            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table)
+            id_to_name_lookup_table: typing.Mapping[int, str]
+            if isinstance(name_to_id_lookup_table, PackedNameToId):
+                # packed tables are searched in place, only unknown ids end up in a dict
+                id_to_name_lookup_table = name_to_id_lookup_table.names
+                self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table,
+                                                              Utils.KeyedDefaultDict(self._unknown_item))
+            else:
+                id_to_name_lookup_table = Utils.KeyedDefaultDict(self._unknown_item)
+                id_to_name_lookup_table.update({code: name for name, code in name_to_id_lookup_table.items()})
+                self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table)
             if game == "Archipelago":
                 # Keep track of the Archipelago data package separately so if it gets updated in a custom datapackage,
                 # it updates in all chain maps automatically.
@@ -610,8 +618,12 @@ class CommonContext:
             # no action required if cached version is new enough
             if remote_checksum != cached_checksum:
                 local_checksum: typing.Optional[str] = network_data_package["games"].get(game, {}).get("checksum")
-                if remote_checksum == local_checksum:
+                packed_game = Utils.load_packed_data_package(game, remote_checksum)
+                if packed_game:
+                    self.update_game(packed_game, game)
+                elif remote_checksum == local_checksum:
                     self.update_game(network_data_package["games"][game], game)
+                    Utils.store_packed_data_package(game, network_data_package["games"][game])
                 else:
                     cached_game = Utils.load_data_package_for_checksum(game, remote_checksum)
                     cache_checksum: typing.Optional[str] = cached_game.get("checksum")
@@ -623,7 +635,12 @@ class CommonContext:
         if needed_updates:
             await self.send_msgs([{"cmd": "GetDataPackage", "games": [game_name]} for game_name in needed_updates])
 
-    def update_game(self, game_package: dict, game: str):
+    def update_game(self, game_package: typing.Union[dict, PackedDataPackage], game: str):
+        if isinstance(game_package, PackedDataPackage):
+            self.item_names.update_game(game, game_package.item_name_to_id)
+            self.location_names.update_game(game, game_package.location_name_to_id)
+            self.checksums[game] = game_package.checksum
+            return
         self.item_names.update_game(game, game_package["item_name_to_id"])
         self.location_names.update_game(game, game_package["location_name_to_id"])
         self.checksums[game] = game_package.get("checksum")
@@ -33,6 +33,57 @@ def sweep_from_pool(base_state: CollectionState, itempool: typing.Sequence[Item]
     return new_state
 
 
+class _LocationCandidates:
+    """
+    Unfilled locations of a fill step, in their original order and bucketed per player.
+    Reachability is cached per location until the next sweep, as it doesn't depend on the item being placed.
+    """
+    locations: typing.List[Location]
+    player_locations: typing.Dict[int, typing.List[Location]]
+    state: typing.Optional[CollectionState]
+    reachable: typing.Dict[Location, bool]
+
+    def __init__(self, locations: typing.List[Location], per_player: bool) -> None:
+        self.locations = locations
+        self.player_locations = {}
+        if per_player:
+            for location in locations:
+                self.player_locations.setdefault(location.player, []).append(location)
+        self.state = None
+        self.reachable = {}
+
+    def refresh(self, state: CollectionState) -> None:
+        """Sets the state of a new sweep to place items in."""
+        self.state = state
+        self.reachable = {}
+
+    def can_reach(self, location: Location) -> bool:
+        reachable = self.reachable.get(location)
+        if reachable is None:
+            reachable = self.reachable[location] = location.can_reach(self.state)
+        return reachable
+
+    def pop(self, item: Item, check_access: bool, single_player: bool) -> typing.Optional[Location]:
+        """Removes and returns the first location that can be filled with item, if any."""
+        state = self.state
+        if single_player:
+            candidates = self.player_locations.get(item.player, [])
+        else:
+            candidates = self.locations
+        for i, location in enumerate(candidates):
+            # can_fill without access check first, to only check reachability of locations that accept the item,
+            # locations that always allow the item are fillable even if unreachable
+            if location.can_fill(state, item, False) \
+                    and (not check_access or self.can_reach(location)
+                         or (location.always_allow(state, item) and location.can_fill(state, item))):
+                # popping by index is faster than removing by content, skipping a scan for the element
+                del candidates[i]
+                if single_player:
+                    self.locations.remove(location)
+                return location
+        return None
+
+
 def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locations: typing.List[Location],
                      item_pool: typing.List[Item], single_player_placement: bool = False, lock: bool = False,
                      swap: bool = True, on_place: typing.Optional[typing.Callable[[Location], None]] = None,
@@ -59,6 +110,8 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
     for item in item_pool:
         reachable_items.setdefault(item.player, deque()).append(item)
 
+    candidates = _LocationCandidates(locations, single_player_placement)
+
     # for progress logging
     total = min(len(item_pool), len(locations))
     placed = 0
@@ -87,6 +140,7 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             if single_player_placement else None)
 
         has_beaten_game = multiworld.has_beaten_game(maximum_exploration_state)
+        candidates.refresh(maximum_exploration_state)
 
         while items_to_place:
             # if we have run out of locations to fill,break out of this loop
@@ -105,15 +159,8 @@ def fill_restrictive(multiworld: MultiWorld, base_state: CollectionState, locati
             else:
                 perform_access_check = True
 
-            for i, location in enumerate(locations):
-                if (not single_player_placement or location.player == item_to_place.player) \
-                        and location.can_fill(maximum_exploration_state, item_to_place, perform_access_check):
-                    # popping by index is faster than removing by content,
-                    spot_to_fill = locations.pop(i)
-                    # skipping a scan for the element
-                    break
-
-            else:
+            spot_to_fill = candidates.pop(item_to_place, perform_access_check, single_player_placement)
+            if spot_to_fill is None:
                 # we filled all reachable spots.
                 if swap:
                     # Keep a cache of previous safe swap states that might be usable to sweep from to produce the next
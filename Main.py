@@ -1,18 +1,25 @@
 import collections
 import concurrent.futures
+import dataclasses
+import io
+import itertools
 import logging
+import multiprocessing
 import os
 import pickle
+import random
 import tempfile
 import time
 import zipfile
 import zlib
+from collections.abc import Callable
 
 import worlds
-from BaseClasses import CollectionState, Item, Location, LocationProgressType, MultiWorld
+from BaseClasses import CollectionState, Entrance, Item, Location, LocationProgressType, MultiWorld, Region, \
+    SphereCache
 from Fill import FillError, balance_multiworld_progression, distribute_items_restrictive, flood_items, \
     parse_planned_blocks, distribute_planned_blocks, resolve_early_locations_for_planned
-from NetUtils import convert_to_base_types
+from NetUtils import convert_to_base_types, write_multidata_sections
 from Options import StartInventoryPool
 from Utils import __version__, output_path, version_tuple
 from settings import get_settings
@@ -67,46 +74,34 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     if not args.skip_output and not args.spoiler_only:
         AutoWorld.call_stage(multiworld, "assert_generate")
 
-    AutoWorld.call_all(multiworld, "generate_early")
+    processes = isolated_generation_processes(get_settings().generator.world_generation_processes)
+    isolated_items: IsolatedItems = {}
+
+    generate_isolated_step(multiworld, "generate_early", processes, isolated_items)
+    AutoWorld.call_all(multiworld, "generate_early", isolated_items=isolated_items)
 
     logger.info('')
 
     for player in multiworld.player_ids:
-        for item_name, count in multiworld.worlds[player].options.start_inventory.value.items():
-            for _ in range(count):
-                multiworld.push_precollected(multiworld.create_item(item_name, player))
-
-        for item_name, count in getattr(multiworld.worlds[player].options,
-                                        "start_inventory_from_pool",
-                                        StartInventoryPool({})).value.items():
-            for _ in range(count):
-                multiworld.push_precollected(multiworld.create_item(item_name, player))
-            # remove from_pool items also from early items handling, as starting is plenty early.
-            early = multiworld.early_items[player].get(item_name, 0)
-            if early:
-                multiworld.early_items[player][item_name] = max(0, early-count)
-                remaining_count = count-early
-                if remaining_count > 0:
-                    local_early = multiworld.local_early_items[player].get(item_name, 0)
-                    if local_early:
-                        multiworld.early_items[player][item_name] = max(0, local_early - remaining_count)
-                    del local_early
-            del early
+        if "generate_early" not in isolated_items.get(player, {}):
+            push_start_inventory(multiworld, player)
 
     logger.info('Creating MultiWorld.')
-    AutoWorld.call_all(multiworld, "create_regions")
+    generate_isolated_step(multiworld, "create_regions", processes, isolated_items)
+    AutoWorld.call_all(multiworld, "create_regions", isolated_items=isolated_items)
 
     logger.info('Creating Items.')
-    AutoWorld.call_all(multiworld, "create_items")
+    generate_isolated_step(multiworld, "create_items", processes, isolated_items)
+    AutoWorld.call_all(multiworld, "create_items", isolated_items=isolated_items)
 
     logger.info('Calculating Access Rules.')
 
     for player in multiworld.player_ids:
-        # items can't be both local and non-local, prefer local
-        multiworld.worlds[player].options.non_local_items.value -= multiworld.worlds[player].options.local_items.value
-        multiworld.worlds[player].options.non_local_items.value -= set(multiworld.local_early_items[player])
+        if "create_items" not in isolated_items.get(player, {}):
+            resolve_item_locality(multiworld, player)
 
-    AutoWorld.call_all(multiworld, "set_rules")
+    generate_isolated_step(multiworld, "set_rules", processes, isolated_items)
+    AutoWorld.call_all(multiworld, "set_rules", isolated_items=isolated_items)
 
     for player in multiworld.player_ids:
         exclusion_rules(multiworld, player, multiworld.worlds[player].options.exclude_locations.value)
@@ -202,6 +197,10 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
 
     # we're about to output using multithreading, so we're removing the global random state to prevent accidental use
     multiworld.random.passthrough = False
+    # placements are final, so accessibility check, multidata and spoiler can share the logical spheres
+    multiworld.sphere_cache = SphereCache(multiworld)
+    # states are used from multiple threads from here on, which mustn't record entrance dependencies concurrently
+    multiworld.entrance_dependencies.freeze()
 
     if args.skip_output:
         logger.info('Done. Skipped output/spoiler generation. Total Time: %s', time.perf_counter() - start)
@@ -338,11 +337,12 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
                 for key in ("slot_data", "er_hint_data"):
                     multidata[key] = convert_to_base_types(multidata[key])
 
-                multidata = zlib.compress(pickle.dumps(multidata), 9)
-
                 with open(os.path.join(temp_dir, f'{outfilebase}.archipelago'), 'wb') as f:
-                    f.write(bytes([3]))  # version of format
-                    f.write(multidata)
+                    if get_settings().generator.multidata_format >= 4:
+                        write_multidata_sections(f, multidata)
+                    else:
+                        f.write(bytes([3]))  # version of format
+                        f.write(zlib.compress(pickle.dumps(multidata), 9))
 
             output_file_futures.append(pool.submit(write_multidata))
             if not check_accessibility_task.result():
@@ -373,3 +373,306 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
 
     logger.info('Done. Enjoy. Total Time: %s', time.perf_counter() - start)
     return multiworld
+
+
+def push_start_inventory(multiworld: MultiWorld, player: int) -> None:
+    for item_name, count in multiworld.worlds[player].options.start_inventory.value.items():
+        for _ in range(count):
+            multiworld.push_precollected(multiworld.create_item(item_name, player))
+
+    for item_name, count in getattr(multiworld.worlds[player].options,
+                                    "start_inventory_from_pool",
+                                    StartInventoryPool({})).value.items():
+        for _ in range(count):
+            multiworld.push_precollected(multiworld.create_item(item_name, player))
+        # remove from_pool items also from early items handling, as starting is plenty early.
+        early = multiworld.early_items[player].get(item_name, 0)
+        if early:
+            multiworld.early_items[player][item_name] = max(0, early-count)
+            remaining_count = count-early
+            if remaining_count > 0:
+                local_early = multiworld.local_early_items[player].get(item_name, 0)
+                if local_early:
+                    multiworld.early_items[player][item_name] = max(0, local_early - remaining_count)
+                del local_early
+        del early
+
+
+def resolve_item_locality(multiworld: MultiWorld, player: int) -> None:
+    # items can't be both local and non-local, prefer local
+    multiworld.worlds[player].options.non_local_items.value -= multiworld.worlds[player].options.local_items.value
+    multiworld.worlds[player].options.non_local_items.value -= set(multiworld.local_early_items[player])
+
+
+isolated_steps = ("generate_early", "create_regions", "create_items", "set_rules")
+"""generation steps that worlds with isolated_generation can run in separate processes"""
+
+IsolatedItems = dict[int, dict[str, list[Item]]]
+"""items each world added to the itempool in the steps it ran in a separate process, by player and step"""
+
+
+def can_isolate(world: AutoWorld.World) -> bool:
+    return world.isolated_generation and not any(getattr(type(world), f"stage_{step}", None)
+                                                 for step in isolated_steps)
+
+
+def run_isolated_step(multiworld: MultiWorld, player: int, step: str) -> None:
+    """Runs one isolated step of one player, followed by the generator's own per player work after that step."""
+    AutoWorld.call_single(multiworld, step, player)
+    if step == "generate_early":
+        push_start_inventory(multiworld, player)
+    elif step == "create_items":
+        resolve_item_locality(multiworld, player)
+
+
+@dataclasses.dataclass
+class IsolatedWorldResult:
+    """
+    The data of one world after it ran a generation step in a separate process, which is everything the step may
+    change. Applying it to the multiworld of the main process takes the place of running the step there.
+    """
+    attributes: dict[str, object]
+    """instance attributes of the World, besides its multiworld and random"""
+    random_state: tuple
+    items: list[Item]
+    """items added to the itempool by the step"""
+    precollected_items: list[Item]
+    early_items: dict[str, int]
+    local_early_items: dict[str, int]
+    completion_condition: Callable[[CollectionState], bool] | None
+    """None if the step didn't replace it"""
+    region_cache: dict[str, Region]
+    entrance_cache: dict[str, Entrance]
+    location_cache: dict[str, Location]
+    indirect_connections: dict[Region, set[Entrance]]
+
+    @classmethod
+    def from_multiworld(cls, multiworld: MultiWorld, player: int, items: list[Item],
+                        completion_condition: Callable[[CollectionState], bool] | None) -> "IsolatedWorldResult":
+        world = multiworld.worlds[player]
+        return cls({name: value for name, value in vars(world).items() if name not in ("multiworld", "random")},
+                   world.random.getstate(), items, multiworld.precollected_items[player],
+                   multiworld.early_items[player], multiworld.local_early_items[player], completion_condition,
+                   multiworld.regions.region_cache[player], multiworld.regions.entrance_cache[player],
+                   multiworld.regions.location_cache[player],
+                   {region: entrances for region, entrances in multiworld.indirect_connections.items()
+                    if region.player == player})
+
+    def apply(self, multiworld: MultiWorld, player: int) -> None:
+        world = multiworld.worlds[player]
+        for name in [name for name in vars(world) if name not in self.attributes]:
+            if name not in ("multiworld", "random"):
+                delattr(world, name)
+        vars(world).update(self.attributes)
+        world.random.setstate(self.random_state)
+        known_items = {id(item) for item in multiworld.precollected_items[player]}
+        multiworld.precollected_items[player] = self.precollected_items
+        multiworld.early_items[player] = self.early_items
+        multiworld.local_early_items[player] = self.local_early_items
+        if self.completion_condition:
+            multiworld.completion_condition[player] = self.completion_condition
+        multiworld.regions.region_cache[player] = self.region_cache
+        multiworld.regions.entrance_cache[player] = self.entrance_cache
+        multiworld.regions.location_cache[player] = self.location_cache
+        for region in [region for region in multiworld.indirect_connections if region.player == player]:
+            del multiworld.indirect_connections[region]
+        multiworld.indirect_connections.update(self.indirect_connections)
+
+        # the player's regions were replaced and the state changes of the worker were discarded
+        state = multiworld.state
+        state.reachable_regions[player] = set()
+        state.blocked_connections[player] = set()
+        state.stale[player] = True
+        for item in self.precollected_items:
+            if id(item) not in known_items:
+                state.collect(item, True)
+
+
+class _IsolatedWorldPickler(pickle.Pickler):
+    """
+    Pickles the result of one world, referencing the multiworld, the Worlds and the items that existed before the step
+    instead of copying them. Anything that can't be pickled, like lambdas, makes the step run in the main process.
+    """
+    multiworld: MultiWorld
+    known_items: dict[int, int]
+
+    def __init__(self, file: io.BytesIO, multiworld: MultiWorld, known_items: list[Item]) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.multiworld = multiworld
+        self.known_items = {id(item): index for index, item in enumerate(known_items)}
+
+    def persistent_id(self, obj: object) -> object:
+        if obj is self.multiworld:
+            return "multiworld"
+        if obj is self.multiworld.state:
+            return "state"
+        if isinstance(obj, AutoWorld.World):
+            return "world", obj.player
+        if isinstance(obj, Item) and id(obj) in self.known_items:
+            return "item", self.known_items[id(obj)]
+        return None
+
+
+class _IsolatedWorldUnpickler(pickle.Unpickler):
+    multiworld: MultiWorld
+    known_items: list[Item]
+
+    def __init__(self, file: io.BytesIO, multiworld: MultiWorld, known_items: list[Item]) -> None:
+        super().__init__(file)
+        self.multiworld = multiworld
+        self.known_items = known_items
+
+    def persistent_load(self, pid: object) -> object:
+        if pid == "multiworld":
+            return self.multiworld
+        if pid == "state":
+            return self.multiworld.state
+        kind, key = pid
+        if kind == "world":
+            return self.multiworld.worlds[key]
+        return self.known_items[key]
+
+
+def _fingerprint(value: object, depth: int = 1) -> object:
+    """
+    Identifies a value and its size, the identity of its elements or the state of its attributes, down to depth,
+    to notice it being replaced or changed.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, random.Random):
+        return id(value), hash(value.getstate())
+    if isinstance(value, dict):
+        return id(value), len(value), depth and tuple((_fingerprint(key, 0), _fingerprint(element, depth - 1))
+                                                      for key, element in value.items())
+    if isinstance(value, (list, tuple, collections.deque)):
+        return id(value), len(value), depth and tuple(_fingerprint(element, depth - 1) for element in value)
+    if isinstance(value, (set, frozenset)):
+        return id(value), len(value), depth and frozenset(_fingerprint(element, 0) for element in value)
+    if depth and hasattr(value, "__dict__"):
+        return id(value), tuple((name, _fingerprint(attribute, depth - 1)) for name, attribute in vars(value).items())
+    return id(value)
+
+
+_fingerprint_skipped = frozenset(("itempool", "indirect_connections", "state", "entrance_dependencies"))
+"""multiworld attributes that are fingerprinted separately or are caches that can change without affecting the result"""
+
+_isolated_entries = frozenset(("worlds", "per_slot_randoms", "precollected_items", "early_items", "local_early_items",
+                               "completion_condition", "region_cache", "entrance_cache", "location_cache"))
+"""per player data of the multiworld and its region manager that an isolated world's result replaces"""
+
+
+def _outside_fingerprint(multiworld: MultiWorld, player: int) -> list[object]:
+    """
+    Fingerprints the multiworld data that isn't part of player's IsolatedWorldResult, which isolated worlds must not
+    change, as it wouldn't be applied in the main process. This includes the class attributes of the player's World,
+    which are shared with other players of the same game. The itempool is checked separately, as it's shared by
+    everyone.
+    """
+    state = multiworld.state
+    fingerprint: list[object] = [
+        [(name, _fingerprint(value)) for name, value in vars(type(multiworld.worlds[player])).items()],
+        [(region, _fingerprint(entrances)) for region, entrances in multiworld.indirect_connections.items()
+         if region.player != player],
+        [(other, len(state.prog_items[other]), state.prog_items[other].total(), len(state.reachable_regions[other]))
+         for other in state.prog_items if other != player],
+        len(state.advancements), len(state.locations_checked),
+    ]
+    for owner in (multiworld, multiworld.regions):
+        for name, value in vars(owner).items():
+            if name in _fingerprint_skipped or name.startswith("__cache"):
+                continue
+            if isinstance(value, dict) and player in value:
+                fingerprint.append((name, [(other, _fingerprint(entry)) for other, entry in dict.items(value)
+                                           if other != player or name not in _isolated_entries]))
+            else:
+                fingerprint.append((name, _fingerprint(value)))
+    return fingerprint
+
+
+_isolated_multiworld: MultiWorld | None = None
+"""multiworld inherited by forked worker processes of generate_isolated_step"""
+_isolated_known_items: list[Item] = []
+"""items that existed before the step, which results reference instead of copying"""
+
+
+def _generate_isolated_world(player: int, step: str) -> bytes | str:
+    """:return: the pickled IsolatedWorldResult of the world, or why it has to run the step in the main process"""
+    multiworld = _isolated_multiworld
+    assert multiworld, "isolated worlds can only be generated in processes forked by generate_isolated_step"
+    itempool = list(multiworld.itempool)
+    completion_condition = multiworld.completion_condition[player]
+    outside = _outside_fingerprint(multiworld, player)
+    run_isolated_step(multiworld, player, step)
+    items = multiworld.itempool[len(itempool):]
+
+    # only this player's result gets applied, anything else it changed would be lost
+    if (len(multiworld.itempool) < len(itempool)
+            or any(item is not previous for item, previous in zip(multiworld.itempool, itempool))
+            or any(item.player != player for item in items)):
+        return "it changed other players' items in the itempool"
+    if _outside_fingerprint(multiworld, player) != outside:
+        return "it changed data outside of its own world"
+
+    result = IsolatedWorldResult.from_multiworld(
+        multiworld, player, items,
+        None if multiworld.completion_condition[player] is completion_condition
+        else multiworld.completion_condition[player])
+    file = io.BytesIO()
+    try:
+        _IsolatedWorldPickler(file, multiworld, _isolated_known_items).dump(result)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+        logging.debug(f"Could not pickle the {step} result of player {player}: {e}")
+        return "its result could not be pickled"
+    return file.getvalue()
+
+
+def isolated_generation_processes(processes: int) -> int:
+    """:return: the number of processes isolated worlds can be generated in, 0 if they have to be generated serially"""
+    if processes < 2:
+        return 0
+    if "fork" not in multiprocessing.get_all_start_methods():
+        logging.warning("world_generation_processes requires the fork start method, generating worlds serially.")
+        return 0
+    if multiprocessing.current_process().daemon:
+        # daemonic processes, like the WebHost's generation workers, are not allowed to have child processes
+        logging.warning("world_generation_processes can't be used in a daemonic process, generating worlds serially.")
+        return 0
+    return processes
+
+
+def generate_isolated_step(multiworld: MultiWorld, step: str, processes: int, isolated_items: IsolatedItems) -> None:
+    """
+    Runs a generation step for the worlds that support it in a pool of processes forked from this one and applies
+    their results to the multiworld. Worlds whose result can't be pickled or that change data outside of their own
+    world run the step in this process instead, when AutoWorld.call_all calls everyone else.
+
+    :param processes: see isolated_generation_processes
+    :param isolated_items: receives the items each world added to the itempool in the step, which AutoWorld.call_all
+        adds in their place, so the itempool is in the same order as if the step ran in this process
+    """
+    players = [player for player in multiworld.player_ids if can_isolate(multiworld.worlds[player])]
+    if not processes or not players:
+        return
+
+    global _isolated_multiworld, _isolated_known_items
+    known_items = [*multiworld.itempool, *itertools.chain.from_iterable(multiworld.precollected_items.values())]
+    _isolated_multiworld, _isolated_known_items = multiworld, known_items
+    try:
+        with concurrent.futures.ProcessPoolExecutor(min(processes, len(players)),
+                                                    multiprocessing.get_context("fork")) as pool:
+            results = list(pool.map(_generate_isolated_world, players, itertools.repeat(step)))
+    finally:
+        _isolated_multiworld, _isolated_known_items = None, []
+
+    generated = 0
+    for player, data in zip(players, results):
+        if isinstance(data, str):
+            logging.info(f"{multiworld.get_player_name(player)}'s world has to run {step} in the main process "
+                         f"because {data}.")
+            continue
+        result: IsolatedWorldResult = _IsolatedWorldUnpickler(io.BytesIO(data), multiworld, known_items).load()
+        result.apply(multiworld, player)
+        isolated_items.setdefault(player, {})[step] = result.items
+        generated += 1
+    logging.info(f"Ran {step} of {generated} worlds in {processes} processes.")
@@ -43,7 +43,7 @@ import NetUtils
 import Utils
 from Utils import version_tuple, restricted_loads, Version, async_start, get_intended_text
 from NetUtils import Endpoint, ClientStatus, NetworkItem, decode, encode, NetworkPlayer, Permission, NetworkSlot, \
-    SlotType, LocationStore, Hint, HintStatus
+    SlotType, LocationStore, Hint, HintStatus, MultidataSections
 from BaseClasses import ItemClassification
 
 
@@ -124,6 +124,198 @@ def get_saving_second(seed_name: str, interval: int = 60) -> int:
     return int(hashlib.sha256(seed_name.encode()).hexdigest(), 16) % interval
 
 
+class SaveJournal:
+    """
+    Remembers what of a Context's save data was last written, so that a save only has to write the changes since
+    then as a delta. Deltas are appended after a full snapshot of the save data, and get compacted into a new snapshot
+    once they add up to more than the snapshot itself. apply_save_delta folds deltas back into the snapshot.
+
+    Changes are found by comparing the save data against a copy of what was saved, so nothing has to report them.
+    Sections are compared whole first and only changed ones key by key, and lists of received items, which only ever
+    grow, by their length, so they get extended in deltas.
+
+    A snapshot or delta only counts as saved once commit is called after writing it. If a write fails, the next save
+    has to be a snapshot, as the failed write may have left a partial record behind.
+    """
+    magic: typing.ClassVar[bytes] = b"APSJ"
+    """start of a journaled save file, zlib compressed save files of older versions can't start with it"""
+    pair_sections: typing.ClassVar[typing.FrozenSet[str]] = frozenset(
+        {"client_activity_timers", "client_connection_timers", "video"})
+    """sections that are saved as a sequence of (key, value) pairs"""
+    whole_sections: typing.ClassVar[typing.FrozenSet[str]] = frozenset({"version", "random_state", "game_options"})
+    """small sections that are saved whole instead of by key"""
+
+    encode: typing.Callable[[typing.Dict[str, typing.Any]], bytes]
+    snapshot_size: int
+    journal_size: int
+    _saved: typing.Dict[str, typing.Any]
+    """copies of the saved sections, mapping sections as dicts"""
+    _received_counts: typing.Dict[typing.Any, int]
+    """saved lengths of the lists of received items"""
+    _pending: typing.Optional[typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[typing.Any, int], int, int]]
+
+    def __init__(self, encode: typing.Callable[[typing.Dict[str, typing.Any]], bytes]) -> None:
+        self.encode = encode
+        self.snapshot_size = 0
+        self.journal_size = 0
+        self._saved = {}
+        self._received_counts = {}
+        self._pending = None
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return not self.snapshot_size or self._pending is not None or self.journal_size > self.snapshot_size
+
+    @staticmethod
+    def _detach(value: typing.Any) -> typing.Any:
+        """Copies save data, so later changes to it in place don't change the copy."""
+        return pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def snapshot(self, savedata: typing.Dict[str, typing.Any]) -> bytes:
+        """Encodes the full save data."""
+        record = self.encode(savedata)
+        saved = self._detach({section: dict(value) if section in self.pair_sections else value
+                              for section, value in savedata.items() if section != "received_items"})
+        counts = {key: len(items) for key, items in savedata.get("received_items", {}).items()}
+        self._pending = saved, counts, len(record), 0
+        return record
+
+    def delta(self, savedata: typing.Dict[str, typing.Any]) -> typing.Optional[bytes]:
+        """Encodes the changes of savedata since the last committed save, or returns None if nothing changed."""
+        changed_sections: typing.Dict[str, typing.Any] = {}
+        mappings: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        saved = dict(self._saved)
+        counts = self._received_counts
+        for section, value in savedata.items():
+            if section == "received_items":
+                if {key: len(items) for key, items in value.items()} == counts:
+                    continue
+                extended = {key: items[counts[key]:] for key, items in value.items()
+                            if key in counts and len(items) > counts[key]}
+                updated = {key: items for key, items in value.items() if key not in counts}
+                removed = [key for key in counts if key not in value]
+                counts = {key: len(items) for key, items in value.items()}
+            else:
+                saved_value = saved.get(section, None)
+                if section in self.whole_sections or saved_value is None:
+                    if saved_value != value:
+                        changed_sections[section] = value
+                        saved[section] = self._detach(dict(value) if section in self.pair_sections else value)
+                    continue
+                if section in self.pair_sections:
+                    value = dict(value)
+                if saved_value == value:
+                    continue
+                extended = {}
+                updated = {key: item for key, item in value.items()
+                           if key not in saved_value or saved_value[key] != item}
+                removed = [key for key in saved_value if key not in value]
+                saved_value = saved[section] = {key: item for key, item in saved_value.items() if key in value}
+                saved_value.update(self._detach(updated))
+            if updated or extended or removed:
+                mappings[section] = {"update": updated, "extend": extended, "remove": removed}
+        if not changed_sections and not mappings:
+            return None
+        record = self.encode({"sections": changed_sections, "mappings": mappings})
+        self._pending = saved, counts, self.snapshot_size, self.journal_size + len(record)
+        return record
+
+    def commit(self) -> None:
+        """Marks the last snapshot or delta as written."""
+        if self._pending:
+            self._saved, self._received_counts, self.snapshot_size, self.journal_size = self._pending
+            self._pending = None
+
+    def reset(self) -> None:
+        """Forgets what was saved, so the next save is a snapshot."""
+        self.snapshot_size = self.journal_size = 0
+        self._saved = {}
+        self._received_counts = {}
+        self._pending = None
+
+    @classmethod
+    def apply_save_delta(cls, savedata: typing.Dict[str, typing.Any], delta: typing.Dict[str, typing.Any]) -> None:
+        """Folds a delta into the save data it was created against."""
+        savedata.update(delta["sections"])
+        for section, changes in delta["mappings"].items():
+            value = savedata.get(section, {})
+            mapping = {tuple(key): item for key, item in value} if section in cls.pair_sections else value
+            for key in changes["remove"]:
+                mapping.pop(key, None)
+            mapping.update(changes["update"])
+            for key, items in changes["extend"].items():
+                mapping[key] = mapping[key] + items
+            savedata[section] = tuple(mapping.items()) if section in cls.pair_sections else mapping
+
+
+def encode_save_record(data: typing.Dict[str, typing.Any]) -> bytes:
+    """Encodes a snapshot or delta of save data as a length prefixed record of a save journal."""
+    record = zlib.compress(pickle.dumps(data))
+    return len(record).to_bytes(4, "big") + record
+
+
+def decode_save_journal(data: bytes) -> typing.Dict[str, typing.Any]:
+    """Decodes save data from a save journal, or from a save file of an older version."""
+    if not data.startswith(SaveJournal.magic):
+        return restricted_loads(zlib.decompress(data))
+    data = memoryview(data)
+    offset = len(SaveJournal.magic)
+    savedata: typing.Optional[typing.Dict[str, typing.Any]] = None
+    while offset + 4 <= len(data):
+        length = int.from_bytes(data[offset:offset + 4], "big")
+        offset += 4
+        if offset + length > len(data):
+            break  # incomplete record from being interrupted while saving
+        record = restricted_loads(zlib.decompress(data[offset:offset + length]))
+        offset += length
+        if savedata is None:
+            savedata = record
+        else:
+            SaveJournal.apply_save_delta(savedata, record)
+    if savedata is None:
+        raise ValueError("Save journal does not contain a snapshot.")
+    return savedata
+
+
+def init_game_names(games: typing.Dict[str, typing.Dict[str, typing.Any]],
+                    item_name_groups: typing.Mapping[str, typing.Mapping[str, typing.Any]],
+                    location_name_groups: typing.Mapping[str, typing.Mapping[str, typing.Any]],
+                    item_names: typing.Dict[str, typing.MutableMapping[int, str]],
+                    location_names: typing.Dict[str, typing.MutableMapping[int, str]],
+                    all_item_and_group_names: typing.Dict[str, typing.Set[str]],
+                    all_location_and_group_names: typing.Dict[str, typing.Set[str]]) -> None:
+    """Fills the id to name lookups and the sets of names and group names of games from their data packages.
+    item_names and location_names have to create a lookup for games they don't have yet."""
+    for game_name, game_package in games.items():
+        packed = None
+        if game_package.get("checksum"):
+            packed = Utils.load_packed_data_package(game_name, game_package["checksum"])
+            if not packed:
+                Utils.store_packed_data_package(game_name, game_package)
+                packed = Utils.load_packed_data_package(game_name, game_package["checksum"])
+        if packed:
+            # searched in the memory-mapped tables, the first map takes the Archipelago names added below
+            item_names[game_name] = collections.ChainMap(
+                {}, packed.item_names, Utils.KeyedDefaultDict(lambda code: f'Unknown item (ID:{code})'))
+            location_names[game_name] = collections.ChainMap(
+                {}, packed.location_names, Utils.KeyedDefaultDict(lambda code: f'Unknown location (ID:{code})'))
+        else:
+            for item_name, item_id in game_package["item_name_to_id"].items():
+                item_names[game_name][item_id] = item_name
+            for location_name, location_id in game_package["location_name_to_id"].items():
+                location_names[game_name][location_id] = location_name
+        all_item_and_group_names[game_name] = set(game_package["item_name_to_id"]) | set(item_name_groups[game_name])
+        all_location_and_group_names[game_name] = \
+            set(game_package["location_name_to_id"]) | set(location_name_groups.get(game_name, []))
+
+    archipelago_item_names = item_names["Archipelago"]
+    archipelago_location_names = location_names["Archipelago"]
+    for game in [game_name for game_name in games if game_name != "Archipelago"]:
+        # Add Archipelago items and locations to each data package.
+        item_names[game].update(archipelago_item_names)
+        location_names[game].update(archipelago_location_names)
+
+
 class Client(Endpoint):
     version = Version(0, 0, 0)
     tags: typing.List[str]
@@ -188,6 +380,12 @@ class Context:
     location_checks: typing.Dict[typing.Tuple[int, int], typing.Set[int]]
     hints_used: typing.Dict[typing.Tuple[int, int], int]
     groups: typing.Dict[int, typing.Set[int]]
+    # (receiving slot, item id) -> (finding slot, location id, item flags) of each location holding that item
+    item_locations: typing.Dict[typing.Tuple[int, int], typing.List[typing.Tuple[int, int, int]]]
+    # slot -> ids of the groups that slot is a member of
+    slot_groups: typing.Dict[int, typing.Set[int]]
+    # (team, finding slot, location id) -> current hint for that location
+    location_hints: typing.Dict[typing.Tuple[int, int, int], Hint]
     save_version = 2
     stored_data: typing.Dict[str, object]
     read_data: typing.Dict[str, object]
@@ -195,9 +393,9 @@ class Context:
     slot_info: typing.Dict[int, NetworkSlot]
     generator_version = Version(0, 0, 0)
     checksums: typing.Dict[str, str]
-    item_names: typing.Dict[str, typing.Dict[int, str]]
+    item_names: typing.Dict[str, typing.MutableMapping[int, str]]
     item_name_groups: typing.Dict[str, typing.Dict[str, typing.Set[str]]]
-    location_names: typing.Dict[str, typing.Dict[int, str]]
+    location_names: typing.Dict[str, typing.MutableMapping[int, str]]
     location_name_groups: typing.Dict[str, typing.Dict[str, typing.Set[str]]]
     all_item_and_group_names: typing.Dict[str, typing.Set[str]]
     all_location_and_group_names: typing.Dict[str, typing.Set[str]]
@@ -209,11 +407,14 @@ class Context:
     def __init__(self, host: str, port: int, server_password: str, password: str, location_check_points: int,
                  hint_cost: int, item_cheat: bool, release_mode: str = "disabled", collect_mode="disabled",
                  remaining_mode: str = "disabled", auto_shutdown: typing.SupportsFloat = 0, compatibility: int = 2,
-                 log_network: bool = False, logger: logging.Logger = logging.getLogger()):
+                 log_network: bool = False, item_send_tick: int = 0, logger: logging.Logger = logging.getLogger()):
         self.logger = logger
         super(Context, self).__init__()
         self.slot_info = {}
         self.log_network = log_network
+        self.item_send_tick = item_send_tick
+        self.new_item_slots: typing.Set[team_slot] = set()  # slots that received items not yet sent to their clients
+        self.new_items_handle: typing.Optional[asyncio.Handle] = None
         self.endpoints = []
         self.clients = {}
         self.compatibility: int = compatibility
@@ -239,6 +440,7 @@ class Context:
         self.location_check_points = location_check_points
         self.hints_used = collections.defaultdict(int)
         self.hints: typing.Dict[team_slot, typing.Set[Hint]] = collections.defaultdict(set)
+        self.location_hints = {}
         self.release_mode: str = release_mode
         self.remaining_mode: str = remaining_mode
         self.collect_mode: str = collect_mode
@@ -257,11 +459,14 @@ class Context:
         self.auto_save_interval = 60  # in seconds
         self.auto_saver_thread: typing.Optional[threading.Thread] = None
         self.save_dirty = False
+        self.save_journal = SaveJournal(encode_save_record)
         self.tags = ['AP']
         self.games: typing.Dict[int, str] = {}
         self.minimum_client_versions: typing.Dict[int, Version] = {}
         self.seed_name = ""
         self.groups = {}
+        self.slot_groups = {}
+        self.item_locations = {}
         self.group_collected: typing.Dict[int, typing.Set[int]] = {}
         self.random = random.Random()
         self.stored_data = {}
@@ -305,21 +510,11 @@ class Context:
         for game_name, game_package in self.gamespackage.items():
             if "checksum" in game_package:
                 self.checksums[game_name] = game_package["checksum"]
-            for item_name, item_id in game_package["item_name_to_id"].items():
-                self.item_names[game_name][item_id] = item_name
-            for location_name, location_id in game_package["location_name_to_id"].items():
-                self.location_names[game_name][location_id] = location_name
-            self.all_item_and_group_names[game_name] = \
-                set(game_package["item_name_to_id"]) | set(self.item_name_groups[game_name])
-            self.all_location_and_group_names[game_name] = \
-                set(game_package["location_name_to_id"]) | set(self.location_name_groups.get(game_name, []))
-
-        archipelago_item_names = self.item_names["Archipelago"]
-        archipelago_location_names = self.location_names["Archipelago"]
-        for game in [game_name for game_name in self.gamespackage if game_name != "Archipelago"]:
-            # Add Archipelago items and locations to each data package.
-            self.item_names[game].update(archipelago_item_names)
-            self.location_names[game].update(archipelago_location_names)
+        self._init_game_names(self.gamespackage)
+
+    def _init_game_names(self, games: typing.Dict[str, typing.Dict[str, typing.Any]]):
+        init_game_names(games, self.item_name_groups, self.location_name_groups, self.item_names, self.location_names,
+                        self.all_item_and_group_names, self.all_location_and_group_names)
 
     def item_names_for_game(self, game: str) -> typing.Optional[typing.Dict[str, int]]:
         return self.gamespackage[game]["item_name_to_id"] if game in self.gamespackage else None
@@ -388,7 +583,10 @@ class Context:
 
     def broadcast_team(self, team: int, msgs: typing.List[dict]):
         msg_is_text = all(msg["cmd"] == "PrintJSON" for msg in msgs)
-        data = self.dumper(msgs)
+        self.broadcast_team_encoded(team, self.dumper(msgs), msg_is_text)
+
+    def broadcast_team_encoded(self, team: int, data: str, msg_is_text: bool):
+        """Sends already encoded messages to a team, msg_is_text skips clients that don't want PrintJSON."""
         endpoints = (
             endpoint
             for endpoint in itertools.chain.from_iterable(self.clients[team].values())
@@ -439,14 +637,16 @@ class Context:
         self.data_filename = multidatapath
 
     @staticmethod
-    def decompress(data: bytes) -> dict:
+    def decompress(data: bytes) -> typing.MutableMapping[str, typing.Any]:
         format_version = data[0]
-        if format_version > 3:
+        if format_version > 4:
             raise Utils.VersionException("Incompatible multidata.")
+        if format_version == 4:
+            return MultidataSections(data)
         return restricted_loads(zlib.decompress(data[1:]))
 
-    def _load(self, decoded_obj: dict, game_data_packages: typing.Dict[str, typing.Any],
-              use_embedded_server_options: bool):
+    def _load(self, decoded_obj: typing.MutableMapping[str, typing.Any],
+              game_data_packages: typing.Dict[str, typing.Any], use_embedded_server_options: bool):
 
         self.read_data = {}
         # there might be a better place to put this.
@@ -469,6 +669,10 @@ class Context:
         self.games = {slot: slot_info.game for slot, slot_info in self.slot_info.items()}
         self.groups = {slot: set(slot_info.group_members) for slot, slot_info in self.slot_info.items()
                        if slot_info.type == SlotType.group}
+        self.slot_groups = collections.defaultdict(set)
+        for group_id, group in self.groups.items():
+            for slot in group:
+                self.slot_groups[slot].add(group_id)
 
         self.clients = {0: {}}
         slot_info: NetworkSlot
@@ -488,9 +692,14 @@ class Context:
         self.random.seed(self.seed_name)
         self.connect_names = decoded_obj['connect_names']
         self.locations = LocationStore(decoded_obj.pop("locations"))  # pre-emptively free memory
-        self.slot_data = decoded_obj['slot_data']
-        for slot, data in self.slot_data.items():
-            self.read_data[f"slot_data_{slot}"] = lambda data=data: data
+        self.item_locations = {}
+        for finding_player, check_data in self.locations.items():
+            for location_id, (item_id, receiving_player, item_flags) in check_data.items():
+                self.item_locations.setdefault((receiving_player, item_id), []).append(
+                    (finding_player, location_id, item_flags))
+        self.slot_data = decoded_obj['slot_data']  # decompressed per slot on first use for sectioned multidata
+        for slot in self.slot_data:
+            self.read_data[f"slot_data_{slot}"] = lambda slot=slot: self.slot_data[slot]
         self.er_hint_data = {int(player): {int(address): name for address, name in loc_data.items()}
                              for player, loc_data in decoded_obj["er_hint_data"].items()}
 
@@ -500,6 +709,7 @@ class Context:
 
         for slot, hints in decoded_obj["precollected_hints"].items():
             self.hints[0, slot].update(hints)
+        self.index_hints()
 
         # declare slots that aren't players as done
         for slot, slot_info in self.slot_info.items():
@@ -544,12 +754,29 @@ class Context:
 
         return False
 
+    def get_save_record(self, exit_save: bool = False) -> typing.Tuple[bool, typing.Optional[bytes]]:
+        """
+        Encodes either a snapshot of the save data or its changes since the last save, as chosen by save_journal.
+        Returns whether it is a snapshot, and the record to write, which is None if nothing changed.
+        Call save_journal.commit() once the record is written.
+        """
+        savedata = self.get_save()
+        if exit_save or self.save_journal.needs_snapshot:
+            return True, self.save_journal.snapshot(savedata)
+        return False, self.save_journal.delta(savedata)
+
     def _save(self, exit_save: bool = False) -> bool:
         try:
-            encoded_save = pickle.dumps(self.get_save())
-            with open(self.save_filename, "wb") as f:
-                f.write(zlib.compress(encoded_save))
+            snapshot, record = self.get_save_record(exit_save)
+            if snapshot:
+                with open(self.save_filename, "wb") as f:
+                    f.write(SaveJournal.magic + record)
+            elif record:
+                with open(self.save_filename, "ab") as f:
+                    f.write(record)
+            self.save_journal.commit()
         except Exception as e:
+            self.save_journal.reset()
             self.logger.exception(e)
             return False
         else:
@@ -565,7 +792,7 @@ class Context:
                     else self.data_filename + '_' + 'apsave'
             try:
                 with open(self.save_filename, 'rb') as f:
-                    save_data = restricted_loads(zlib.decompress(f.read()))
+                    save_data = decode_save_journal(f.read())
                     self.set_save(save_data)
             except FileNotFoundError:
                 self.logger.error('No save data found, starting a new game')
@@ -607,7 +834,6 @@ class Context:
     def get_save(self) -> dict:
         self.recheck_hints()
         d = {
-            "version": self.save_version,
             "connect_names": self.connect_names,
             "received_items": self.received_items,
             "hints_used": dict(self.hints_used),
@@ -619,19 +845,25 @@ class Context:
                 (key, value.timestamp()) for key, value in self.client_activity_timers.items()),
             "client_connection_timers": tuple(
                 (key, value.timestamp()) for key, value in self.client_connection_timers.items()),
-            "random_state": self.random.getstate(),
             "group_collected": dict(self.group_collected),
             "stored_data": self.stored_data,
+            **self.get_save_sections()
+        }
+
+        return d
+
+    def get_save_sections(self) -> dict:
+        """Returns the save data sections that are saved whole, see SaveJournal.whole_sections."""
+        return {
+            "version": self.save_version,
+            "random_state": self.random.getstate(),
             "game_options": {"hint_cost": self.hint_cost, "location_check_points": self.location_check_points,
                              "server_password": self.server_password, "password": self.password,
                              "release_mode": self.release_mode,
                              "remaining_mode": self.remaining_mode, "collect_mode": self.collect_mode,
                              "item_cheat": self.item_cheat, "compatibility": self.compatibility}
-
         }
 
-        return d
-
     def set_save(self, savedata: dict):
         if self.connect_names != savedata["connect_names"]:
             raise Exception("This savegame does not appear to match the loaded multiworld.")
@@ -640,6 +872,7 @@ class Context:
         self.received_items = savedata["received_items"]
         self.hints_used.update(savedata["hints_used"])
         self.hints.update(savedata["hints"])
+        self.index_hints()
 
         self.name_aliases.update(savedata["name_aliases"])
         self.client_game_state.update(savedata["client_game_state"])
@@ -686,17 +919,23 @@ class Context:
         will refresh all teams or all slots respectively. If a set is passed for 'changed', each (team,slot)
         pair that has at least one hint modified will be added to the set.
         """
-        for hint_team, hint_slot in self.hints:
+        if team is not None and slot is not None:
+            hint_keys = [(team, slot)] if (team, slot) in self.hints else []
+        else:
+            hint_keys = list(self.hints)
+        for hint_team, hint_slot in hint_keys:
             if team != hint_team and team is not None:
                 continue  # Check specified team only, all if team is None
             if slot != hint_slot and slot is not None:
                 continue  # Check specified slot only, all if slot is None
             new_hints: typing.Set[Hint] = set()
-            for hint in self.hints[hint_team, hint_slot]:
+            hints = self.hints[hint_team, hint_slot]
+            for hint in hints:
                 new_hint = hint.re_check(self, hint_team)
                 new_hints.add(new_hint)
                 if hint == new_hint:
                     continue
+                self.location_hints[hint_team, new_hint.finding_player, new_hint.location] = new_hint
                 for player in self.slot_set(hint.receiving_player) | {hint.finding_player}:
                     if changed is not None:
                         changed.add((hint_team,player))
@@ -704,6 +943,39 @@ class Context:
                         self.replace_hint(hint_team, player, hint, new_hint)
             self.hints[hint_team, hint_slot] = new_hints
 
+    def recheck_location_hints(self, team: int, slot: int, locations: typing.Iterable[int],
+                               changed: typing.Optional[typing.Set[team_slot]] = None) -> None:
+        """Refreshes only the hints for the specified locations of team/slot, such as after they got checked.
+        Like recheck_hints, each (team,slot) pair that has a hint modified will be added to 'changed'.
+        """
+        for location in locations:
+            hint = self.location_hints.get((team, slot, location))
+            if hint is None:
+                continue
+            new_hint = hint.re_check(self, team)
+            if hint == new_hint:
+                continue
+            for player in self.slot_set(hint.receiving_player) | {hint.finding_player}:
+                if changed is not None:
+                    changed.add((team, player))
+                self.replace_hint(team, player, hint, new_hint)
+
+    def index_hints(self) -> None:
+        """Rebuilds the location_hints index from all remembered hints."""
+        self.location_hints = {(team, hint.finding_player, hint.location): hint
+                               for (team, slot), hints in self.hints.items() for hint in hints}
+
+    def find_item(self, slots: typing.Set[int], seeked_item_id: int
+                  ) -> typing.List[typing.Tuple[int, int, int, int, int]]:
+        """Same as LocationStore.find_item, but looks the item up in item_locations instead of walking all locations."""
+        found = [(finding_player, location_id, seeked_item_id, receiving_player, item_flags)
+                 for receiving_player in slots
+                 for finding_player, location_id, item_flags
+                 in self.item_locations.get((receiving_player, seeked_item_id), ())]
+        if len(slots) > 1:
+            found.sort(key=operator.itemgetter(0))
+        return found
+
     def get_rechecked_hints(self, team: int, slot: int):
         self.recheck_hints(team, slot)
         return self.hints[team, slot]
@@ -773,6 +1045,7 @@ class Context:
                 # we can check once if hint already exists
                 if hint not in self.hints[team, hint.finding_player]:
                     self.hints[team, hint.finding_player].add(hint)
+                    self.location_hints[team, hint.finding_player, hint.location] = hint
                     new_hint_events.add(hint.finding_player)
                     for player in self.slot_set(hint.receiving_player):
                         self.hints[team, player].add(hint)
@@ -791,15 +1064,13 @@ class Context:
                     async_start(self.send_msgs(client, client_hints))
 
     def get_hint(self, team: int, finding_player: int, seeked_location: int) -> typing.Optional[Hint]:
-        for hint in self.hints[team, finding_player]:
-            if hint.location == seeked_location and hint.finding_player == finding_player:
-                return hint
-        return None
+        return self.location_hints.get((team, finding_player, seeked_location), None)
     
     def replace_hint(self, team: int, slot: int, old_hint: Hint, new_hint: Hint) -> None:
         if old_hint in self.hints[team, slot]:
             self.hints[team, slot].remove(old_hint)
             self.hints[team, slot].add(new_hint)
+        self.location_hints[team, new_hint.finding_player, new_hint.location] = new_hint
     
     # "events"
 
@@ -1022,20 +1293,40 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
 
 
 def send_new_items(ctx: Context):
-    for team, clients in ctx.clients.items():
-        for slot, clients in clients.items():
-            for client in clients:
-                if client.no_items:
-                    continue
-                start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
-                items = get_received_items(ctx, team, slot, client.remote_items)
-                if len(start_inventory) + len(items) > client.send_index:
-                    first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
-                        "cmd": "ReceivedItems",
-                        "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
-                    client.send_index = len(start_inventory) + len(items)
+    """
+    Schedules sending the items received by ctx.new_item_slots to their clients, after ctx.item_send_tick milliseconds
+    or at the end of the current event loop iteration, so everything received until then is sent together.
+    """
+    if not ctx.new_item_slots or ctx.new_items_handle:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:  # not running in the server's event loop, so there is nothing to wait for
+        deliver_new_items(ctx)
+        return
+    if ctx.item_send_tick:
+        ctx.new_items_handle = loop.call_later(ctx.item_send_tick / 1000, deliver_new_items, ctx)
+    else:
+        ctx.new_items_handle = loop.call_soon(deliver_new_items, ctx)
+
+
+def deliver_new_items(ctx: Context):
+    """Sends all items received since the last delivery, as one ReceivedItems per client of a slot that got any."""
+    ctx.new_items_handle = None
+    slots, ctx.new_item_slots = ctx.new_item_slots, set()
+    for team, slot in slots:
+        for client in ctx.clients.get(team, {}).get(slot, ()):
+            if client.no_items:
+                continue
+            start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
+            items = get_received_items(ctx, team, slot, client.remote_items)
+            if len(start_inventory) + len(items) > client.send_index:
+                first_new_item = max(0, client.send_index - len(start_inventory))
+                async_start(ctx.send_msgs(client, [{
+                    "cmd": "ReceivedItems",
+                    "index": client.send_index,
+                    "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
+                client.send_index = len(start_inventory) + len(items)
 
 
 def update_checked_locations(ctx: Context, team: int, slot: int):
@@ -1078,11 +1369,13 @@ def get_remaining(ctx: Context, team: int, slot: int) -> typing.List[typing.Tupl
 
 
 def send_items_to(ctx: Context, team: int, target_slot: int, *items: NetworkItem):
+    """Adds items to the received items of a slot, send_new_items then sends them to its clients."""
     for target in ctx.slot_set(target_slot):
         for item in items:
             if item.player != target_slot:
                 get_received_items(ctx, team, target, False).append(item)
             get_received_items(ctx, team, target, True).append(item)
+        ctx.new_item_slots.add((team, target))
 
 
 def register_location_checks(ctx: Context, team: int, slot: int, locations: typing.Iterable[int],
@@ -1101,7 +1394,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
             # sort/group by receiver and item
             sortable.append((target_player, item_id, location, flags))
 
-        info_texts: list[dict[str, typing.Any]] = []
+        info_texts: list[str] = []
         for target_player, item_id, location, flags in sorted(sortable):
             new_item = NetworkItem(item_id, location, slot, flags)
             send_items_to(ctx, team, target_player, new_item)
@@ -1112,10 +1405,10 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
             if len(info_texts) >= 140:
                 # split into chunks that are close to compression window of 64K but not too big on the wire
                 # (roughly 1300-2600 bytes after compression depending on repetitiveness)
-                ctx.broadcast_team(team, info_texts)
+                ctx.broadcast_team_encoded(team, f"[{','.join(info_texts)}]", True)
                 info_texts.clear()
-            info_texts.append(json_format_send_event(new_item, target_player))
-        ctx.broadcast_team(team, info_texts)
+            info_texts.append(encode_send_event(new_item, target_player))
+        ctx.broadcast_team_encoded(team, f"[{','.join(info_texts)}]", True)
         del info_texts
         del sortable
 
@@ -1127,7 +1420,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
             "checked_locations": new_locations,  # send back new checks only
         }])
         updated_slots: typing.Set[tuple[int, int]] = set()
-        ctx.recheck_hints(team, slot, updated_slots)
+        ctx.recheck_location_hints(team, slot, new_locations, updated_slots)
         for hint_team, hint_slot in updated_slots:
             ctx.on_changed_hints(hint_team, hint_slot)
         ctx.save()
@@ -1136,14 +1429,11 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
 def collect_hints(ctx: Context, team: int, slot: int, item: typing.Union[int, str], auto_status: HintStatus) \
         -> typing.List[Hint]:
     hints = []
-    slots: typing.Set[int] = {slot}
-    for group_id, group in ctx.groups.items():
-        if slot in group:
-            slots.add(group_id)
+    slots: typing.Set[int] = {slot} | ctx.slot_groups.get(slot, set())
 
     seeked_item_id = item if isinstance(item, int) else ctx.item_names_for_game(ctx.games[slot])[item]
     for finding_player, location_id, item_id, receiving_player, item_flags \
-            in ctx.locations.find_item(slots, seeked_item_id):
+            in ctx.find_item(slots, seeked_item_id):
         prev_hint = ctx.get_hint(team, finding_player, location_id)
         if prev_hint:
             hints.append(prev_hint)
@@ -1228,6 +1518,33 @@ def json_format_send_event(net_item: NetworkItem, receiving_player: int):
             "item": net_item}
 
 
+def _send_event_format(found: bool) -> str:
+    # encode an event with marker values once, then turn it into a format string with the markers as fields
+    markers = {"item": 7770001, "location": 7770002, "player": 7770003, "flags": 7770004, "receiving": 7770005}
+    sample = NetworkItem(markers["item"], markers["location"], markers["player"], markers["flags"])
+    data = encode(json_format_send_event(sample, markers["player"] if found else markers["receiving"]))
+    data = data.replace("{", "{{").replace("}", "}}")
+    for name, marker in markers.items():
+        data = data.replace(str(marker), f"{{{name}}}")
+    return data
+
+
+_found_event_format = _send_event_format(True)
+_sent_event_format = _send_event_format(False)
+
+
+def encode_send_event(net_item: NetworkItem, receiving_player: int) -> str:
+    """
+    Encodes json_format_send_event(net_item, receiving_player) from a pre-encoded template,
+    as item send events are too numerous during a release to encode their whole structure each time.
+    """
+    item, location, player, flags = net_item
+    if player == receiving_player:
+        return _found_event_format.format(item=item, location=location, player=player, flags=flags)
+    return _sent_event_format.format(item=item, location=location, player=player, flags=flags,
+                                     receiving=receiving_player)
+
+
 class CommandMeta(type):
     def __new__(cls, name, bases, attrs):
         commands = attrs["commands"] = {}
@@ -1592,6 +1909,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
                 new_item = NetworkItem(names[item_name], -1, self.client.slot)
                 get_received_items(self.ctx, self.client.team, self.client.slot, False).append(new_item)
                 get_received_items(self.ctx, self.client.team, self.client.slot, True).append(new_item)
+                self.ctx.new_item_slots.add((self.client.team, self.client.slot))
                 self.ctx.broadcast_text_all(
                     'Cheat console: sending "' + item_name + '" to ' + self.ctx.get_aliased_name(self.client.team,
                                                                                                  self.client.slot),
@@ -1610,9 +1928,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
         cost = self.ctx.get_hint_cost(self.client.slot)
         auto_status = HintStatus.HINT_UNSPECIFIED if for_location else HintStatus.HINT_PRIORITY
         if not input_text:
-            hints = {hint.re_check(self.ctx, self.client.team) for hint in
-                     self.ctx.hints[self.client.team, self.client.slot]}
-            self.ctx.hints[self.client.team, self.client.slot] = hints
+            hints = self.ctx.get_rechecked_hints(self.client.team, self.client.slot)
             self.ctx.notify_hints(self.client.team, list(hints), recipients=(self.client.slot,))
             self.output(f"A hint costs {self.ctx.get_hint_cost(self.client.slot)} points. "
                         f"You have {points_available} points.")
@@ -1760,12 +2076,12 @@ def get_missing_checks(ctx: Context, team: int, slot: int) -> typing.List[int]:
 
 def get_client_points(ctx: Context, client: Client) -> int:
     return (ctx.location_check_points * len(ctx.location_checks[client.team, client.slot]) -
-            ctx.get_hint_cost(client.slot) * ctx.hints_used[client.team, client.slot])
+            ctx.get_hint_cost(client.slot) * ctx.hints_used.get((client.team, client.slot), 0))
 
 
 def get_slot_points(ctx: Context, team: int, slot: int) -> int:
     return (ctx.location_check_points * len(ctx.location_checks[team, slot]) -
-            ctx.get_hint_cost(slot) * ctx.hints_used[team, slot])
+            ctx.get_hint_cost(slot) * ctx.hints_used.get((team, slot), 0))
 
 
 async def process_client_cmd(ctx: Context, client: Client, args: dict):
@@ -2486,6 +2802,9 @@ def parse_args() -> argparse.Namespace:
     #0 -> recommended for tournaments to force a level playing field, only allow an exact version match
     """)
     parser.add_argument('--log_network', default=defaults["log_network"], action="store_true")
+    parser.add_argument('--item_send_tick', default=defaults["item_send_tick"], type=int,
+                        help="milliseconds to collect newly received items for, to send them to each client at once. "
+                             "0 sends them once the current message is handled.")
     args = parser.parse_args()
     return args
 
@@ -2532,7 +2851,7 @@ async def main(args: argparse.Namespace):
     ctx = Context(args.host, args.port, args.server_password, args.password, args.location_check_points,
                   args.hint_cost, not args.disable_item_cheat, args.release_mode, args.collect_mode,
                   args.remaining_mode,
-                  args.auto_shutdown, args.compatibility, args.log_network)
+                  args.auto_shutdown, args.compatibility, args.log_network, args.item_send_tick)
     data_filename = args.multidata
 
     if not data_filename:
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import struct
+import sys
 import typing
 import enum
 import warnings
 from json import JSONEncoder, JSONDecoder
 
 if typing.TYPE_CHECKING:
+    import mmap
+
     from websockets import WebSocketServerProtocol as ServerConnection
 
 from Utils import ByValue, Version
@@ -493,3 +497,294 @@ else:
             warnings.warn("_speedups not available. Falling back to pure python LocationStore. "
                           "Install a matching C++ compiler for your platform to compile _speedups.")
             LocationStore = _LocationStore
+
+
+multidata_sections: typing.Tuple[str, ...] = ("locations", "spheres", "er_hint_data", "datapackage")
+"""multidata keys that get a section of their own in multidata of format 4, in addition to the slot_data of each slot"""
+
+
+def write_multidata_sections(file: typing.BinaryIO, multidata: typing.MutableMapping[str, typing.Any]) -> None:
+    """
+    Writes multidata of format 4 to file. The slot_data of each slot and each of multidata_sections are compressed
+    separately and written as soon as they are encoded, followed by the remaining keys and an index of the sections.
+    Everything gets popped from multidata while writing, so only one section is held in encoded form at a time.
+    Sections of MultidataSections that were never accessed are copied over without decoding them.
+    """
+    import pickle
+    import zlib
+
+    keys = list(multidata)
+    sections: typing.Dict[str, typing.Tuple[int, int]] = {}
+    slots: typing.List[int] = []
+    offset = file.write(bytes([4]))  # version of format
+
+    def write_section(name: str, mapping: typing.MutableMapping[typing.Any, typing.Any], key: typing.Any) -> None:
+        nonlocal offset
+        data = mapping._raw(key) if isinstance(mapping, _LazySections) else None
+        if data is None:
+            data = zlib.compress(pickle.dumps(mapping[key]), 9)
+        del mapping[key]
+        sections[name] = offset, len(data)
+        offset += file.write(data)
+
+    if "slot_data" in multidata:
+        slot_data = multidata.pop("slot_data")
+        for slot in list(slot_data):
+            write_section(f"slot_data/{slot}", slot_data, slot)
+            slots.append(slot)
+        del slot_data
+    for key in multidata_sections:
+        if key in multidata:
+            write_section(key, multidata, key)
+    core = {key: multidata.pop(key) for key in list(multidata)}
+    write_section("", {"": core}, "")
+
+    index = zlib.compress(pickle.dumps({"keys": keys, "core": list(core), "slots": slots, "sections": sections}), 9)
+    file.write(index)
+    file.write(struct.pack(">Q", len(index)))
+
+
+class _LazySections(typing.MutableMapping[typing.Any, typing.Any]):
+    """Mapping of keys to compressed sections of multidata of format 4, each only decompressed on first access."""
+    _data: memoryview
+    _offsets: typing.Dict[str, typing.Tuple[int, int]]
+    """offset and length of each section in data"""
+    _sections: typing.Dict[typing.Any, str]
+    """name of the section each key is stored in"""
+    _decoded: typing.Dict[typing.Any, typing.Any]
+
+    def __init__(self, data: memoryview, offsets: typing.Dict[str, typing.Tuple[int, int]],
+                 sections: typing.Dict[typing.Any, str]) -> None:
+        self._data = data
+        self._offsets = offsets
+        self._sections = sections
+        self._decoded = {}
+
+    def _read(self, section: str) -> typing.Any:
+        import zlib
+        from Utils import restricted_loads
+        offset, length = self._offsets[section]
+        return restricted_loads(zlib.decompress(self._data[offset:offset + length]))
+
+    def _decode(self, key: typing.Any) -> typing.Any:
+        return self._read(self._sections[key])
+
+    def _raw(self, key: typing.Any) -> typing.Optional[memoryview]:
+        """Returns the compressed section of key if it has a section of its own and was not accessed yet."""
+        section = self._sections.get(key)
+        if key in self._decoded or not section or section not in self._offsets:
+            return None
+        offset, length = self._offsets[section]
+        return self._data[offset:offset + length]
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        if key in self._decoded:
+            return self._decoded[key]
+        if key not in self._sections:
+            raise KeyError(key)
+        value = self._decoded[key] = self._decode(key)
+        return value
+
+    def __setitem__(self, key: typing.Any, value: typing.Any) -> None:
+        self._sections.setdefault(key, "")
+        self._decoded[key] = value
+
+    def __delitem__(self, key: typing.Any) -> None:
+        del self._sections[key]
+        self._decoded.pop(key, None)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(list(self._sections))
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._sections)})"
+
+
+class MultidataSections(_LazySections):
+    """
+    Multidata of format 4, as written by write_multidata_sections. Behaves like the decoded multidata dict, but each
+    section is only decompressed when it is first accessed, and slot_data decompresses the data of each slot on its own.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        import zlib
+        from Utils import restricted_loads
+
+        data = memoryview(data)
+        if data[0] != 4:
+            raise ValueError(f"Multidata of format {data[0]} is not sectioned.")
+        index_length, = struct.unpack(">Q", data[-8:])
+        index = restricted_loads(zlib.decompress(data[-8 - index_length:-8]))
+        core = set(index["core"])
+        super().__init__(data, index["sections"], {key: "" if key in core else key for key in index["keys"]})
+        self._slots = index["slots"]
+
+    def _decode(self, key: str) -> typing.Any:
+        if key == "slot_data":
+            return _LazySections(self._data, self._offsets, {slot: f"slot_data/{slot}" for slot in self._slots})
+        if self._sections[key] == "":
+            core = self._read("")
+            for core_key, value in core.items():
+                if self._sections.get(core_key) == "" and core_key not in self._decoded:
+                    self._decoded[core_key] = value
+            return core[key]
+        return super()._decode(key)
+
+
+class PackedNames(typing.Mapping[int, str]):
+    """Id to name lookup of a PackedDataPackage, searched where it lies instead of being built into a dict."""
+    _ids: memoryview
+    _spans: memoryview
+    """offset and length of each name in the blob, by row"""
+    _order: memoryview
+    """rows sorted by name, for name to id lookups"""
+    _blob: memoryview
+
+    def __init__(self, ids: memoryview, spans: memoryview, order: memoryview, blob: memoryview) -> None:
+        self._ids = ids
+        self._spans = spans
+        self._order = order
+        self._blob = blob
+
+    def _name(self, row: int) -> bytes:
+        offset = self._spans[row * 2]
+        return bytes(self._blob[offset:offset + self._spans[row * 2 + 1]])
+
+    def _row(self, code: int) -> int:
+        import bisect
+        row = bisect.bisect_left(self._ids, code)
+        if row < len(self._ids) and self._ids[row] == code:
+            return row
+        return -1
+
+    def __getitem__(self, code: int) -> str:
+        row = self._row(code) if isinstance(code, int) else -1
+        if row < 0:
+            raise KeyError(code)
+        return self._name(row).decode("utf-8")
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, int) and self._row(code) >= 0
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get_id(self, name: str) -> typing.Optional[int]:
+        import bisect
+        encoded = name.encode("utf-8")
+        index = bisect.bisect_left(self._order, encoded, key=self._name)
+        if index < len(self._order) and self._name(self._order[index]) == encoded:
+            return self._ids[self._order[index]]
+        return None
+
+
+class PackedNameToId(typing.Mapping[str, int]):
+    """Name to id lookup of a PackedDataPackage, the reverse of its PackedNames."""
+    names: PackedNames
+
+    def __init__(self, names: PackedNames) -> None:
+        self.names = names
+
+    def __getitem__(self, name: str) -> int:
+        code = self.names.get_id(name) if isinstance(name, str) else None
+        if code is None:
+            raise KeyError(name)
+        return code
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return (self.names[code] for code in self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class PackedDataPackage:
+    """
+    The id tables of a game's data package in a compact binary form, which can be queried in place, such as from a
+    memory-mapped file, without building dicts. Items and locations each have their ids sorted, with the span of each
+    name in a shared blob of names that stores every distinct name once, and their rows sorted by name.
+    Everything is stored little-endian. Big-endian hosts read the tables into swapped copies instead of in place.
+    """
+    magic: typing.ClassVar[bytes] = b"APDP"
+    version: typing.ClassVar[int] = 1
+    header: typing.ClassVar[struct.Struct] = struct.Struct("<4sHHIII")
+    """magic, version, length of the checksum, item count, location count and size of the name blob"""
+
+    checksum: str
+    item_names: PackedNames
+    location_names: PackedNames
+    item_name_to_id: PackedNameToId
+    location_name_to_id: PackedNameToId
+
+    def __init__(self, buffer: typing.Union[bytes, memoryview, "mmap.mmap"]) -> None:
+        data = memoryview(buffer)
+        magic, version, checksum_length, item_count, location_count, blob_size = self.header.unpack_from(data)
+        if magic != self.magic or version != self.version:
+            raise ValueError("Not a packed data package of a supported version.")
+        offset = self.header.size
+        self.checksum = str(data[offset:offset + checksum_length], "ascii")
+        offset = self._align(offset + checksum_length)
+
+        def take(size: int, fmt: str) -> memoryview:
+            nonlocal offset
+            view = data[offset:offset + size * struct.calcsize(fmt)]
+            offset += view.nbytes
+            if sys.byteorder == "little":
+                return view.cast(fmt)
+            import array
+            values = array.array(fmt, view)
+            values.byteswap()
+            return memoryview(values)
+
+        item_ids, location_ids = take(item_count, "q"), take(location_count, "q")
+        item_spans, location_spans = take(item_count * 2, "I"), take(location_count * 2, "I")
+        item_order, location_order = take(item_count, "I"), take(location_count, "I")
+        blob = data[offset:offset + blob_size]
+        self.item_names = PackedNames(item_ids, item_spans, item_order, blob)
+        self.location_names = PackedNames(location_ids, location_spans, location_order, blob)
+        self.item_name_to_id = PackedNameToId(self.item_names)
+        self.location_name_to_id = PackedNameToId(self.location_names)
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        return offset + -offset % 8
+
+    @classmethod
+    def pack(cls, game_package: typing.Mapping[str, typing.Any]) -> bytes:
+        """Packs the item and location ids of a data package, which needs a checksum to be looked up by later."""
+        import array
+
+        blob = bytearray()
+        spans: typing.Dict[bytes, typing.Tuple[int, int]] = {}
+
+        def table(name_to_id: typing.Mapping[str, int]) -> typing.Tuple[array.array, array.array, array.array]:
+            rows = sorted((code, name.encode("utf-8")) for name, code in name_to_id.items())
+            ids, name_spans = array.array("q"), array.array("I")
+            for code, name in rows:
+                if name not in spans:
+                    spans[name] = len(blob), len(name)
+                    blob.extend(name)
+                ids.append(code)
+                name_spans.extend(spans[name])
+            order = array.array("I", sorted(range(len(rows)), key=lambda row: rows[row][1]))
+            return ids, name_spans, order
+
+        items = table(game_package["item_name_to_id"])
+        locations = table(game_package["location_name_to_id"])
+        checksum = game_package["checksum"].encode("ascii")
+        header = cls.header.pack(cls.magic, cls.version, len(checksum), len(items[0]), len(locations[0]), len(blob))
+        packed = bytearray(header + checksum)
+        packed.extend(bytes(cls._align(len(packed)) - len(packed)))
+        for part in zip(items, locations):
+            for values in part:
+                if sys.byteorder != "little":
+                    values.byteswap()
+                packed.extend(values.tobytes())
+        packed.extend(blob)
+        return bytes(packed)
@@ -31,6 +31,7 @@ if typing.TYPE_CHECKING:
     import tkinter
     import pathlib
     from BaseClasses import Region
+    from NetUtils import PackedDataPackage
     import multiprocessing
 
 
@@ -386,6 +387,45 @@ def store_data_package_for_checksum(game: str, data: typing.Dict[str, Any]) -> N
                 json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
         except Exception as e:
             logging.debug(f"Could not store data package: {e}")
+        store_packed_data_package(game, data)
+
+
+def store_packed_data_package(game: str, data: typing.Mapping[str, Any]) -> None:
+    """Stores the id tables of a data package with a checksum as NetUtils.PackedDataPackage."""
+    from NetUtils import PackedDataPackage
+
+    checksum = data["checksum"]
+    if checksum != get_file_safe_name(checksum):
+        raise ValueError(f"Bad symbols in checksum: {checksum}")
+    game_folder = cache_path("datapackage", get_file_safe_name(game))
+    path = os.path.join(game_folder, f"{checksum}.apdp")
+    try:
+        os.makedirs(game_folder, exist_ok=True)
+        # write beside and move into place, as other processes may have the file mapped already
+        with open(f"{path}.{os.getpid()}", "wb") as f:
+            f.write(PackedDataPackage.pack(data))
+        os.replace(f"{path}.{os.getpid()}", path)
+    except Exception as e:
+        logging.debug(f"Could not store packed data package: {e}")
+
+
+def load_packed_data_package(game: str, checksum: typing.Optional[str]) -> typing.Optional["PackedDataPackage"]:
+    """Memory-maps the stored id tables of a data package, None if there are none for checksum."""
+    from NetUtils import PackedDataPackage
+    import mmap
+
+    if not checksum or checksum != get_file_safe_name(checksum):
+        return None
+    path = cache_path("datapackage", get_file_safe_name(game), f"{checksum}.apdp")
+    try:
+        with open(path, "rb") as f:
+            packed = PackedDataPackage(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.debug(f"Could not load packed data package: {e}")
+        return None
+    return packed if packed.checksum == checksum else None
 
 
 def get_default_adjuster_settings(game_name: str) -> Namespace:
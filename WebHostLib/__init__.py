@@ -41,6 +41,11 @@ app.config["JOB_THRESHOLD"] = 1
 app.config["JOB_TIME"] = 600
 # memory limit for generator processes in bytes
 app.config["GENERATOR_MEMORY_LIMIT"] = 4294967296
+# how many of the GENERATORS only take large generations, at or above LARGE_GENERATION_COST (players + distinct games)
+app.config["LARGE_GENERATORS"] = 2
+app.config["LARGE_GENERATION_COST"] = 30
+# memory in bytes running generations are expected to fit in together, None for the system's total memory
+app.config["GENERATION_MEMORY_BUDGET"] = None
 app.config['SESSION_PERMANENT'] = True
 
 # waitress uses one thread for I/O, these are for processing of views that then get sent
@@ -53,6 +58,15 @@ app.config["PONY"] = {
     'create_db': True
 }
 app.config["MAX_ROLL"] = 20
+# how much compressed multidata, data packages and room saves trackers keep decoded in memory, in bytes
+app.config["TRACKER_MULTIDATA_CACHE_SIZE"] = 64 * 1024 * 1024
+app.config["TRACKER_DATA_PACKAGE_CACHE_SIZE"] = 16 * 1024 * 1024
+app.config["TRACKER_ROOM_SAVE_CACHE_SIZE"] = 64 * 1024 * 1024
+# how many live tracker event streams may be open at once, each one occupies a web thread, others poll instead.
+# live progress only reaches trackers served by the process that launched the room (SELFHOST and SELFLAUNCH together)
+app.config["TRACKER_EVENT_STREAMS"] = 4
+# seconds without connected clients after which a room hibernates, freeing its memory until a client connects again
+app.config["ROOM_HIBERNATION_DELAY"] = 5 * 60
 app.config["CACHE_TYPE"] = "SimpleCache"
 app.config["HOST_ADDRESS"] = ""
 app.config["ASSET_RIGHTS"] = False
@@ -83,3 +83,11 @@ def wait_seed_api(seed: UUID):
     elif generation.state == STATE_ERROR:
         return {"text": "Generation failed"}, 500
     return {"text": "Generation running"}, 202
+
+
+@api_endpoints.route('/generation_metrics')
+def generation_metrics_api():
+    from ..autolauncher import scheduler
+    if not scheduler:
+        return {"text": "Generations are not scheduled by this process"}, 404
+    return scheduler.get_metrics()
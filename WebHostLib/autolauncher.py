@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import collections
+import contextlib
+import dataclasses
 import json
 import logging
 import multiprocessing
+import time
 import typing
 from datetime import timedelta, datetime
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from typing import Any
 from uuid import UUID
 
@@ -36,16 +40,212 @@ def handle_generation_failure(result: BaseException):
         logging.exception(e)
 
 
-def _mp_gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None, sid=None) -> PrimaryKey | None:
+class MemorySampler:
+    """
+    Keeps track of the resident memory of this process from before (baseline) and the highest while in use (peak),
+    0 if psutil is not available.
+    """
+    baseline: int = 0
+    peak: int = 0
+    interval: float = 0.25
+
+    def __enter__(self) -> MemorySampler:
+        try:
+            import psutil
+        except ImportError:
+            return self
+        self._process = psutil.Process()
+        self.baseline = self.peak = self._process.memory_info().rss
+        self._stop = Event()
+        self._thread = Thread(target=self._sample, name="MemorySampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, self._process.memory_info().rss)
+            if self._stop.wait(self.interval):
+                return
+
+    def __exit__(self, *args) -> None:
+        if hasattr(self, "_thread"):
+            self._stop.set()
+            self._thread.join()
+
+
+def _mp_gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None, sid=None) \
+        -> tuple[PrimaryKey | None, int, int]:
     from setproctitle import setproctitle
 
     setproctitle(f"Generator ({sid})")
-    res = gen_game(gen_options, meta=meta, owner=owner, sid=sid)
+    with MemorySampler() as memory:
+        res = gen_game(gen_options, meta=meta, owner=owner, sid=sid)
     setproctitle(f"Generator (idle)")
-    return res
-
-
-def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
+    return res, memory.baseline, memory.peak
+
+
+def estimate_generation_cost(options: dict[str, dict[str, Any]]) -> int:
+    """Relative cost of generating a multiworld; every player adds a world and every distinct game its setup."""
+    return len(options) + len({settings.get("game") for settings in options.values()})
+
+
+@dataclasses.dataclass
+class GenerationLane:
+    name: str
+    pool: multiprocessing.pool.Pool
+    size: int
+    running: int = 0
+
+    @property
+    def free(self) -> bool:
+        return self.running < self.size
+
+
+@dataclasses.dataclass
+class GenerationJob:
+    id: UUID
+    owner: UUID
+    players: int
+    cost: int
+    queued: float  # time.monotonic() when the scheduler first saw the job
+    started: float = 0
+    lane: GenerationLane | None = None
+
+
+class GenerationScheduler:
+    """
+    Decides which queued Generations get a generator process.
+    Jobs at or above LARGE_GENERATION_COST only run in the large lane, so they can't hold up the small ones, while small
+    jobs may use idle large lane workers. Owners with the fewest running jobs go first, then the longest waiting job.
+    Jobs are only admitted while the memory they are expected to take fits the budget. That is an idle generator's
+    memory plus an amount per cost, both measured from finished jobs.
+    """
+    memory_samples = 20  # how many of the latest measured jobs make up the memory estimate
+    metrics_kept = 100
+
+    def __init__(self, config: dict[str, Any], small: GenerationLane, large: GenerationLane | None = None):
+        self.small = small
+        self.large = large
+        self.large_cost: int = config["LARGE_GENERATION_COST"]
+        self.memory_limit: int = config["GENERATOR_MEMORY_LIMIT"]
+        self.memory_budget: int | None = config["GENERATION_MEMORY_BUDGET"]
+        try:
+            import psutil
+        except ImportError:
+            logging.warning("psutil is not installed, so the memory of generations can't be measured and they are "
+                            "started without checking GENERATION_MEMORY_BUDGET.")
+        else:
+            if self.memory_budget is None:
+                self.memory_budget = psutil.virtual_memory().total
+        self.queued: dict[UUID, GenerationJob] = {}
+        self.running: dict[UUID, GenerationJob] = {}
+        self.memory_baseline: collections.deque[int] = collections.deque(maxlen=self.memory_samples)
+        self.memory_per_cost: collections.deque[float] = collections.deque(maxlen=self.memory_samples)
+        self.metrics: collections.deque[dict[str, Any]] = collections.deque(maxlen=self.metrics_kept)
+        self.lock = Lock()  # results arrive on the pools' result handler threads
+
+    def estimate_memory(self, job: GenerationJob) -> int:
+        if not self.memory_per_cost:
+            return 0
+        estimate = max(self.memory_baseline) + int(max(self.memory_per_cost) * job.cost)
+        return min(estimate, self.memory_limit) if self.memory_limit > 0 else estimate
+
+    def get_lane(self, job: GenerationJob) -> GenerationLane | None:
+        if self.large and job.cost >= self.large_cost:
+            return self.large if self.large.free else None
+        if self.small.free:
+            return self.small
+        if self.large and self.large.free:
+            return self.large
+        return None
+
+    def admits(self, job: GenerationJob) -> bool:
+        if not self.running or self.memory_budget is None:
+            return True
+        expected = sum(self.estimate_memory(running) for running in self.running.values())
+        return expected + self.estimate_memory(job) <= self.memory_budget
+
+    def next_job(self) -> typing.Iterator[GenerationJob]:
+        """Yields queued jobs fairest first, taking into account jobs started in between."""
+        waiting = dict(self.queued)
+        while waiting:
+            owners = collections.Counter(job.owner for job in self.running.values())
+            job = min(waiting.values(), key=lambda queued: (owners[queued.owner], queued.queued))
+            del waiting[job.id]
+            yield job
+
+    def schedule(self, generations: typing.Iterable[Generation]) -> None:
+        """Starts what it can of the given queued generations. Requires a db_session."""
+        generations = {generation.id: generation for generation in generations}
+        with self.lock:
+            for sid in self.queued.keys() - generations.keys():
+                del self.queued[sid]
+            for sid, generation in generations.items():
+                if sid not in self.queued:
+                    try:
+                        options = restricted_loads(generation.options)
+                    except Exception as e:
+                        generation.state = STATE_ERROR
+                        logging.exception(e)
+                        continue
+                    self.queued[sid] = GenerationJob(sid, generation.owner, len(options),
+                                                     estimate_generation_cost(options), time.monotonic())
+
+            for job in self.next_job():
+                lane = self.get_lane(job)
+                if not lane:
+                    continue
+                if not self.admits(job):
+                    break
+                del self.queued[job.id]
+                if launch_generator(lane.pool, generations[job.id], self.finished(job)):
+                    job.lane = lane
+                    job.started = time.monotonic()
+                    lane.running += 1
+                    self.running[job.id] = job
+
+    def finished(self, job: GenerationJob) -> typing.Callable[[typing.Any], None]:
+        def callback(result: tuple[PrimaryKey | None, int, int] | BaseException) -> None:
+            with self.lock:
+                self.running.pop(job.id)
+                job.lane.running -= 1
+                wait, run = job.started - job.queued, time.monotonic() - job.started
+                if isinstance(result, BaseException):
+                    peak = 0
+                    handle_generation_failure(result)
+                else:
+                    seed_id, baseline, peak = result
+                    handle_generation_success(seed_id)
+                    if peak:
+                        self.memory_baseline.append(baseline)
+                        self.memory_per_cost.append((peak - baseline) / job.cost)
+                self.metrics.append({"id": job.id, "players": job.players, "cost": job.cost, "lane": job.lane.name,
+                                     "queue_time": wait, "run_time": run, "memory": peak,
+                                     "success": not isinstance(result, BaseException)})
+            logging.info(f"Generation {job.id} ({job.players} players, {job.lane.name} lane) "
+                         f"waited {wait:.1f}s, ran {run:.1f}s")
+        return callback
+
+    def get_metrics(self) -> dict[str, Any]:
+        with self.lock:
+            now = time.monotonic()
+            return {
+                "queued": [{"id": job.id, "players": job.players, "cost": job.cost, "queue_time": now - job.queued}
+                           for job in self.queued.values()],
+                "running": [{"id": job.id, "players": job.players, "cost": job.cost, "lane": job.lane.name,
+                             "queue_time": job.started - job.queued, "run_time": now - job.started}
+                            for job in self.running.values()],
+                "finished": list(self.metrics),
+                "lanes": {lane.name: {"workers": lane.size, "running": lane.running}
+                          for lane in (self.small, self.large) if lane},
+            }
+
+
+scheduler: GenerationScheduler | None = None  # set while autogen runs in this process
+
+
+def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation,
+                     callback: typing.Callable[[typing.Any], None]) -> bool:
     try:
         meta = json.loads(generation.meta)
         options = restricted_loads(generation.options)
@@ -54,13 +254,28 @@ def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
                          {"meta": meta,
                           "sid": generation.id,
                           "owner": generation.owner},
-                         handle_generation_success, handle_generation_failure)
+                         callback, callback)
     except Exception as e:
         generation.state = STATE_ERROR
         commit()
         logging.exception(e)
+        return False
     else:
         generation.state = STATE_STARTED
+        return True
+
+
+def get_generator_context() -> multiprocessing.context.BaseContext:
+    """
+    Where the platform supports it, generator processes get forked from a server process that already imported all
+    worlds, so they can start right away. Then each process only runs a single generation, so that no module state can
+    carry over from one seed into the next.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["__main__", "worlds", "WebHostLib.autolauncher"])
+        return context
+    return multiprocessing.get_context("spawn")
 
 
 def init_generator(config: dict[str, Any]) -> None:
@@ -112,14 +327,19 @@ def autohost(config: dict):
                     hoster.start()
 
                 while not stop_event.wait(0.1):
+                    for hoster in hosters:
+                        hoster.forward_progress()
+                        hoster.collect_shut_down_rooms()
+                    hosted = set().union(*(hoster.room_ids for hoster in hosters))
                     with db_session:
                         rooms = select(
                             room for room in Room if
                             room.last_activity >= datetime.utcnow() - timedelta(days=3))
                         for room in rooms:
                             # we have to filter twice, as the per-room timeout can't currently be PonyORM transpiled.
-                            if room.last_activity >= datetime.utcnow() - timedelta(seconds=room.timeout + 5):
-                                hosters[room.id.int % len(hosters)].start_room(room.id)
+                            if room.id not in hosted and \
+                                    room.last_activity >= datetime.utcnow() - timedelta(seconds=room.timeout + 5):
+                                get_least_loaded(hosters).start_room(room.id)
 
         except AlreadyRunningException:
             logging.info("Autohost reports as already running, not starting another.")
@@ -129,12 +349,20 @@ def autohost(config: dict):
 
 def autogen(config: dict):
     def keep_running():
+        global scheduler
         stop_event = _stop_event
         try:
             with Locker("autogen"):
-
-                with multiprocessing.Pool(config["GENERATORS"], initializer=init_generator,
-                                          initargs=(config,), maxtasksperchild=10) as generator_pool:
+                large_workers = min(config["LARGE_GENERATORS"], config["GENERATORS"] - 1)
+                small_workers = config["GENERATORS"] - large_workers
+                context = get_generator_context()
+                jobs_per_worker = 1 if context.get_start_method() == "forkserver" else 10
+                with contextlib.ExitStack() as pools:
+                    lanes = [GenerationLane(name, pools.enter_context(
+                        context.Pool(workers, initializer=init_generator,
+                                     initargs=(config,), maxtasksperchild=jobs_per_worker)), workers)
+                             for name, workers in (("small", small_workers), ("large", large_workers)) if workers]
+                    scheduler = GenerationScheduler(config, *lanes)
                     with db_session:
                         to_start = select(generation for generation in Generation if generation.state == STATE_STARTED)
 
@@ -145,7 +373,7 @@ def autogen(config: dict):
                                 if sid:
                                     generation.delete()
                                 else:
-                                    launch_generator(generator_pool, generation)
+                                    generation.state = STATE_QUEUED
 
                             commit()
                         select(generation for generation in Generation if generation.state == STATE_ERROR).delete()
@@ -153,17 +381,30 @@ def autogen(config: dict):
                     while not stop_event.wait(0.1):
                         with db_session:
                             # for update locks the database row(s) during transaction, preventing writes from elsewhere
-                            to_start = select(
+                            scheduler.schedule(select(
                                 generation for generation in Generation
-                                if generation.state == STATE_QUEUED).for_update()
-                            for generation in to_start:
-                                launch_generator(generator_pool, generation)
+                                if generation.state == STATE_QUEUED).for_update())
+                    scheduler = None
         except AlreadyRunningException:
             logging.info("Autogen reports as already running, not starting another.")
 
     Thread(target=keep_running, name="AP_Autogen").start()
 
 
+def get_least_loaded(hosters: typing.Sequence[MultiworldInstance]) -> MultiworldInstance:
+    """
+    Picks the hoster to start a new room on, by its rooms, connected clients and memory relative to the average hoster.
+    Rooms are counted right away, while the others are only as recent as the hosters' last report.
+    """
+    loads = [(len(hoster.room_ids), hoster.load[1], hoster.load[2]) for hoster in hosters]
+    totals = [sum(column) for column in zip(*loads)]
+
+    def relative_load(index: int) -> float:
+        return sum(value / total for value, total in zip(loads[index], totals) if total)
+
+    return hosters[min(range(len(hosters)), key=relative_load)]
+
+
 multiworlds: typing.Dict[type(Room.id), MultiworldInstance] = {}
 
 
@@ -175,8 +416,11 @@ class MultiworldInstance():
         self.cert = config["SELFLAUNCHCERT"]
         self.key = config["SELFLAUNCHKEY"]
         self.host = config["HOST_ADDRESS"]
+        self.hibernation_delay = config["ROOM_HIBERNATION_DELAY"]
         self.rooms_to_start = multiprocessing.Queue()
         self.rooms_shutting_down = multiprocessing.Queue()
+        self.room_progress = multiprocessing.Queue()  # progress for live trackers, see WebHostContext.get_progress
+        self.load = multiprocessing.Array("q", 3, lock=False)  # rooms, connections and memory the hoster reports
         self.name = f"MultiHoster{id}"
 
     def start(self):
@@ -186,20 +430,29 @@ class MultiworldInstance():
         process = multiprocessing.Process(group=None, target=run_server_process,
                                           args=(self.name, self.ponyconfig, get_static_server_data(),
                                                 self.cert, self.key, self.host,
-                                                self.rooms_to_start, self.rooms_shutting_down),
+                                                self.rooms_to_start, self.rooms_shutting_down, self.room_progress,
+                                                self.load, self.hibernation_delay),
                                           name=self.name)
         process.start()
         self.process = process
 
-    def start_room(self, room_id):
+    def collect_shut_down_rooms(self):
         while not self.rooms_shutting_down.empty():
             self.room_ids.remove(self.rooms_shutting_down.get(block=True, timeout=None))
+
+    def start_room(self, room_id):
+        self.collect_shut_down_rooms()
         if room_id in self.room_ids:
             pass  # should already be hosted currently.
         else:
             self.room_ids.add(room_id)
             self.rooms_to_start.put(room_id)
 
+    def forward_progress(self):
+        """Applies the progress published by this hoster's rooms to their live trackers."""
+        while not self.room_progress.empty():
+            apply_room_progress(*self.room_progress.get(block=True, timeout=None))
+
     def stop(self):
         if self.process:
             self.process.terminate()
@@ -216,3 +469,4 @@ class MultiworldInstance():
 from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed, Slot
 from .customserver import run_server_process, get_static_server_data
 from .generate import gen_game
+from .tracker import apply_room_progress
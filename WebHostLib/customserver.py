@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import dataclasses
 import datetime
-import functools
 import logging
 import multiprocessing
 import pickle
@@ -13,16 +13,23 @@ import threading
 import time
 import typing
 import sys
+import zlib
+from uuid import UUID
 
 import websockets
 from pony.orm import commit, db_session, select
 
 import Utils
 
-from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, load_server_cert
+from MultiServer import Context, SaveJournal, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, \
+    init_game_names, load_server_cert
+from NetUtils import ClientStatus
 from Utils import restricted_loads, cache_argsless
 from .locker import Locker
-from .models import Command, GameDataPackage, Room, db
+from .models import Command, GameDataPackage, Room, SaveDelta, TrackerAggregates, db
+
+if typing.TYPE_CHECKING:
+    from .tracker import RoomAggregates
 
 
 class CustomClientMessageProcessor(ClientMessageProcessor):
@@ -57,8 +64,50 @@ class DBCommandProcessor(ServerCommandProcessor):
         self.ctx.logger.info(text)
 
 
+@dataclasses.dataclass(frozen=True)
+class ResumeImage:
+    """What a hibernating room needs to resume without the database, its multidata and save kept compressed."""
+    room_id: int
+    tracker_id: UUID
+    port: int
+    auto_shutdown: int
+    deadline: datetime.datetime
+    """when the room shuts down for inactivity, if no client connects before"""
+    multidata: bytes
+    game_data: typing.Dict[str, bytes]
+    """GameDataPackage.data by checksum"""
+    save: typing.Optional[bytes]
+
+
+class StaticGameNames:
+    """Names looked up from the static data packages once per hoster process, for all of its rooms to share."""
+    item_names: typing.Dict[str, typing.MutableMapping[int, str]]
+    location_names: typing.Dict[str, typing.MutableMapping[int, str]]
+    all_item_and_group_names: typing.Dict[str, typing.Set[str]]
+    all_location_and_group_names: typing.Dict[str, typing.Set[str]]
+
+    def __init__(self, static_server_data: dict):
+        self.gamespackage = static_server_data["gamespackage"]
+        self.item_names = collections.defaultdict(
+            lambda: Utils.KeyedDefaultDict(lambda code: f'Unknown item (ID:{code})'))
+        self.location_names = collections.defaultdict(
+            lambda: Utils.KeyedDefaultDict(lambda code: f'Unknown location (ID:{code})'))
+        self.all_item_and_group_names = {}
+        self.all_location_and_group_names = {}
+        init_game_names(self.gamespackage, static_server_data["item_name_groups"],
+                        static_server_data["location_name_groups"], self.item_names, self.location_names,
+                        self.all_item_and_group_names, self.all_location_and_group_names)
+
+
 class WebHostContext(Context):
     room_id: int
+    tracker_id: UUID
+    static_names: typing.Optional[StaticGameNames] = None  # set up by run_server_process
+    # receives the progress trackers need from running rooms, see get_progress
+    progress_queue: typing.Optional[multiprocessing.Queue] = None
+    progress_interval = 0.5  # seconds between publishing progress, batching everything that happened in between
+    multidata_record: bytes  # kept compressed for hibernation, along with the game_data_records by checksum
+    game_data_records: typing.Dict[str, bytes]
 
     def __init__(self, static_server_data: dict, logger: logging.Logger):
         # static server data is used during _load_game_data to load required data,
@@ -71,6 +120,11 @@ class WebHostContext(Context):
         self.main_loop = asyncio.get_running_loop()
         self.video = {}
         self.tags = ["AP", "WebHost"]
+        self.save_journal = SaveJournal(pickle.dumps)
+        self.published_progress: typing.Dict[str, typing.Any] = collections.defaultdict(dict)
+        self.progress_handle: typing.Optional[asyncio.TimerHandle] = None
+        # received items by id per slot and how many of the slot's items they count, see get_aggregates
+        self.aggregated_items: typing.Dict[typing.Tuple[int, int, bool], typing.Tuple[int, typing.Counter[int]]] = {}
 
     def __del__(self):
         try:
@@ -86,6 +140,21 @@ class WebHostContext(Context):
             setattr(self, key, value)
         self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
 
+    def _init_game_names(self, games: typing.Dict[str, typing.Dict[str, typing.Any]]):
+        if not self.static_names:
+            return super(WebHostContext, self)._init_game_names(games)
+        custom_games = {}
+        for game_name, game_package in games.items():
+            if game_package is self.static_names.gamespackage.get(game_name):
+                self.item_names[game_name] = self.static_names.item_names[game_name]
+                self.location_names[game_name] = self.static_names.location_names[game_name]
+                self.all_item_and_group_names[game_name] = self.static_names.all_item_and_group_names[game_name]
+                self.all_location_and_group_names[game_name] = \
+                    self.static_names.all_location_and_group_names[game_name]
+            else:
+                custom_games[game_name] = game_package
+        super(WebHostContext, self)._init_game_names(custom_games)
+
     def listen_to_db_commands(self):
         cmdprocessor = DBCommandProcessor(self)
 
@@ -103,12 +172,49 @@ class WebHostContext(Context):
     def load(self, room_id: int):
         self.room_id = room_id
         room = Room.get(id=room_id)
+        self.tracker_id = room.tracker
         if room.last_port:
             self.port = room.last_port
         else:
             self.port = get_random_port()
 
-        multidata = self.decompress(room.seed.multidata)
+        def get_game_data(checksum: str) -> typing.Optional[bytes]:
+            row = GameDataPackage.get(checksum=checksum)
+            return row.data if row else None
+
+        return self._load_multidata(room.seed.multidata, get_game_data)
+
+    def resume(self, image: ResumeImage):
+        """Loads a hibernated room again, from its resume image instead of the database."""
+        self.room_id = image.room_id
+        self.tracker_id = image.tracker_id
+        self.port = image.port
+        self.auto_shutdown = image.auto_shutdown
+        self._load_multidata(image.multidata, image.game_data.get)
+        self.saving = image.save is not None
+        if self.saving:
+            self.set_save(restricted_loads(zlib.decompress(image.save)))
+            self._start_async_saving(atexit_save=False)
+        threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
+
+    def hibernate(self, deadline: datetime.datetime) -> ResumeImage:
+        """Saves the room and stops its threads, returning what it takes to resume it. This Context is done after."""
+        self.save_dirty = False
+        self.exit_event.set()
+        if self.saving:
+            self._save(True)
+        if self.progress_queue:
+            if self.progress_handle:
+                self.progress_handle.cancel()
+            self.progress_queue.put((self.tracker_id, None))  # trackers read the database while the room sleeps
+        return ResumeImage(self.room_id, self.tracker_id, self.port, self.auto_shutdown, deadline,
+                           self.multidata_record, self.game_data_records,
+                           zlib.compress(pickle.dumps(self.get_save())) if self.saving else None)
+
+    def _load_multidata(self, record: bytes, get_game_data: typing.Callable[[str], typing.Optional[bytes]]):
+        self.multidata_record = record
+        self.game_data_records = {}
+        multidata = self.decompress(record)
         game_data_packages = {}
 
         static_gamespackage = self.gamespackage  # this is shared across all rooms
@@ -127,9 +233,10 @@ class WebHostContext(Context):
                     # games package could be dropped from static data once all rooms embed data package
                     del multidata["datapackage"][game]
                 else:
-                    row = GameDataPackage.get(checksum=game_data["checksum"])
-                    if row:  # None if rolled on >= 0.3.9 but uploaded to <= 0.3.8. multidata should be complete
-                        game_data_packages[game] = Utils.restricted_loads(row.data)
+                    data = get_game_data(game_data["checksum"])
+                    if data:  # None if rolled on >= 0.3.9 but uploaded to <= 0.3.8. multidata should be complete
+                        self.game_data_records[game_data["checksum"]] = data
+                        game_data_packages[game] = Utils.restricted_loads(data)
                         continue
                     else:
                         self.logger.warning(f"Did not find game_data_package for {game}: {game_data['checksum']}")
@@ -150,27 +257,139 @@ class WebHostContext(Context):
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
-            savegame_data = Room.get(id=self.room_id).multisave
+            savegame_data = load_room_save(Room.get(id=self.room_id))
             if savegame_data:
-                self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
+                self.set_save(savegame_data)
             self._start_async_saving(atexit_save=False)
         threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
 
-    @db_session
     def _save(self, exit_save: bool = False) -> bool:
-        room = Room.get(id=self.room_id)
-        room.multisave = pickle.dumps(self.get_save())
-        # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
-        if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
-            room.last_activity = datetime.datetime.utcnow()
+        try:
+            with db_session:
+                room = Room.get(id=self.room_id)
+                snapshot, record = self.get_save_record(exit_save)
+                if snapshot:
+                    room.multisave = record
+                    room.save_deltas.select().delete(bulk=True)
+                elif record:
+                    SaveDelta(room=room, data=record)
+                if snapshot or record:
+                    aggregates = self.get_aggregates().to_record()
+                    if room.tracker_aggregates:
+                        room.tracker_aggregates.data = aggregates
+                    else:
+                        TrackerAggregates(room=room, data=aggregates)
+                # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
+                if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server
+                    room.last_activity = datetime.datetime.utcnow()
+        except BaseException:
+            self.save_journal.reset()
+            raise
+        self.save_journal.commit()
         return True
 
+    def save(self, now: bool = False) -> bool:
+        # everything trackers show is followed by a save, so that also schedules publishing it
+        if self.progress_queue and not self.progress_handle:
+            self.progress_handle = self.main_loop.call_later(self.progress_interval, self.publish_progress)
+        return super(WebHostContext, self).save(now)
+
+    def publish_progress(self) -> None:
+        self.progress_handle = None
+        progress = self.get_progress()
+        if progress:
+            self.progress_queue.put((self.tracker_id, progress))
+
+    def get_progress(self) -> typing.Dict[str, typing.Any]:
+        """Returns the changes to the save data sections used by trackers since the last call.
+        Per slot, checks contain the new locations, received items the index of the first new item and the new items,
+        hints and client status their new value. Other sections are small and get sent whole if they changed."""
+        published = self.published_progress
+        progress: typing.Dict[str, typing.Any] = {}
+
+        checks = {}
+        for key, locations in self.location_checks.items():
+            published_locations = published["location_checks"].get(key, set())
+            if len(locations) != len(published_locations):
+                checks[key] = locations - published_locations
+                published["location_checks"][key] = set(locations)
+        if checks:
+            progress["location_checks"] = checks
+
+        received_items = {}
+        for key, items in self.received_items.items():
+            start = published["received_items"].get(key, 0)
+            if key[2] and len(items) > start:  # trackers only show items including those found by the slot itself
+                received_items[key] = start, items[start:]
+                published["received_items"][key] = len(items)
+        if received_items:
+            progress["received_items"] = received_items
+
+        hints = {key: set(slot_hints) for key, slot_hints in self.hints.items()
+                 if slot_hints != published["hints"].get(key, set())}
+        if hints:
+            progress["hints"] = hints
+            published["hints"].update(hints)
+
+        client_game_state = {key: status for key, status in self.client_game_state.items()
+                             if status != published["client_game_state"].get(key)}
+        if client_game_state:
+            progress["client_game_state"] = client_game_state
+            published["client_game_state"].update(client_game_state)
+
+        for section, value in (
+                ("name_aliases", dict(self.name_aliases)),
+                ("client_activity_timers",
+                 tuple((key, value.timestamp()) for key, value in self.client_activity_timers.items())),
+                ("video", [(tuple(playerslot), videodata) for playerslot, videodata in self.video.items()])):
+            if value != published.get(section):
+                progress[section] = published[section] = value
+        return progress
+
+    def get_aggregates(self) -> RoomAggregates:
+        """Returns the tracker aggregates of the current save data. Only items received since the last call get
+        counted, everything else takes a step per slot."""
+        from .tracker import RoomAggregates
+
+        inventories = {}
+        for key, items in self.received_items.items():
+            if not key[2]:  # trackers only show items including those found by the slot itself
+                continue
+            counted, inventory = self.aggregated_items.get(key, (0, collections.Counter()))
+            if counted > len(items):  # the save was replaced
+                counted, inventory = 0, collections.Counter()
+            if counted < len(items):
+                inventory = inventory + collections.Counter(item.item for item in items[counted:])
+                self.aggregated_items[key] = len(items), inventory
+            inventories[key[:2]] = inventory
+        return RoomAggregates(
+            {key: len(locations) for key, locations in self.location_checks.items()},
+            inventories,
+            {key for key, status in self.client_game_state.items() if status == ClientStatus.CLIENT_GOAL},
+            {key: value.timestamp() for key, value in self.client_activity_timers.items()},
+        )
+
     def get_save(self) -> dict:
         d = super(WebHostContext, self).get_save()
         d["video"] = [(tuple(playerslot), videodata) for playerslot, videodata in self.video.items()]
         return d
 
 
+def load_room_save(room: Room) -> typing.Optional[dict]:
+    """Loads the save data of a room, with the changes saved since its last snapshot applied."""
+    if not room.multisave:
+        return None
+    savedata = restricted_loads(room.multisave)
+    for delta in room.save_deltas.select().order_by(SaveDelta.id):
+        SaveJournal.apply_save_delta(savedata, restricted_loads(delta.data))
+    return savedata
+
+
+def has_pending_commands(room_id: int) -> bool:
+    with db_session:
+        return select(command for command in Command if command.room.id == room_id).exists()
+
+
 def get_random_port():
     return random.randint(49152, 65535)
 
@@ -226,7 +445,10 @@ def set_up_logging(room_id) -> logging.Logger:
 
 def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                        cert_file: typing.Optional[str], cert_key_file: typing.Optional[str],
-                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue):
+                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue,
+                       room_progress: typing.Optional[multiprocessing.Queue] = None,
+                       hoster_load: typing.Optional[typing.MutableSequence[int]] = None,
+                       hibernation_delay: typing.Optional[float] = None):
     from setproctitle import setproctitle
 
     setproctitle(name)
@@ -266,29 +488,90 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 load_date = today
             return ssl_context
 
+    WebHostContext.static_names = StaticGameNames(static_server_data)
+
     del ponyconfig
     gc.collect()  # free intermediate objects used during setup
+    gc.freeze()  # static data lives as long as the process, keep it out of collections for all the rooms' sake
 
     loop = asyncio.get_event_loop()
+    contexts: typing.Set[WebHostContext] = set()  # of the rooms that are not hibernating
+    hosted_rooms: typing.Set[int] = set()
+
+    async def report_load():
+        """Lets the autolauncher know rooms, connections and memory of this process, to place new rooms by."""
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        while True:
+            memory = psutil.Process().memory_info().rss if psutil else 0
+            hoster_load[:] = [len(hosted_rooms), sum(len(ctx.endpoints) for ctx in contexts), memory]
+            await asyncio.sleep(5)
+
+    async def wait_for_quiet(ctx: WebHostContext):
+        """Returns once no client was connected to the room for hibernation_delay seconds."""
+        quiet_since = time.monotonic()
+        while True:
+            if ctx.endpoints:
+                quiet_since = time.monotonic()
+                await asyncio.sleep(hibernation_delay)
+            else:
+                remaining = quiet_since + hibernation_delay - time.monotonic()
+                if remaining <= 0:
+                    return
+                await asyncio.sleep(remaining)
 
     async def start_room(room_id):
         with Locker(f"RoomLocker {room_id}"):
+            hosted_rooms.add(room_id)
+            ctx: typing.Optional[WebHostContext] = None
+            image: typing.Optional[ResumeImage] = None
+            woken = asyncio.Event()
+            room_task = asyncio.current_task()
+
+            def run_context(new_ctx: WebHostContext):
+                nonlocal ctx
+                ctx = new_ctx
+                contexts.add(ctx)
+                if room_progress:
+                    ctx.progress_queue = room_progress
+                    ctx.publish_progress()
+                if ctx.saving:
+                    setattr(room_task, "save", lambda: ctx._save(True))
+
+            def wake(reason: str):
+                nonlocal image
+                resumed = WebHostContext(static_server_data, logger)
+                resumed.resume(image)
+                resumed.server = ws_server
+                image = None
+                run_context(resumed)
+                logger.info(f"Resumed from hibernation, {reason}.")
+                woken.set()
+
+            async def serve(websocket, path: str = "/"):
+                if image:  # a client is back, resume the room before anything else happens
+                    wake("a client connected")
+                await server(websocket, path, ctx)
+
             try:
                 logger = set_up_logging(room_id)
-                ctx = WebHostContext(static_server_data, logger)
-                ctx.load(room_id)
-                ctx.init_save()
+                started = datetime.datetime.now(datetime.timezone.utc)
+                new_ctx = WebHostContext(static_server_data, logger)
+                new_ctx.load(room_id)
+                new_ctx.init_save()
+                run_context(new_ctx)
                 assert ctx.server is None
                 try:
-                    ctx.server = websockets.serve(
-                        functools.partial(server, ctx=ctx), ctx.host, ctx.port, ssl=get_ssl_context())
+                    ctx.server = websockets.serve(serve, ctx.host, ctx.port, ssl=get_ssl_context())
 
                     await ctx.server
                 except OSError:  # likely port in use
-                    ctx.server = websockets.serve(
-                        functools.partial(server, ctx=ctx), ctx.host, 0, ssl=get_ssl_context())
+                    ctx.server = websockets.serve(serve, ctx.host, 0, ssl=get_ssl_context())
 
                     await ctx.server
+                ws_server = ctx.server
                 port = 0
                 for wssocket in ctx.server.ws_server.sockets:
                     socketname = wssocket.getsockname()
@@ -300,6 +583,7 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                         port = socketname[1]
                 if port:
                     ctx.logger.info(f'Hosting game at {host}:{port}')
+                    ctx.port = port
                     with db_session:
                         room = Room.get(id=ctx.room_id)
                         room.last_port = port
@@ -307,14 +591,43 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                     ctx.logger.exception("Could not determine port. Likely hosting failure.")
                 with db_session:
                     ctx.auto_shutdown = Room.get(id=room_id).timeout
-                if ctx.saving:
-                    setattr(asyncio.current_task(), "save", lambda: ctx._save(True))
-                assert ctx.shutdown_task is None
-                ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, []))
-                await ctx.shutdown_task
+                while True:
+                    assert ctx.shutdown_task is None
+                    ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, []))
+                    if not hibernation_delay:
+                        await ctx.shutdown_task
+                        break
+                    quiet = asyncio.create_task(wait_for_quiet(ctx))
+                    await asyncio.wait((ctx.shutdown_task, quiet), return_when=asyncio.FIRST_COMPLETED)
+                    if ctx.shutdown_task.done():
+                        quiet.cancel()
+                        break
+                    # free the room's memory until a client connects again, while keeping its port open
+                    ctx.shutdown_task.cancel()
+                    last_activity = max(ctx.client_activity_timers.values(), default=started)
+                    image = ctx.hibernate(max(last_activity, started) + datetime.timedelta(seconds=ctx.auto_shutdown))
+                    setattr(room_task, "save", None)
+                    contexts.discard(ctx)
+                    ctx = None
+                    woken.clear()
+                    logger.info("Hibernating.")
+                    while not woken.is_set():
+                        timeout = (image.deadline - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+                        if timeout <= 0:
+                            break
+                        try:
+                            await asyncio.wait_for(woken.wait(), min(timeout, 5))
+                        except asyncio.TimeoutError:
+                            # only running rooms process commands, so commands sent to this room have to wake it
+                            if await loop.run_in_executor(None, has_pending_commands, room_id):
+                                wake("commands are pending")
+                    if not woken.is_set():
+                        ws_server.ws_server.close()
+                        logger.info("Shutting down due to inactivity.")
+                        break
 
             except (KeyboardInterrupt, SystemExit):
-                if ctx.saving:
+                if ctx and ctx.saving:
                     ctx._save()
                     setattr(asyncio.current_task(), "save", None)
             except Exception as e:
@@ -324,13 +637,14 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                 logger.exception(e)
                 raise
             else:
-                if ctx.saving:
+                if ctx and ctx.saving:
                     ctx._save()
                     setattr(asyncio.current_task(), "save", None)
             finally:
                 try:
-                    ctx.save_dirty = False  # make sure the saving thread does not write to DB after final wakeup
-                    ctx.exit_event.set()  # make sure the saving thread stops at some point
+                    if ctx:
+                        ctx.save_dirty = False  # make sure the saving thread does not write to DB after final wakeup
+                        ctx.exit_event.set()  # make sure the saving thread stops at some point
                     # NOTE: async saving should probably be an async task and could be merged with shutdown_task
                     with (db_session):
                         # ensure the Room does not spin up again on its own, minute of safety buffer
@@ -338,7 +652,14 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                         room.last_activity = datetime.datetime.utcnow() - \
                                              datetime.timedelta(minutes=1, seconds=room.timeout)
                     logging.info(f"Shutting down room {room_id} on {name}.")
+                    if ctx and ctx.progress_queue:
+                        if ctx.progress_handle:
+                            ctx.progress_handle.cancel()
+                        ctx.progress_queue.put((ctx.tracker_id, None))  # trackers read the final save from now on
                 finally:
+                    if ctx:
+                        contexts.discard(ctx)
+                    hosted_rooms.discard(room_id)
                     await asyncio.sleep(5)
                     rooms_shutting_down.put(room_id)
 
@@ -366,6 +687,8 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
     starter = Starter()
     starter.daemon = True
     starter.start()
+    if hoster_load is not None:
+        load_reporter = loop.create_task(report_load())  # noqa: F841 keep a reference, the loop doesn't
     try:
         loop.run_forever()
     finally:
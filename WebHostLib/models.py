@@ -15,7 +15,7 @@ class Slot(db.Entity):
     player_name = Required(str)
     data = Optional(bytes, lazy=True)
     seed = Optional('Seed')
-    game = Required(str)
+    game = Required(str, index=True)  # index used by stats
 
 
 class Room(db.Entity):
@@ -26,6 +26,8 @@ class Room(db.Entity):
     commands = Set('Command')
     seed = Required('Seed', index=True)
     multisave = Optional(buffer, lazy=True)
+    save_deltas = Set('SaveDelta')  # changes since multisave, compacted into it by the room's server
+    tracker_aggregates = Optional('TrackerAggregates', cascade_delete=True)  # per-player totals of the save, written along with it
     show_spoiler = Required(int, default=0)  # 0 -> never, 1 -> after completion, -> 2 always
     timeout = Required(int, default=lambda: 2 * 60 * 60)  # seconds since last activity to shutdown
     tracker = Optional(UUID, index=True)
@@ -33,6 +35,17 @@ class Room(db.Entity):
     last_port = Optional(int, default=lambda: 0)
 
 
+class SaveDelta(db.Entity):
+    id = PrimaryKey(int, auto=True)
+    room = Required(Room, index=True)
+    data = Required(buffer)
+
+
+class TrackerAggregates(db.Entity):
+    room = PrimaryKey(Room)
+    data = Required(buffer)
+
+
 class Seed(db.Entity):
     id = PrimaryKey(UUID, default=uuid4)
     rooms = Set(Room)
@@ -169,6 +169,20 @@ window.addEventListener('load', () => {
     }
     let updater = setTimeout(update, getSleepTimeSeconds() * 1000);
 
+    // Running rooms announce progress as it happens. If the server asks to poll instead, the timer above remains.
+    if (window.EventSource) {
+        const tracker = document.getElementById('tracker-wrapper').getAttribute('data-tracker').split('/')[0];
+        const events = new EventSource(`/tracker/${tracker}/events`);
+        events.onmessage = () => {
+            clearTimeout(updater);
+            update();
+        };
+        events.addEventListener('poll', (event) => {
+            console.log(`Live tracker updates unavailable (${event.data}), refreshing periodically.`);
+            events.close();
+        });
+    }
+
     window.addEventListener('resize', () => {
         adjustTableHeight();
         tables.draw();
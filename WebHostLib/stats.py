@@ -10,10 +10,10 @@ from bokeh.models import HoverTool
 from bokeh.plotting import figure, ColumnDataSource
 from bokeh.resources import INLINE
 from flask import render_template
-from pony.orm import select
+from pony.orm import count, select
 
 from . import app, cache
-from .models import Room
+from .models import Room, Slot
 
 PLOT_WIDTH = 600
 
@@ -23,12 +23,13 @@ def get_db_data(known_games: typing.Set[str]) -> typing.Tuple[typing.Counter[str
     games_played = defaultdict(Counter)
     total_games = Counter()
     cutoff = date.today() - timedelta(days=30)
-    room: Room
-    for room in select(room for room in Room if room.creation_time >= cutoff):
-        for slot in room.seed.slots:
-            if slot.game in known_games:
-                total_games[slot.game] += 1
-                games_played[room.creation_time.date()][slot.game] += 1
+    # count slots per day and game in the database, instead of walking the slots of every room
+    for year, month, day, game, played in select(
+            (room.creation_time.year, room.creation_time.month, room.creation_time.day, slot.game, count())
+            for room in Room for slot in Slot if slot.seed == room.seed and room.creation_time >= cutoff):
+        if game in known_games:
+            total_games[game] += played
+            games_played[date(year, month, day)][game] += played
     return total_games, games_played
 
 
@@ -1,7 +1,10 @@
 import datetime
+import pickle
 import collections
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, NamedTuple, Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, NamedTuple, Counter
 from uuid import UUID
 from email.utils import parsedate_to_datetime
 
@@ -12,12 +15,12 @@ from MultiServer import Context, get_saving_second
 from NetUtils import ClientStatus, Hint, NetworkItem, NetworkSlot, SlotType
 from Utils import restricted_loads, KeyedDefaultDict
 from . import app, cache
-from .models import GameDataPackage, Room
+from .customserver import load_room_save
+from .models import GameDataPackage, Room, Seed
 
 # Multisave is currently updated, at most, every minute.
 TRACKER_CACHE_TIMEOUT_IN_SECONDS = 60
 
-_multidata_cache = {}
 _multiworld_trackers: Dict[str, Callable] = {}
 _player_trackers: Dict[str, Callable] = {}
 
@@ -25,6 +28,230 @@ TeamPlayer = Tuple[int, int]
 ItemMetadata = Tuple[int, int, int]
 
 
+class _SizedLRUCache:
+    """Thread-safe least recently used cache, evicting entries once the sum of their sizes exceeds the app.config
+    value of max_size_option, which is read on use so it can be configured after import."""
+
+    def __init__(self, max_size_option: str):
+        self.max_size_option = max_size_option
+        self.size = 0
+        self._entries: collections.OrderedDict[Hashable, Tuple[Any, int]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, load: Callable[[], Tuple[Any, int]]) -> Any:
+        """Returns the value for key, using load to create it and its size if it is not cached."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+        # load outside the lock, so slow loads don't block other lookups; concurrent misses may load twice
+        value, size = load()
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            self._entries[key] = value, size
+            self.size += size
+            max_size = app.config[self.max_size_option]
+            while self.size > max_size and len(self._entries) > 1:
+                self.size -= self._entries.popitem(last=False)[1][1]
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+@dataclass(frozen=True)
+class DecodedDataPackage:
+    """A game's data package from the database with its reverse lookups, shared by all trackers."""
+    item_name_to_id: Dict[str, int]
+    location_name_to_id: Dict[str, int]
+    item_id_to_name: Dict[int, str]
+    location_id_to_name: Dict[int, str]
+
+
+# sizes are measured in compressed bytes as stored in the database
+_multidata_cache = _SizedLRUCache("TRACKER_MULTIDATA_CACHE_SIZE")
+_data_package_cache = _SizedLRUCache("TRACKER_DATA_PACKAGE_CACHE_SIZE")
+_room_save_cache = _SizedLRUCache("TRACKER_ROOM_SAVE_CACHE_SIZE")
+
+
+def get_seed_multidata(seed: Seed) -> Dict[str, Any]:
+    """Returns the decoded multidata of a seed, shared between requests. It must not be modified."""
+    def load() -> Tuple[Dict[str, Any], int]:
+        multidata = seed.multidata
+        return Context.decompress(multidata), len(multidata)
+
+    return _multidata_cache.get(seed.id, load)
+
+
+def get_data_package(checksum: str) -> DecodedDataPackage:
+    """Returns the decoded data package stored for checksum, shared between requests. It must not be modified."""
+    def load() -> Tuple[DecodedDataPackage, int]:
+        data = GameDataPackage.get(checksum=checksum).data
+        game_package = restricted_loads(data)
+        return DecodedDataPackage(
+            game_package["item_name_to_id"],
+            game_package["location_name_to_id"],
+            KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})",
+                             {id: name for name, id in game_package["item_name_to_id"].items()}),
+            KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})",
+                             {id: name for name, id in game_package["location_name_to_id"].items()}),
+        ), len(data)
+
+    return _data_package_cache.get(checksum, load)
+
+
+@dataclass(frozen=True)
+class RoomAggregates:
+    """Per-player totals of a room's save data used by trackers, so pages listing every player render in O(players).
+    Rooms store them next to their save whenever it lands, live trackers update them from the progress of running rooms."""
+    checked_counts: Dict[TeamPlayer, int]
+    inventories: Dict[TeamPlayer, Counter[int]]  # received items by id, without the starting inventory
+    goals: Set[TeamPlayer]
+    activity: Dict[TeamPlayer, float]  # timestamp of the last activity
+
+    @classmethod
+    def from_save(cls, savedata: Dict[str, Any]) -> "RoomAggregates":
+        return cls(
+            {key: len(locations) for key, locations in savedata.get("location_checks", {}).items()},
+            {(team, player): collections.Counter(item.item for item in items)
+             for (team, player, remote), items in savedata.get("received_items", {}).items() if remote},
+            {key for key, status in savedata.get("client_game_state", {}).items() if status == ClientStatus.CLIENT_GOAL},
+            dict(savedata.get("client_activity_timers", ())),
+        )
+
+    @classmethod
+    def from_record(cls, record: bytes) -> "RoomAggregates":
+        return cls(*restricted_loads(record))
+
+    def to_record(self) -> bytes:
+        return pickle.dumps((self.checked_counts, self.inventories, self.goals, self.activity))
+
+    def updated(self, savedata: Dict[str, Any], progress: Dict[str, Any]) -> "RoomAggregates":
+        """Returns new aggregates with progress applied, savedata being the save data it was already applied to."""
+        checked_counts, inventories, goals, activity = self.checked_counts, self.inventories, self.goals, self.activity
+        if "location_checks" in progress:
+            checked_counts = {**checked_counts, **{key: len(savedata["location_checks"][key])
+                                                   for key in progress["location_checks"]}}
+        if "received_items" in progress:
+            inventories = dict(inventories)
+            for (team, player, remote), (start, items) in progress["received_items"].items():
+                inventory = collections.Counter(inventories.get((team, player), ()))
+                if start == sum(inventory.values()):
+                    inventory.update(item.item for item in items)
+                else:  # progress overlaps what was counted already, such as after a room restarted
+                    inventory = collections.Counter(
+                        item.item for item in savedata["received_items"][team, player, remote])
+                inventories[team, player] = inventory
+        if "client_game_state" in progress:
+            goals = set(goals)
+            for key, status in progress["client_game_state"].items():
+                if status == ClientStatus.CLIENT_GOAL:
+                    goals.add(key)
+                else:
+                    goals.discard(key)
+        if "client_activity_timers" in progress:
+            activity = dict(progress["client_activity_timers"])
+        return RoomAggregates(checked_counts, inventories, goals, activity)
+
+
+class LiveRoom:
+    """The save data sections used by trackers of a running room, kept up to date in memory from the progress its
+    room process publishes, see WebHostContext.get_progress. savedata is replaced, never modified, on changes."""
+    savedata: Dict[str, Any]
+    aggregates: RoomAggregates
+    version: int
+    last_modified: datetime.datetime
+    closed: bool
+    changed: threading.Condition
+
+    def __init__(self):
+        self.savedata = {"location_checks": {}, "received_items": {}, "hints": {}, "client_game_state": {}}
+        self.aggregates = RoomAggregates.from_save(self.savedata)
+        self.version = 0
+        self.last_modified = datetime.datetime.utcnow()
+        self.closed = False
+        self.changed = threading.Condition()
+
+
+# tracker id -> live tracker model, only exists for rooms hosted by this process
+_live_rooms: Dict[UUID, LiveRoom] = {}
+_event_streams_lock = threading.Lock()
+_event_streams = 0
+
+
+def apply_room_progress(tracker: UUID, progress: Optional[Dict[str, Any]]) -> None:
+    """Updates the live tracker model of a room with progress published by its room process.
+    None removes the model, as the room shut down after saving, so trackers read the database again."""
+    if progress is None:
+        live_room = _live_rooms.pop(tracker, None)
+        if live_room:
+            with live_room.changed:
+                live_room.closed = True
+                live_room.changed.notify_all()
+        return
+
+    live_room = _live_rooms.get(tracker)
+    if not live_room:
+        live_room = _live_rooms[tracker] = LiveRoom()
+    savedata = dict(live_room.savedata)
+    for section, changes in progress.items():
+        if section == "location_checks":
+            checks = savedata[section] = dict(savedata[section])
+            for key, locations in changes.items():
+                checks[key] = checks.get(key, set()) | locations
+        elif section == "received_items":
+            received_items = savedata[section] = dict(savedata[section])
+            for key, (start, items) in changes.items():
+                received_items[key] = received_items.get(key, [])[:start] + items
+        elif section in ("hints", "client_game_state"):
+            savedata[section] = {**savedata[section], **changes}
+        else:
+            savedata[section] = changes
+    aggregates = live_room.aggregates.updated(savedata, progress)
+    with live_room.changed:
+        live_room.savedata = savedata
+        live_room.aggregates = aggregates
+        live_room.version += 1
+        live_room.last_modified = datetime.datetime.utcnow()
+        live_room.changed.notify_all()
+
+
+def get_room_save(room: Room) -> Dict[str, Any]:
+    """Returns the save data of a room, shared between requests until the room saves again. It must not be modified."""
+    def load() -> Tuple[Dict[str, Any], int]:
+        return load_room_save(room) or {}, len(room.multisave or b"")
+
+    # every save updates last_activity, as does shutting down
+    return _room_save_cache.get((room.id, room.last_activity), load)
+
+
+def get_room_aggregates(room: Room) -> RoomAggregates:
+    """Returns the aggregates the room stored along with its save, shared between requests until the room saves again.
+    Rooms that saved before aggregates were stored get them computed from their save data. They must not be modified.
+    """
+    def load() -> Tuple[RoomAggregates, int]:
+        if room.tracker_aggregates:
+            record = room.tracker_aggregates.data
+            return RoomAggregates.from_record(record), len(record)
+        return RoomAggregates.from_save(get_room_save(room)), 0
+
+    return _room_save_cache.get((room.id, room.last_activity, "aggregates"), load)
+
+
+def _get_live_version(tracker: UUID) -> int:
+    """Returns the version of the live tracker model of a room, or -1 if it has none."""
+    live_room = _live_rooms.get(tracker)
+    return live_room.version if live_room else -1
+
+
+def _get_last_modified(room: Room) -> datetime.datetime:
+    live_room = _live_rooms.get(room.tracker)
+    return live_room.last_modified if live_room else room.last_activity
+
+
 def _cache_results(func: Callable) -> Callable:
     """Stores the results of any computationally expensive methods after the initial call in TrackerData.
     If called again, returns the cached result instead, as results will not change for the lifetime of TrackerData.
@@ -50,14 +277,20 @@ class TrackerData:
     """
     room: Room
     _multidata: Dict[str, Any]
-    _multisave: Dict[str, Any]
+    _loaded_multisave: Optional[Dict[str, Any]]
+    _aggregates: RoomAggregates
     _tracker_cache: Dict[str, Any]
 
     def __init__(self, room: Room):
         """Initialize a new RoomMultidata object for the current room."""
         self.room = room
-        self._multidata = Context.decompress(room.seed.multidata)
-        self._multisave = restricted_loads(room.multisave) if room.multisave else {}
+        self._multidata = get_seed_multidata(room.seed)
+        live_room = _live_rooms.get(room.tracker)
+        if live_room:
+            with live_room.changed:
+                self._loaded_multisave, self._aggregates = live_room.savedata, live_room.aggregates
+        else:
+            self._loaded_multisave, self._aggregates = None, get_room_aggregates(room)
         self._tracker_cache = {}
 
         self.item_name_to_id: Dict[str, Dict[str, int]] = {}
@@ -71,15 +304,20 @@ class TrackerData:
             game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Location (ID: {code})")
         })
         for game, game_package in self._multidata["datapackage"].items():
-            game_package = restricted_loads(GameDataPackage.get(checksum=game_package["checksum"]).data)
-            self.item_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
-                id: name for name, id in game_package["item_name_to_id"].items()})
-            self.location_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
-                id: name for name, id in game_package["location_name_to_id"].items()})
+            data_package = get_data_package(game_package["checksum"])
+            self.item_id_to_name[game] = data_package.item_id_to_name
+            self.location_id_to_name[game] = data_package.location_id_to_name
 
             # Normal lookup tables as well.
-            self.item_name_to_id[game] = game_package["item_name_to_id"]
-            self.location_name_to_id[game] = game_package["location_name_to_id"]
+            self.item_name_to_id[game] = data_package.item_name_to_id
+            self.location_name_to_id[game] = data_package.location_name_to_id
+
+    @property
+    def _multisave(self) -> Dict[str, Any]:
+        """The save data of the room, only loaded once something besides the aggregates is needed."""
+        if self._loaded_multisave is None:
+            self._loaded_multisave = get_room_save(self.room)
+        return self._loaded_multisave
 
     def get_seed_name(self) -> str:
         """Retrieves the seed name."""
@@ -125,11 +363,8 @@ class TrackerData:
     @_cache_results
     def get_player_inventory_counts(self, team: int, player: int) -> collections.Counter:
         """Retrieves a dictionary of all items received by their id and their received count."""
-        received_items = self.get_player_received_items(team, player)
         starting_items = self.get_player_starting_inventory(team, player)
-        inventory = collections.Counter()
-        for item in received_items:
-            inventory[item.item] += 1
+        inventory = collections.Counter(self._aggregates.inventories.get((team, player), ()))
         for item in starting_items:
             inventory[item] += 1
 
@@ -159,9 +394,8 @@ class TrackerData:
     def get_team_completed_worlds_count(self) -> Dict[int, int]:
         """Retrieves a dictionary of number of completed worlds per team."""
         return {
-            team: sum(
-                self.get_player_client_status(team, player) == ClientStatus.CLIENT_GOAL for player in players
-            ) for team, players in self.get_all_players().items()
+            team: sum((team, player) in self._aggregates.goals for player in players)
+            for team, players in self.get_all_players().items()
         }
 
     @_cache_results
@@ -187,7 +421,7 @@ class TrackerData:
     def get_team_locations_checked_count(self) -> Dict[int, int]:
         """Retrieves a dictionary of checked player locations each team has."""
         return {
-            team: sum(len(self.get_player_checked_locations(team, player)) for player in players)
+            team: sum(self._aggregates.checked_counts.get((team, player), 0) for player in players)
             for team, players in self.get_all_players().items()
         }
 
@@ -242,7 +476,7 @@ class TrackerData:
     def get_room_locations_complete(self) -> Dict[TeamPlayer, int]:
         """Retrieves a dictionary of all locations complete per player."""
         return {
-            (team, player): len(self.get_player_checked_locations(team, player))
+            (team, player): self._aggregates.checked_counts.get((team, player), 0)
             for team, players in self.get_all_players().items() for player in players
         }
 
@@ -275,7 +509,7 @@ class TrackerData:
         """
         last_activity: Dict[TeamPlayer, datetime.timedelta] = {}
         now = datetime.datetime.utcnow()
-        for (team, player), timestamp in self._multisave.get("client_activity_timers", []):
+        for (team, player), timestamp in self._aggregates.activity.items():
             last_activity[team, player] = now - datetime.datetime.utcfromtimestamp(timestamp)
 
         return last_activity
@@ -308,9 +542,9 @@ def _process_if_request_valid(incoming_request: Request, room: Optional[Room]) -
         if if_modified.tzinfo is None:
             abort(400)  # standard requires "GMT" timezone
         # database may use datetime.utcnow(), which is timezone-naive. convert to timezone-aware.
-        last_activity = room.last_activity
+        last_activity = _get_last_modified(room)
         if last_activity.tzinfo is None:
-            last_activity = room.last_activity.replace(tzinfo=datetime.timezone.utc)
+            last_activity = last_activity.replace(tzinfo=datetime.timezone.utc)
         # if_modified has less precision than last_activity, so we bring them to same precision
         if if_modified >= last_activity.replace(microsecond=0):
             return make_response("",  304)
@@ -320,7 +554,7 @@ def _process_if_request_valid(incoming_request: Request, room: Optional[Room]) -
 
 @app.route("/tracker/<suuid:tracker>/<int:tracked_team>/<int:tracked_player>")
 def get_player_tracker(tracker: UUID, tracked_team: int, tracked_player: int, generic: bool = False) -> Response:
-    key = f"{tracker}_{tracked_team}_{tracked_player}_{generic}"
+    key = f"{tracker}_{tracked_team}_{tracked_player}_{generic}_{_get_live_version(tracker)}"
     response: Optional[Response] = cache.get(key)
     if response:
         return response
@@ -351,7 +585,7 @@ def get_timeout_and_player_tracker(room: Room, tracked_team: int, tracked_player
         tracker = render_generic_tracker(tracker_data, tracked_team, tracked_player)
 
     return ((tracker_data.get_room_saving_second() - datetime.datetime.now().second)
-            % TRACKER_CACHE_TIMEOUT_IN_SECONDS or TRACKER_CACHE_TIMEOUT_IN_SECONDS, room.last_activity, tracker)
+            % TRACKER_CACHE_TIMEOUT_IN_SECONDS or TRACKER_CACHE_TIMEOUT_IN_SECONDS, _get_last_modified(room), tracker)
 
 
 @app.route("/generic_tracker/<suuid:tracker>/<int:tracked_team>/<int:tracked_player>")
@@ -362,7 +596,7 @@ def get_generic_game_tracker(tracker: UUID, tracked_team: int, tracked_player: i
 @app.route("/tracker/<suuid:tracker>", defaults={"game": "Generic"})
 @app.route("/tracker/<suuid:tracker>/<game>")
 def get_multiworld_tracker(tracker: UUID, game: str) -> Response:
-    key = f"{tracker}_{game}"
+    key = f"{tracker}_{game}_{_get_live_version(tracker)}"
     response: Optional[Response] = cache.get(key)
     if response:
         return response
@@ -391,7 +625,7 @@ def get_timeout_and_multiworld_tracker(room: Room, game: str)\
         tracker = render_generic_multiworld_tracker(tracker_data, enabled_trackers)
 
     return ((tracker_data.get_room_saving_second() - datetime.datetime.now().second)
-            % TRACKER_CACHE_TIMEOUT_IN_SECONDS or TRACKER_CACHE_TIMEOUT_IN_SECONDS, room.last_activity, tracker)
+            % TRACKER_CACHE_TIMEOUT_IN_SECONDS or TRACKER_CACHE_TIMEOUT_IN_SECONDS, _get_last_modified(room), tracker)
 
 
 def get_enabled_multiworld_trackers(room: Room) -> Dict[str, Callable]:
@@ -476,8 +710,12 @@ def render_generic_multiworld_sphere_tracker(tracker_data: TrackerData) -> str:
 
 
 @app.route("/sphere_tracker/<suuid:tracker>")
-@cache.memoize(timeout=TRACKER_CACHE_TIMEOUT_IN_SECONDS)
 def get_multiworld_sphere_tracker(tracker: UUID):
+    return _get_multiworld_sphere_tracker(tracker, _get_live_version(tracker))
+
+
+@cache.memoize(timeout=TRACKER_CACHE_TIMEOUT_IN_SECONDS)
+def _get_multiworld_sphere_tracker(tracker: UUID, live_version: int):
     # Room must exist.
     room = Room.get(tracker=tracker)
     if not room:
@@ -487,6 +725,47 @@ def get_multiworld_sphere_tracker(tracker: UUID):
     return render_generic_multiworld_sphere_tracker(tracker_data)
 
 
+def _poll_events(reason: str) -> Response:
+    return Response(f"event: poll\ndata: {reason}\n\n", mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache"})
+
+
+@app.route("/tracker/<suuid:tracker>/events")
+def get_tracker_events(tracker: UUID) -> Response:
+    """Server-Sent Events stream with the version of a running room's live tracker model whenever it changes.
+    If the room has no live model in this process or too many streams are open, a single "poll" event tells viewers to
+    keep refreshing after the room saved instead."""
+    global _event_streams
+
+    live_room = _live_rooms.get(tracker)
+    if not live_room:
+        return _poll_events("room not hosted by this process")
+    with _event_streams_lock:
+        if _event_streams >= app.config["TRACKER_EVENT_STREAMS"]:
+            return _poll_events("too many open streams")
+        _event_streams += 1
+
+    def stream():
+        global _event_streams
+        try:
+            version = live_room.version
+            # close the stream after a while, so browsers reconnect and finished rooms free up the stream
+            end = time.monotonic() + TRACKER_CACHE_TIMEOUT_IN_SECONDS
+            yield "retry: 1000\n\n"
+            while not live_room.closed and time.monotonic() < end:
+                with live_room.changed:
+                    live_room.changed.wait_for(lambda: live_room.version != version or live_room.closed,
+                                               end - time.monotonic())
+                if live_room.version != version and not live_room.closed:
+                    version = live_room.version
+                    yield f"data: {version}\n\n"
+        finally:
+            with _event_streams_lock:
+                _event_streams -= 1
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 # TODO: This is a temporary solution until a proper Tracker API can be implemented for tracker templates and data to
 #       live in their respective world folders.
 
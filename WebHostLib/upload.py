@@ -14,7 +14,7 @@ from pony.orm.core import TransactionIntegrityError
 import schema
 
 import MultiServer
-from NetUtils import SlotType
+from NetUtils import SlotType, write_multidata_sections
 from Utils import VersionException, __version__
 from worlds import GamesPackage
 from worlds.Files import AutoPatchRegister
@@ -58,7 +58,13 @@ def process_multidata(compressed_multidata, files={}):
         # strip datapackage from multidata, leaving only the checksums
         game_data_packages: typing.List[GameDataPackage] = []
         for game, game_data in decompressed_multidata["datapackage"].items():
-            if game_data.get("checksum"):
+            if game_data.get("checksum") and GameDataPackage.exists(checksum=game_data["checksum"]):
+                # rooms and trackers use the stored data package, so the uploaded copy needs no validation
+                decompressed_multidata["datapackage"][game] = {
+                    "version": game_data.get("version", 0),
+                    "checksum": game_data["checksum"],
+                }
+            elif game_data.get("checksum"):
                 original_checksum = game_data.pop("checksum")
                 game_data = games_package_schema.validate(game_data)
                 game_data = {key: value for key, value in sorted(game_data.items())}
@@ -92,7 +98,12 @@ def process_multidata(compressed_multidata, files={}):
                            game=slot_info.game))
         flush()  # commit slots
 
-    compressed_multidata = compressed_multidata[0:1] + zlib.compress(pickle.dumps(decompressed_multidata), 9)
+    if compressed_multidata[0] >= 4:
+        with BytesIO() as output:
+            write_multidata_sections(output, decompressed_multidata)
+            compressed_multidata = output.getvalue()
+    else:
+        compressed_multidata = compressed_multidata[0:1] + zlib.compress(pickle.dumps(decompressed_multidata), 9)
     return slots, compressed_multidata
 
 
@@ -598,6 +598,12 @@ class ServerOptions(Group):
         OFF = 0
         ON = 1
 
+    class ItemSendTick(int):
+        """
+        Milliseconds to collect newly received items for, before sending them to each client in a single message
+        0 -> send them once the current message or command is handled
+        """
+
     host: str | None = None
     port: int = 38281
     password: str | None = None
@@ -616,6 +622,7 @@ class ServerOptions(Group):
     auto_shutdown: AutoShutdown = AutoShutdown(0)
     compatibility: Compatibility = Compatibility(2)
     log_network: LogNetwork = LogNetwork(0)
+    item_send_tick: ItemSendTick = ItemSendTick(0)
 
 
 class GeneratorOptions(Group):
@@ -667,6 +674,21 @@ class GeneratorOptions(Group):
         OFF = 0
         ON = 1
 
+    class WorldGenerationProcesses(int):
+        """
+        Number of processes to run the early generation steps of worlds that support it in, 0 or 1 to disable.
+        Requires the fork start method, so it has no effect on Windows or in the WebHost's generation workers.
+        """
+
+    class MultidataFormat(IntEnum):
+        """
+        Format of the .archipelago multidata file
+        3 -> Single compressed pickle, for servers older than format 4
+        4 -> Separately compressed sections, so a server can load slot data and other large parts on demand
+        """
+        PICKLE = 3
+        SECTIONED = 4
+
     class PanicMethod(str):
         """
         What to do if the current item placements appear unsolvable.
@@ -684,6 +706,8 @@ class GeneratorOptions(Group):
     race: Race = Race(0)
     plando_options: PlandoOptions = PlandoOptions("bosses, connections, texts")
     panic_method: PanicMethod = PanicMethod("swap")
+    world_generation_processes: WorldGenerationProcesses = WorldGenerationProcesses(0)
+    multidata_format: MultidataFormat = MultidataFormat(4)
     loglevel: str = "info"
     logtime: bool = False
 
@@ -0,0 +1,103 @@
+def run_fill_benchmark():
+    """Measure the cost of placing each item in fill_restrictive on a large multiworld."""
+    import argparse
+    import gc
+    import logging
+    import statistics
+    import time
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld, CollectionState, Location
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+    from Fill import fill_restrictive
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        gen_steps: typing.Tuple[str, ...] = (
+            "generate_early",
+            "create_regions",
+            "create_items",
+            "set_rules",
+            "connect_entrances",
+            "generate_basic",
+            "pre_fill",
+        )
+
+        games: typing.Tuple[str, ...] = (
+            "A Link to the Past",
+            "Hollow Knight",
+            "Timespinner",
+            "Blasphemous",
+        )
+
+        players: int = 100
+
+        def setup_multiworld(self) -> MultiWorld:
+            multiworld = MultiWorld(self.players)
+            multiworld.player_name = {}
+            multiworld.set_seed(0)
+            options: typing.Dict[str, typing.Dict[int, typing.Any]] = {}
+            for player in multiworld.player_ids:
+                game = self.games[(player - 1) % len(self.games)]
+                multiworld.game[player] = game
+                multiworld.player_name[player] = f"Tester{player}"
+                for name, option in AutoWorld.AutoWorldRegister.world_types[game].options_dataclass.type_hints.items():
+                    options.setdefault(name, {})[player] = option.from_any(getattr(option, "default"))
+            multiworld.set_options(argparse.Namespace(**options))
+            multiworld.state = CollectionState(multiworld)
+
+            gc.collect()
+            for step in self.gen_steps:
+                with TimeIt(f"{self.players} players step {step}", logger):
+                    call_all(multiworld, step)
+                    gc.collect()
+            return multiworld
+
+        def fill_test(self, name: str, multiworld: MultiWorld, locations: typing.List[Location],
+                      single_player_placement: bool, player: typing.Optional[int] = None) -> None:
+            items = [item for item in multiworld.itempool
+                     if item.advancement and (player is None or item.player == player)]
+            for item in items:
+                multiworld.itempool.remove(item)
+            multiworld.random.shuffle(locations)
+            total = len(items)
+
+            times: typing.List[float] = []
+            last = time.perf_counter()
+
+            def on_place(_: Location) -> None:
+                nonlocal last
+                now = time.perf_counter()
+                times.append(now - last)
+                last = now
+
+            with TimeIt(f"{name}: fill_restrictive of {total} items", logger):
+                fill_restrictive(multiworld, multiworld.state, locations, items,
+                                 single_player_placement=single_player_placement, on_place=on_place,
+                                 allow_partial=True, name=name)
+            if times:
+                logger.info(f"{name}: placed {len(times)} items, {statistics.mean(times) * 1000:.3f} ms "
+                            f"per item on average, {statistics.median(times) * 1000:.3f} ms median, "
+                            f"{max(times) * 1000:.3f} ms max.")
+
+        def main(self):
+            multiworld = self.setup_multiworld()
+            self.fill_test("Multiworld progression", multiworld, multiworld.get_unfilled_locations(), False)
+
+            multiworld = self.setup_multiworld()
+            self.fill_test("Single player progression", multiworld, multiworld.get_unfilled_locations(), True, 1)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_fill_benchmark()
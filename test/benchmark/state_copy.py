@@ -0,0 +1,102 @@
+def run_state_copy_benchmark():
+    """Measure copying CollectionStates of a large multiworld, compared to copying every player's data."""
+    import argparse
+    import gc
+    import logging
+    import typing
+
+    from time_it import TimeIt
+
+    from Utils import init_logging
+    from BaseClasses import MultiWorld, CollectionState
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    class BenchmarkRunner:
+        gen_steps: typing.Tuple[str, ...] = (
+            "generate_early",
+            "create_regions",
+            "create_items",
+            "set_rules",
+        )
+
+        games: typing.Tuple[str, ...] = (
+            "A Link to the Past",
+            "Hollow Knight",
+            "Timespinner",
+            "Blasphemous",
+        )
+
+        players: int = 100
+        copies: int = 1000
+
+        def setup_multiworld(self) -> MultiWorld:
+            multiworld = MultiWorld(self.players)
+            multiworld.player_name = {}
+            multiworld.set_seed(0)
+            options: typing.Dict[str, typing.Dict[int, typing.Any]] = {}
+            for player in multiworld.player_ids:
+                game = self.games[(player - 1) % len(self.games)]
+                multiworld.game[player] = game
+                multiworld.player_name[player] = f"Tester{player}"
+                for name, option in AutoWorld.AutoWorldRegister.world_types[game].options_dataclass.type_hints.items():
+                    options.setdefault(name, {})[player] = option.from_any(getattr(option, "default"))
+            multiworld.set_options(argparse.Namespace(**options))
+            multiworld.state = CollectionState(multiworld)
+            for step in self.gen_steps:
+                call_all(multiworld, step)
+            gc.collect()
+            return multiworld
+
+        def copy_test(self, name: str, copy: typing.Callable[[], typing.Any]) -> None:
+            with TimeIt(f"{name}: {self.copies} copies", logger) as timer:
+                for _ in range(self.copies):
+                    copy()
+            logger.info(f"{name}: {timer.dif / self.copies * 1000:.3f} ms per copy.")
+
+        def main(self):
+            multiworld = self.setup_multiworld()
+            state = multiworld.get_all_state(False)
+            for player in multiworld.player_ids:
+                state.update_reachable_regions(player)
+            snapshot = state.copy()
+            item = next(item for item in multiworld.itempool if item.advancement)
+
+            def copy_every_player() -> None:
+                # copy() from before players were shared between copies
+                ret = CollectionState.__new__(CollectionState)
+                ret.multiworld = multiworld
+                ret.prog_items = {player: counter.copy() for player, counter in state.prog_items.items()}
+                ret.reachable_regions = {player: regions.copy() for player, regions in state.reachable_regions.items()}
+                ret.blocked_connections = {player: entrances.copy()
+                                           for player, entrances in state.blocked_connections.items()}
+                ret.stale = {player: changes.copy() if isinstance(changes, set) else changes
+                             for player, changes in state.stale.items()}
+                ret.advancements = state.advancements.copy()
+                ret.path = state.path.copy()
+                ret.locations_checked = state.locations_checked.copy()
+                ret.allow_partial_entrances = state.allow_partial_entrances
+                for function in CollectionState.additional_init_functions:
+                    function(ret, multiworld)
+                for function in CollectionState.additional_copy_functions:
+                    function(state, ret)
+
+            def copy_and_collect() -> None:
+                snapshot.copy().collect(item, True)
+
+            self.copy_test("Copying every player's data", copy_every_player)
+            self.copy_test("Copy of a state that owns its data", state.copy)
+            self.copy_test("Copy of a copy", snapshot.copy)
+            self.copy_test("Copy of a copy, collecting one item", copy_and_collect)
+
+    runner = BenchmarkRunner()
+    runner.main()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_state_copy_benchmark()
@@ -0,0 +1,169 @@
+import functools
+import multiprocessing
+import unittest
+from typing import ClassVar, Dict, List, Set, Tuple, Type
+
+from BaseClasses import CollectionState, Item, ItemClassification, MultiWorld, Region
+from Main import IsolatedItems, generate_isolated_step, isolated_generation_processes, isolated_steps, \
+    push_start_inventory, resolve_item_locality
+from worlds.AutoWorld import AutoWorldRegister, World, call_all
+from . import setup_multiworld
+
+
+def has_keys(player: int, count: int, state: CollectionState) -> bool:
+    return state.has("Key", player, count)
+
+
+def define_test_worlds() -> Tuple[Type[World], ...]:
+    """Defines, and so registers, the test worlds. They are only registered while testing with them."""
+
+    class IsolatedTestWorld(World):
+        game = "Isolated Test Game"
+        hidden = True
+        item_name_to_id = {"Key": 1, "Filler": 2}
+        location_name_to_id = {f"Location {i}": i for i in range(1, 11)}
+        isolated_generation = True
+        key_count: int
+
+        def generate_early(self) -> None:
+            self.key_count = self.random.randint(1, 5)
+            # items added in different steps have to end up where serial generation would put them
+            self.multiworld.itempool.append(self.create_item("Filler"))
+
+        def create_regions(self) -> None:
+            menu = Region("Menu", self.player, self.multiworld)
+            vault = Region("Vault", self.player, self.multiworld)
+            menu.add_locations({f"Location {i}": i for i in range(1, 6)})
+            vault.add_locations({f"Location {i}": i for i in range(6, 11)})
+            menu.connect(vault, rule=functools.partial(has_keys, self.player, self.key_count))
+            self.multiworld.regions += [menu, vault]
+
+        def create_item(self, name: str) -> Item:
+            classification = ItemClassification.progression if name == "Key" else ItemClassification.filler
+            return Item(name, classification, self.item_name_to_id[name], self.player)
+
+        def create_items(self) -> None:
+            self.multiworld.itempool += [self.create_item("Key") for _ in range(self.key_count)]
+            self.multiworld.itempool += [self.create_item("Filler") for _ in range(9 - self.key_count)]
+
+        def set_rules(self) -> None:
+            self.multiworld.completion_condition[self.player] = functools.partial(has_keys, self.player,
+                                                                                  self.key_count)
+
+    class LambdaRuleTestWorld(IsolatedTestWorld):
+        game = "Lambda Rule Test Game"
+        item_name_to_id = IsolatedTestWorld.item_name_to_id
+        location_name_to_id = IsolatedTestWorld.location_name_to_id
+
+        def set_rules(self) -> None:
+            key_count = self.key_count
+            self.multiworld.completion_condition[self.player] = lambda state: state.has("Key", self.player, key_count)
+
+    class SharedRandomTestWorld(IsolatedTestWorld):
+        game = "Shared Random Test Game"
+        item_name_to_id = IsolatedTestWorld.item_name_to_id
+        location_name_to_id = IsolatedTestWorld.location_name_to_id
+
+        def generate_early(self) -> None:
+            super().generate_early()
+            self.key_count = self.multiworld.random.randint(1, 5)
+
+    return IsolatedTestWorld, LambdaRuleTestWorld, SharedRandomTestWorld
+
+
+def generate(multiworld: MultiWorld, processes: int) -> IsolatedItems:
+    """Runs the isolated steps like Main does."""
+    processes = isolated_generation_processes(processes)
+    isolated_items: IsolatedItems = {}
+    for step in isolated_steps:
+        generate_isolated_step(multiworld, step, processes, isolated_items)
+        call_all(multiworld, step, isolated_items=isolated_items)
+        for player in multiworld.player_ids:
+            if step not in isolated_items.get(player, {}):
+                if step == "generate_early":
+                    push_start_inventory(multiworld, player)
+                elif step == "create_items":
+                    resolve_item_locality(multiworld, player)
+    return isolated_items
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires the fork start method")
+class TestIsolatedGeneration(unittest.TestCase):
+    test_world_types: ClassVar[Tuple[Type[World], ...]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_world_types = define_test_worlds()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        for world_type in cls.test_world_types:
+            del AutoWorldRegister.world_types[world_type.game]
+
+    def test_isolated_generation_matches_serial_generation(self) -> None:
+        """Ensure worlds generated in separate processes are merged back as if they were generated serially."""
+        isolated_world, lambda_world, shared_random_world = self.test_world_types
+        world_types = [isolated_world, lambda_world, isolated_world, shared_random_world, isolated_world]
+        serial = setup_multiworld(world_types, (), 0)
+        generate(serial, 0)
+        isolated = setup_multiworld(world_types, (), 0)
+        worlds = dict(isolated.worlds)
+        isolated_items = generate(isolated, 2)
+
+        expected_steps: Dict[int, Set[str]] = {player: set(isolated_steps) for player in isolated.player_ids}
+        expected_steps[2].remove("set_rules")  # lambdas can't be pickled
+        expected_steps[4].remove("generate_early")  # uses the multiworld's random
+        self.assertEqual({player: set(steps) for player, steps in isolated_items.items()}, expected_steps)
+        self.assertEqual([str(item) for item in isolated.itempool], [str(item) for item in serial.itempool])
+        self.assertEqual([item.player for item in isolated.itempool[:5]], [1, 2, 3, 4, 5])
+        for player in isolated.player_ids:
+            world = isolated.worlds[player]
+            self.assertIs(world, worlds[player])
+            self.assertIs(world.multiworld, isolated)
+            self.assertEqual(world.key_count, serial.worlds[player].key_count)
+            self.assertEqual(world.random.getstate(), serial.worlds[player].random.getstate())
+            self.assertEqual([region.name for region in isolated.get_regions(player)],
+                             [region.name for region in serial.get_regions(player)])
+            for region in isolated.get_regions(player):
+                self.assertIs(region.multiworld, isolated)
+            # later steps have to see what serially generated steps did before them
+            self.assertEqual(isolated.get_entrance("Menu -> Vault", player).access_rule.args,
+                             serial.get_entrance("Menu -> Vault", player).access_rule.args)
+
+        state = isolated.get_all_state()
+        self.assertTrue(all(location.can_reach(state) for location in isolated.get_locations()))
+        self.assertTrue(isolated.can_beat_game(state))
+        for player in isolated.player_ids:
+            self.assertFalse(isolated.get_region("Vault", player).can_reach(isolated.state))
+
+    def test_daemonic_process_generates_serially(self) -> None:
+        """Ensure daemonic processes, which can't start child processes, fall back to serial generation."""
+        process = multiprocessing.current_process()
+        process.daemon = True
+        try:
+            with self.assertLogs(level="WARNING"):
+                self.assertEqual(isolated_generation_processes(2), 0)
+        finally:
+            process.daemon = False
+        self.assertEqual(isolated_generation_processes(2), 2)
+
+    def test_isolated_worlds_match_serial_generation(self) -> None:
+        """Ensure worlds declaring isolated_generation can be generated in separate processes."""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            if not world_type.isolated_generation or world_type in self.test_world_types:
+                continue
+            with self.subTest("Game", game=game_name):
+                world_types: List[Type[World]] = [world_type, world_type]
+                serial = setup_multiworld(world_types, (), 0)
+                generate(serial, 0)
+                isolated = setup_multiworld(world_types, (), 0)
+                isolated_items = generate(isolated, 2)
+                self.assertEqual(set(isolated_items), {1, 2})
+                self.assertEqual([str(item) for item in isolated.itempool], [str(item) for item in serial.itempool])
+                self.assertEqual([str(item) for item in isolated.precollected_items[1]],
+                                 [str(item) for item in serial.precollected_items[1]])
+                self.assertEqual([location.name for location in isolated.get_locations()],
+                                 [location.name for location in serial.get_locations()])
+                state = isolated.get_all_state()
+                self.assertEqual([location.can_reach(state) for location in isolated.get_locations()],
+                                 [location.can_reach(serial.get_all_state()) for location in serial.get_locations()])
@@ -79,3 +79,75 @@ class TestBase(unittest.TestCase):
                             locations.add(location)
                     self.assertGreater(len(locations), 0,
                                        msg="Need to be able to reach at least one location to get started.")
+
+    def test_incremental_update_matches_full_update(self):
+        """Ensure reachability updated after each collected item matches a state that collected everything at once"""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest("Game", game=game_name):
+                multiworld = setup_solo_multiworld(world_type)
+                items = [item for item in multiworld.itempool if item.advancement]
+                multiworld.random.shuffle(items)
+                regions = multiworld.get_regions()
+
+                state = CollectionState(multiworld)
+                for item in items:
+                    state.collect(item, True)
+                    for region in regions:
+                        region.can_reach(state)
+
+                full_state = CollectionState(multiworld)
+                for item in items:
+                    full_state.collect(item, True)
+                for region in regions:
+                    with self.subTest("Region reachability should match", region=region.name):
+                        self.assertEqual(region.can_reach(state), region.can_reach(full_state))
+
+    def test_direct_writes_are_rechecked(self):
+        """Ensure item counts written to prog_items directly, like worlds and tests do, update reachability like
+        collecting them"""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest("Game", game=game_name):
+                multiworld = setup_solo_multiworld(world_type)
+                world = multiworld.worlds[1]
+                if not multiworld.entrance_dependencies.tracks(world):
+                    continue
+                items = [item for item in multiworld.itempool if item.advancement]
+                multiworld.random.shuffle(items)
+                regions = multiworld.get_regions()
+
+                state = CollectionState(multiworld)
+                for index, item in enumerate(items):
+                    if index % 2:
+                        state = state.copy()
+                    name = world.collect_item(state, item)
+                    if name:
+                        state.prog_items[1][name] += 1
+                    for region in regions:
+                        region.can_reach(state)
+
+                full_state = CollectionState(multiworld)
+                for item in items:
+                    full_state.collect(item, True)
+                for region in regions:
+                    with self.subTest("Region reachability should match", region=region.name):
+                        self.assertEqual(region.can_reach(state), region.can_reach(full_state))
+
+    def test_frozen_dependencies_are_not_recorded(self):
+        """Ensure states stop recording entrance dependencies once they are frozen for multithreaded use"""
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"])
+        dependencies = multiworld.entrance_dependencies
+        dependencies.freeze()
+        rules, opaque_rules = dependencies.rules.copy(), dependencies.opaque_rules.copy()
+        state = CollectionState(multiworld)
+        reachable = [region for region in multiworld.get_regions() if region.can_reach(state)]
+        self.assertEqual(dependencies.rules, rules)
+        self.assertEqual(dependencies.opaque_rules, opaque_rules)
+
+        recording_multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"])
+        recording_dependencies = recording_multiworld.entrance_dependencies
+        recorded = len(recording_dependencies.rules) + len(recording_dependencies.opaque_rules)
+        recording_state = CollectionState(recording_multiworld)
+        self.assertEqual([region.name for region in reachable],
+                         [region.name for region in recording_multiworld.get_regions()
+                          if region.can_reach(recording_state)])
+        self.assertGreater(len(recording_dependencies.rules) + len(recording_dependencies.opaque_rules), recorded)
@@ -0,0 +1,61 @@
+import unittest
+from typing import List, Set
+
+from BaseClasses import CollectionState, Location, MultiWorld, SphereCache
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import AutoWorldRegister, call_all
+from . import setup_solo_multiworld
+
+
+def sendable_spheres(multiworld: MultiWorld) -> List[Set[Location]]:
+    """Calculates the sendable spheres without any caching, collecting reachable events before each sphere."""
+    state = CollectionState(multiworld)
+    filled = multiworld.get_filled_locations()
+    locations = {location for location in filled if isinstance(location.address, int)
+                 and isinstance(location.item.code, int)}
+    events = set(filled) - locations
+    spheres: List[Set[Location]] = []
+    while locations:
+        done_events = {None}
+        while done_events:
+            done_events = {event for event in events if event.can_reach(state)}
+            for event in done_events:
+                state.collect(event.item, True, event)
+            events -= done_events
+        sphere = {location for location in locations if location.can_reach(state)}
+        spheres.append(sphere)
+        if not sphere:
+            spheres.append(locations)
+            break
+        for location in sphere:
+            state.collect(location.item, True, location)
+        locations -= sphere
+    return spheres
+
+
+class TestSphereCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"], seed=0)
+        distribute_items_restrictive(self.multiworld)
+        call_all(self.multiworld, "post_fill")
+
+    def test_cached_spheres_match_uncached_spheres(self) -> None:
+        """Ensure the cached sendable spheres are the same as calculating them from scratch."""
+        expected = sendable_spheres(self.multiworld)
+        self.assertEqual(list(self.multiworld.get_sendable_spheres()), expected)
+        self.multiworld.sphere_cache = SphereCache(self.multiworld)
+        self.assertEqual(list(self.multiworld.get_sendable_spheres()), expected)
+        self.assertEqual(list(self.multiworld.get_sendable_spheres()), expected)
+
+    def test_cache_is_shared(self) -> None:
+        """Ensure accessibility check and playthrough reuse the spheres calculated for the multidata."""
+        sphere_cache = self.multiworld.sphere_cache = SphereCache(self.multiworld)
+        spheres = list(self.multiworld.get_sendable_spheres())
+        states = list(sphere_cache.states)
+        self.assertTrue(self.multiworld.fulfills_accessibility())
+        self.assertTrue(self.multiworld.fulfills_accessibility(CollectionState(self.multiworld)))
+        self.multiworld.spoiler.create_playthrough(create_paths=False)
+        self.assertEqual(sphere_cache.states, states)
+        self.assertEqual(list(self.multiworld.get_sendable_spheres()), spheres)
+        self.assertTrue(self.multiworld.spoiler.playthrough)
+        self.assertFalse(self.multiworld.spoiler.unreachables)
@@ -1,5 +1,6 @@
 import unittest
 
+from BaseClasses import CollectionState
 from worlds.AutoWorld import AutoWorldRegister, call_all
 from . import setup_solo_multiworld
 
@@ -27,3 +28,75 @@ class TestBase(unittest.TestCase):
                     with self.subTest("Step", step=step):
                         call_all(multiworld, step)
                         self.assertTrue(multiworld.get_all_state(False, allow_partial_entrances=True))
+
+    def test_copy_is_independent(self):
+        """Ensure collecting into a copy of a state doesn't change the original state."""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest("Game", game=game_name):
+                multiworld = setup_solo_multiworld(world_type)
+                items = [item for item in multiworld.itempool if item.advancement]
+                state = CollectionState(multiworld)
+                for item in items[:len(items) // 2]:
+                    state.collect(item, True)
+                regions = multiworld.get_regions()
+                reachable = [region for region in regions if region.can_reach(state)]
+                prog_items = state.prog_items[1].copy()
+
+                copy = state.copy()
+                for item in items[len(items) // 2:]:
+                    copy.collect(item, True)
+                for region in regions:
+                    region.can_reach(copy)
+                self.assertEqual(state.prog_items[1], prog_items)
+                self.assertEqual([region for region in regions if region.can_reach(state)], reachable)
+
+    def test_copy_direct_writes_are_independent(self):
+        """Ensure writing to the per player containers of a copy directly doesn't change the original state and
+        writing to the original doesn't change the copy."""
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"])
+        state = CollectionState(multiworld)
+        state.update_reachable_regions(1)
+        prog_items = state.prog_items[1].copy()
+        reachable = state.reachable_regions[1].copy()
+        blocked = state.blocked_connections[1].copy()
+        self.assertTrue(blocked)
+
+        copy = state.copy()
+        copy.prog_items[1]["Direct Write"] += 1
+        copy.reachable_regions[1].add(next(iter(blocked)).connected_region)
+        copy.blocked_connections[1].clear()
+        self.assertEqual(state.prog_items[1], prog_items)
+        self.assertEqual(state.reachable_regions[1], reachable)
+        self.assertEqual(state.blocked_connections[1], blocked)
+
+        copy = state.copy()
+        state.prog_items[1]["Direct Write"] += 1
+        state.blocked_connections[1].clear()
+        self.assertEqual(copy.prog_items[1], prog_items)
+        self.assertEqual(copy.blocked_connections[1], blocked)
+        self.assertEqual(dict(copy.prog_items.items()), {1: prog_items})
+
+    def test_copy_shares_until_written(self):
+        """Ensure copying a state leaves it untouched, reading a copy doesn't copy its data and copies of copies stay
+        independent when either of them is written to."""
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"])
+        state = CollectionState(multiworld)
+        state.update_reachable_regions(1)
+        containers = (state.prog_items, state.prog_items[1], state.reachable_regions[1])
+
+        copy = state.copy()
+        self.assertTrue(all(entry is container for entry, container in zip(
+            (state.prog_items, state.prog_items[1], state.reachable_regions[1]), containers)))
+        view = copy.prog_items[1]
+        self.assertEqual(view["Direct Write"], 0)
+        self.assertIn(multiworld.get_region("Menu", 1), copy.reachable_regions[1])
+        self.assertIs(copy.prog_items[1], view)
+
+        second_copy = copy.copy()
+        copy.add_item("Direct Write", 1)
+        self.assertEqual(copy.prog_items[1]["Direct Write"], 1)
+        self.assertEqual(view["Direct Write"], 1)
+        self.assertEqual(second_copy.prog_items[1]["Direct Write"], 0)
+        second_copy.prog_items[1]["Direct Write"] += 2
+        self.assertEqual(copy.prog_items[1]["Direct Write"], 1)
+        self.assertEqual(state.prog_items[1]["Direct Write"], 0)
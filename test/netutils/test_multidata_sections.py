@@ -0,0 +1,86 @@
+# Tests for NetUtils.write_multidata_sections and NetUtils.MultidataSections
+import io
+import pickle
+import typing
+import unittest
+import zlib
+
+from MultiServer import Context
+from NetUtils import MultidataSections, NetworkSlot, SlotType, multidata_sections, write_multidata_sections
+
+
+def sample_multidata() -> dict:
+    return {
+        "slot_data": {1: {"goal": 1}, 2: {"goal": 2, "seed": "ab"}},
+        "slot_info": {1: NetworkSlot("A", "Game", SlotType.player), 2: NetworkSlot("B", "Game", SlotType.player)},
+        "locations": {1: {11: (21, 2, 0)}, 2: {21: (11, 1, 0)}},
+        "er_hint_data": {1: {11: "Somewhere"}},
+        "seed_name": "12345",
+        "spheres": [{1: {11}}, {2: {21}}],
+        "datapackage": {"Game": {"checksum": "abc", "item_name_to_id": {}}},
+        "version": (0, 6, 2),
+    }
+
+
+def encode(multidata: dict) -> bytes:
+    with io.BytesIO() as output:
+        write_multidata_sections(output, multidata)
+        return output.getvalue()
+
+
+class TestMultidataSections(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        """Ensure sectioned multidata decodes to the same multidata as a single pickle."""
+        data = encode(sample_multidata())
+        self.assertEqual(data[0], 4)
+        multidata = Context.decompress(data)
+        self.assertIsInstance(multidata, MultidataSections)
+        self.assertEqual(list(multidata), list(sample_multidata()))
+        self.assertEqual(dict(multidata["slot_data"]), sample_multidata()["slot_data"])
+        self.assertEqual({key: value for key, value in multidata.items() if key != "slot_data"},
+                         {key: value for key, value in sample_multidata().items() if key != "slot_data"})
+        pickled = bytes([3]) + zlib.compress(pickle.dumps(sample_multidata()), 9)
+        self.assertEqual(Context.decompress(pickled), sample_multidata())
+
+    def test_lazy_loading(self) -> None:
+        """Ensure sections only get decompressed once they're accessed."""
+        multidata = MultidataSections(encode(sample_multidata()))
+        slot_data = multidata["slot_data"]
+        self.assertEqual(slot_data[2], {"goal": 2, "seed": "ab"})
+        self.assertEqual(list(slot_data._decoded), [2])
+        self.assertEqual(multidata["seed_name"], "12345")
+        self.assertEqual(set(multidata._decoded), {"slot_data", "slot_info", "seed_name", "version"})
+
+    def test_modify_and_reencode(self) -> None:
+        """Ensure changes to loaded multidata are kept when writing it again."""
+        multidata = MultidataSections(encode(sample_multidata()))
+        self.assertEqual(multidata.pop("locations"), sample_multidata()["locations"])
+        self.assertNotIn("locations", multidata)
+        del multidata["datapackage"]["Game"]
+        multidata["race_mode"] = 1
+        reencoded = MultidataSections(encode(multidata))
+        expected = sample_multidata()
+        del expected["locations"]
+        expected["datapackage"] = {}
+        expected["race_mode"] = 1
+        self.assertEqual(list(reencoded), list(expected))
+        self.assertEqual(reencoded["datapackage"], {})
+        self.assertEqual(reencoded["race_mode"], 1)
+        self.assertEqual(dict(reencoded["slot_data"]), expected["slot_data"])
+
+    def test_reencode_copies_sections(self) -> None:
+        """Ensure sections that were not accessed are written again as they are, without decoding them."""
+        def raw_sections(data: bytes) -> typing.Dict[str, bytes]:
+            multidata = MultidataSections(data)
+            raw = {key: bytes(multidata._raw(key)) for key in multidata_sections}
+            raw.update({slot: bytes(multidata["slot_data"]._raw(slot)) for slot in multidata["slot_data"]})
+            return raw
+
+        data = encode(sample_multidata())
+        multidata = MultidataSections(data)
+        slot_data = multidata["slot_data"]
+        multidata["seed_name"] = "54321"
+        reencoded = encode(multidata)
+        self.assertFalse(slot_data._decoded)
+        self.assertEqual(raw_sections(reencoded), raw_sections(data))
+        self.assertEqual(MultidataSections(reencoded)["seed_name"], "54321")
@@ -0,0 +1,57 @@
+# Tests for NetUtils.PackedDataPackage
+import struct
+import unittest
+
+from NetUtils import PackedDataPackage
+
+
+def sample_package() -> dict:
+    return {
+        "item_name_to_id": {"Sword": 3, "Shield": 1, "Bow": -2, "Ünïcode": 2**53},
+        "location_name_to_id": {"Chest": 10, "Shield": 11, "Boss": 5},
+        "checksum": "0123abcd",
+    }
+
+
+class TestPackedDataPackage(unittest.TestCase):
+    def test_lookups(self) -> None:
+        """Ensure packed id and name lookups match the data package they were packed from."""
+        package = sample_package()
+        packed = PackedDataPackage(PackedDataPackage.pack(package))
+        self.assertEqual(packed.checksum, "0123abcd")
+        self.assertEqual(dict(packed.item_name_to_id), package["item_name_to_id"])
+        self.assertEqual(dict(packed.location_name_to_id), package["location_name_to_id"])
+        self.assertEqual(list(packed.item_names), [-2, 1, 3, 2**53])
+        self.assertEqual(packed.item_names[2**53], "Ünïcode")
+        self.assertEqual(packed.location_names[11], "Shield")
+        self.assertNotIn(2, packed.item_names)
+        self.assertNotIn("Sword", packed.item_names)
+        self.assertRaises(KeyError, packed.location_names.__getitem__, 3)
+        self.assertRaises(KeyError, packed.location_name_to_id.__getitem__, "Sword")
+        self.assertEqual(packed.location_names.get_id("Boss"), 5)
+
+    def test_shared_names(self) -> None:
+        """Ensure names that are used by items and locations are only stored once."""
+        package = sample_package()
+        shared = len(PackedDataPackage.pack(package))
+        package["location_name_to_id"]["Shielf"] = package["location_name_to_id"].pop("Shield")
+        self.assertEqual(len(PackedDataPackage.pack(package)) - shared, len("Shielf"))
+
+    def test_little_endian(self) -> None:
+        """Ensure the tables are stored little-endian, so packed files can be read on hosts of either byte order."""
+        packed = PackedDataPackage.pack(sample_package())
+        offset = PackedDataPackage.header.size + len("0123abcd")
+        offset += -offset % 8
+        self.assertEqual(packed[offset:offset + 4 * 8], struct.pack("<4q", -2, 1, 3, 2**53))
+        offset += 7 * 8
+        self.assertEqual(packed[offset:offset + 4 * 4], struct.pack("<4I", 0, len("Bow"), len("Bow"), len("Shield")))
+
+    def test_empty(self) -> None:
+        packed = PackedDataPackage(PackedDataPackage.pack({"item_name_to_id": {}, "location_name_to_id": {},
+                                                           "checksum": "0"}))
+        self.assertEqual(len(packed.item_names), 0)
+        self.assertNotIn(1, packed.location_names)
+        self.assertIsNone(packed.item_names.get_id("Sword"))
+
+    def test_bad_data(self) -> None:
+        self.assertRaises(ValueError, PackedDataPackage, b"APDQ" + bytes(16))
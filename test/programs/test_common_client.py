@@ -93,3 +93,16 @@ class TestCommonContext(unittest.IsolatedAsyncioTestCase):
         assert self.ctx.item_names.lookup_in_slot(-1, 3) == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame1") == "Nothing"
         assert self.ctx.item_names.lookup_in_game(-1, "__TestGame2") == "Nothing"
+
+    async def test_packed_name_lookups(self):
+        packed = NetUtils.PackedDataPackage(NetUtils.PackedDataPackage.pack({
+            "location_name_to_id": {"Test Location 3 - Packed": 2**54 + 2},
+            "item_name_to_id": {"Test Item 3 - Packed": 2**54 + 2},
+            "checksum": "packed",
+        }))
+        self.ctx.update_game(packed, "__TestGame2")
+        assert self.ctx.item_names["__TestGame2"][2**54+2] == "Test Item 3 - Packed"
+        assert self.ctx.item_names["__TestGame2"][2**54+3] == f"Unknown item (ID: {2**54+3})"
+        assert self.ctx.item_names["__TestGame2"][-1] == "Nothing"
+        assert self.ctx.location_names.lookup_in_slot(2**54+2, 3) == "Test Location 3 - Packed"
+        assert self.ctx.checksums["__TestGame2"] == "packed"
@@ -72,6 +72,34 @@ class TestGenerateMain(unittest.TestCase):
 
         self.assertOutput(self.output_tempdir.name)
 
+    def test_multidata(self):
+        """Ensure the multidata written by default round-trips through MultiServer.Context.decompress."""
+        import zipfile
+        from MultiServer import Context
+        from NetUtils import MultidataSections
+        from settings import get_settings
+        generator = get_settings().generator
+        format_backup = generator.multidata_format
+        generator.multidata_format = type(generator).multidata_format  # the default, instead of the local host.yaml's
+        try:
+            sys.argv = [sys.argv[0], '--seed', '0',
+                        '--player_files_path', str(self.abs_input_dir),
+                        '--outputpath', self.output_tempdir.name]
+            Main.main(*Generate.main())
+        finally:
+            generator.multidata_format = format_backup
+
+        with zipfile.ZipFile(next(Path(self.output_tempdir.name).glob('*.zip'))) as output:
+            data = output.read(next(name for name in output.namelist() if name.endswith('.archipelago')))
+        self.assertEqual(data[0], 4)
+        multidata = Context.decompress(data)
+        self.assertIsInstance(multidata, MultidataSections)
+        self.assertEqual(set(multidata["slot_data"]), set(multidata["slot_info"]))
+        for slot, info in multidata["slot_info"].items():
+            self.assertEqual(multidata["connect_names"][info.name], (0, slot))
+        self.assertLessEqual(set(multidata["locations"]), set(multidata["slot_info"]))
+        self.assertIn("Archipelago", multidata["datapackage"])
+
     def test_generate_yaml(self):
         # override host.yaml
         from settings import get_settings
@@ -1,5 +1,14 @@
+import asyncio
+import copy
+import pickle
+import typing
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+import zlib
+from MultiServer import Client, Context, SaveJournal, ServerCommandProcessor, collect_hints, decode_save_journal, \
+    encode_save_record, encode_send_event, json_format_send_event, register_location_checks, send_items_to, \
+    send_new_items, update_client_status
+from NetUtils import ClientStatus, Hint, HintStatus, NetworkItem, NetworkSlot, SlotType, encode
+from Utils import restricted_loads
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +47,224 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.savedata = {
+            "version": 2,
+            "received_items": {(0, 1, True): [NetworkItem(1, 2, 2, 0)]},
+            "location_checks": {(0, 1): {1, 2}},
+            "hints": {(0, 1): {Hint(1, 2, 3, 4, False, "", 0, HintStatus.HINT_UNSPECIFIED)}},
+            "name_aliases": {(0, 2): "Alias"},
+            "client_activity_timers": (((0, 1), 1.0),),
+            "stored_data": {"counter": 1, "list": [1]},
+            "random_state": (3, (1, 2), None),
+            "game_options": {"hint_cost": 10},
+        }
+
+    def test_deltas_restore_save(self) -> None:
+        """Ensure applying the deltas to the snapshot results in the current save data, including changes in place."""
+        journal = SaveJournal(encode_save_record)
+        file = SaveJournal.magic + journal.snapshot(self.savedata)
+        journal.commit()
+        self.assertIsNone(journal.delta(self.savedata), "nothing changed, so there should be no delta")
+
+        self.savedata["received_items"][0, 1, True].append(NetworkItem(3, 4, 2, 0))
+        self.savedata["location_checks"][0, 1].add(3)
+        self.savedata["location_checks"][0, 2] = {5}
+        self.savedata["hints"][0, 1] = {hint._replace(found=True) for hint in self.savedata["hints"][0, 1]}
+        del self.savedata["name_aliases"][0, 2]
+        self.savedata["client_activity_timers"] = (((0, 1), 2.0), ((0, 2), 2.0))
+        self.savedata["stored_data"]["list"].append(2)
+        self.savedata["random_state"] = (3, (2, 3), None)
+        delta = journal.delta(self.savedata)
+        journal.commit()
+        self.assertEqual(decode_save_journal(file + delta), self.savedata)
+        self.assertIsNone(journal.delta(self.savedata), "nothing changed since, so there should be no delta")
+
+        self.savedata["stored_data"]["counter"] = 2
+        self.savedata["received_items"][0, 1, True].append(NetworkItem(5, 6, 2, 0))
+        self.savedata["received_items"][0, 2, True] = [NetworkItem(1, 1, 1, 0)]
+        self.savedata["video"] = [((0, 1), ("Twitch", "user"))]
+        delta2 = journal.delta(self.savedata)
+        self.assertEqual(restricted_loads(zlib.decompress(delta2[4:]))["mappings"]["received_items"]["extend"],
+                         {(0, 1, True): [NetworkItem(5, 6, 2, 0)]}, "received items should only be extended")
+        journal.commit()
+        self.assertEqual(decode_save_journal(file + delta + delta2), self.savedata)
+        self.assertEqual(decode_save_journal(file + delta + delta2[:-1]), decode_save_journal(file + delta),
+                         "an incomplete record should be ignored")
+
+    def test_compaction(self) -> None:
+        """Ensure a snapshot is requested once deltas outgrow it, or a save wasn't written."""
+        journal = SaveJournal(encode_save_record)
+        self.assertTrue(journal.needs_snapshot)
+        journal.snapshot(self.savedata)
+        self.assertTrue(journal.needs_snapshot, "uncommitted snapshot should have to be repeated")
+        journal.commit()
+        self.assertFalse(journal.needs_snapshot)
+        for value in range(100):
+            self.savedata["stored_data"][f"key{value}"] = list(range(value))
+            journal.delta(self.savedata)
+            journal.commit()
+        self.assertTrue(journal.needs_snapshot)
+
+    def test_legacy_save(self) -> None:
+        """Ensure save files written before journaling can still be loaded."""
+        savedata = copy.deepcopy(self.savedata)
+        self.assertEqual(decode_save_journal(zlib.compress(pickle.dumps(savedata))), self.savedata)
+
+
+class ItemSendTestContext(Context):
+    def __init__(self, item_send_tick: int) -> None:
+        super().__init__("", 0, "", "", 0, 0, False, item_send_tick=item_send_tick)
+        self.sent: typing.List[typing.Tuple[Client, typing.List[dict]]] = []
+        self.clients = {0: {1: [], 2: []}}
+
+    def _load_game_data(self) -> None:
+        pass  # not needed, and the data package can only be loaded into a single context
+
+    async def send_msgs(self, endpoint: Client, msgs: typing.Iterable[dict]) -> bool:
+        self.sent.append((endpoint, list(msgs)))
+        return True
+
+
+class TestSendNewItems(unittest.TestCase):
+    def send(self, item_send_tick: int) -> ItemSendTestContext:
+        async def run() -> ItemSendTestContext:
+            ctx = ItemSendTestContext(item_send_tick)
+            for slot in (1, 2):
+                client = Client(None, ctx)
+                client.team, client.slot, client.items_handling = 0, slot, 0b111
+                ctx.clients[0][slot].append(client)
+            for location in range(3):
+                send_items_to(ctx, 0, 1, NetworkItem(location, location, 2, 0))
+                send_new_items(ctx)
+            await asyncio.sleep(item_send_tick / 1000 + 0.01)
+            return ctx
+        return asyncio.run(run())
+
+    def test_items_are_coalesced(self) -> None:
+        """Ensure items received in one tick are sent in a single message, and only to the receiving slot."""
+        for item_send_tick in (0, 20):
+            with self.subTest(item_send_tick=item_send_tick):
+                ctx = self.send(item_send_tick)
+                self.assertEqual(len(ctx.sent), 1)
+                client, msgs = ctx.sent[0]
+                self.assertEqual(client.slot, 1)
+                self.assertEqual(msgs, [{"cmd": "ReceivedItems", "index": 0,
+                                         "items": [NetworkItem(location, location, 2, 0) for location in range(3)]}])
+                self.assertEqual(client.send_index, 3)
+                self.assertFalse(ctx.new_item_slots)
+
+
+class TestEncodeSendEvent(unittest.TestCase):
+    def test_matches_encoded_event(self) -> None:
+        """Ensure the pre-encoded item send events are the same as encoding the events themselves."""
+        for item, receiving_player in ((NetworkItem(1, 2, 3, 0), 3), (NetworkItem(77, 123456, 1, 5), 2),
+                                       (NetworkItem(-5, -1, 0, 1), 4), (NetworkItem(2, -2, 10, 4), 10)):
+            with self.subTest(item=item, receiving_player=receiving_player):
+                self.assertEqual(encode_send_event(item, receiving_player),
+                                 encode(json_format_send_event(item, receiving_player)))
+
+
+class HintTestContext(ItemSendTestContext):
+    def __init__(self) -> None:
+        super().__init__(0)
+        game_package = {"item_name_to_id": {"Key": 1, "Sword": 2}, "location_name_to_id": {"Chest": 10, "Box": 11},
+                        "item_name_groups": {}, "checksum": "test"}
+        self._load({
+            "minimum_versions": {"server": (0, 0, 0)},
+            "version": (0, 6, 2),
+            "slot_info": {1: NetworkSlot("A", "Game", SlotType.player), 2: NetworkSlot("B", "Game", SlotType.player),
+                          3: NetworkSlot("Group", "Game", SlotType.group, group_members=[1, 2])},
+            "seed_name": "1",
+            "connect_names": {"A": (0, 1), "B": (0, 2)},
+            "locations": {1: {10: (1, 2, 1), 11: (2, 3, 0)}, 2: {10: (1, 1, 1), 11: (1, 2, 0)}, 3: {}},
+            "slot_data": {},
+            "er_hint_data": {},
+            "precollected_items": {},
+            "precollected_hints": {},
+            "datapackage": {"Game": game_package},
+        }, {}, False)
+
+
+class TestHintIndex(unittest.TestCase):
+    def test_collect_hints(self) -> None:
+        """Ensure hints are found through the item index, including items for groups the slot is in."""
+        ctx = HintTestContext()
+        hints = collect_hints(ctx, 0, 2, "Key", HintStatus.HINT_PRIORITY)
+        self.assertEqual(hints, [Hint(2, 1, 10, 1, False, "", 1, HintStatus.HINT_PRIORITY),
+                                 Hint(2, 2, 11, 1, False, "", 0, HintStatus.HINT_PRIORITY)])
+        self.assertEqual(collect_hints(ctx, 0, 1, "Sword", HintStatus.HINT_PRIORITY),
+                         [Hint(3, 1, 11, 2, False, "", 0, HintStatus.HINT_PRIORITY)])
+        self.assertEqual(collect_hints(ctx, 0, 1, "Key", HintStatus.HINT_PRIORITY),
+                         [Hint(1, 2, 10, 1, False, "", 1, HintStatus.HINT_PRIORITY)])
+
+    def test_checks_update_hints(self) -> None:
+        """Ensure checking a hinted location updates the hint for everyone it concerns."""
+        async def run() -> None:
+            ctx = HintTestContext()
+            ctx.notify_hints(0, collect_hints(ctx, 0, 1, "Sword", HintStatus.HINT_PRIORITY))
+            hint = Hint(3, 1, 11, 2, False, "", 0, HintStatus.HINT_PRIORITY)
+            self.assertEqual(ctx.get_hint(0, 1, 11), hint)
+            self.assertIsNone(ctx.get_hint(0, 1, 10))
+            register_location_checks(ctx, 0, 1, [10])
+            self.assertEqual(ctx.get_hint(0, 1, 11), hint)
+            register_location_checks(ctx, 0, 1, [11])
+            found_hint = hint._replace(found=True, status=HintStatus.HINT_FOUND)
+            self.assertEqual(ctx.get_hint(0, 1, 11), found_hint)
+            for slot in (1, 2):
+                self.assertEqual([tuple(slot_hint) for slot_hint in ctx.hints[0, slot]], [tuple(found_hint)])
+        asyncio.run(run())
+
+
+class TestContextSaveJournal(unittest.TestCase):
+    def test_deltas_follow_context(self) -> None:
+        """Ensure the deltas of a Context restore the same save data as a full save, whatever changed it."""
+        async def run() -> None:
+            ctx = HintTestContext()
+            snapshot, record = ctx.get_save_record()
+            self.assertTrue(snapshot)
+            ctx.save_journal.commit()
+            file = SaveJournal.magic + record
+            self.assertEqual(ctx.get_save_record(), (False, None), "nothing changed, so there should be no delta")
+
+            def save() -> None:
+                nonlocal file
+                snapshot, record = ctx.get_save_record()
+                self.assertFalse(snapshot)
+                ctx.save_journal.commit()
+                if record:
+                    file += record
+                self.assertEqual(decode_save_journal(file), ctx.get_save())
+
+            client = Client(None, ctx)
+            client.team, client.slot, client.items_handling, client.no_text = 0, 1, 0b111, False
+            ctx.clients[0][1].append(client)
+            ctx.notify_hints(0, collect_hints(ctx, 0, 1, "Sword", HintStatus.HINT_PRIORITY))
+            register_location_checks(ctx, 0, 1, [10])
+            ctx.hints_used[0, 1] += 1
+            ctx.stored_data["counter"] = 1
+            ctx.hint_cost = 5
+            save()
+
+            processor = ServerCommandProcessor(ctx)
+            for command in ("/alias A Alias", "/send B Key", "/hint A Sword", "/option hint_cost 10", "/collect B",
+                            "/alias A"):
+                processor(command)
+                save()
+            ctx.stored_data["counter"] += 1
+            ctx.stored_data.setdefault("list", []).append(1)
+            ctx.stored_data["list"].append(2)
+            update_client_status(ctx, client, ClientStatus.CLIENT_GOAL)
+            save()
+
+            # reading defaultdicts adds keys, which have to be saved like any other change
+            self.assertFalse(ctx.location_checks[1, 1])
+            self.assertFalse(ctx.hints[1, 2])
+            save()
+            del ctx.stored_data["counter"]
+            register_location_checks(ctx, 0, 2, [10])
+            save()
+        asyncio.run(run())
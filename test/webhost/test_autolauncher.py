@@ -0,0 +1,121 @@
+import json
+import pickle
+import typing
+import unittest
+from uuid import UUID, uuid4
+
+from WebHostLib.autolauncher import GenerationJob, GenerationLane, GenerationScheduler, estimate_generation_cost, \
+    get_least_loaded
+from WebHostLib.models import STATE_QUEUED, STATE_STARTED
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self.jobs: typing.List[typing.Tuple[UUID, typing.Callable[[typing.Any], None]]] = []
+
+    def apply_async(self, func, args, kwds, callback, error_callback) -> None:
+        self.jobs.append((kwds["sid"], callback))
+
+    def finish(self, sid: UUID, baseline: int = 0, peak: int = 0) -> None:
+        callback = next(callback for job, callback in self.jobs if job == sid)
+        callback((sid, baseline, peak))
+
+
+class FakeGeneration:
+    def __init__(self, owner: UUID, players: int, game: str = "Archipelago") -> None:
+        self.id = uuid4()
+        self.owner = owner
+        self.options = pickle.dumps({f"Player{player}": {"game": game} for player in range(players)})
+        self.meta = json.dumps({})
+        self.state = STATE_QUEUED
+
+
+class TestGenerationScheduler(unittest.TestCase):
+    config = {"LARGE_GENERATION_COST": 10, "GENERATOR_MEMORY_LIMIT": 1000, "GENERATION_MEMORY_BUDGET": 1000}
+
+    def setUp(self) -> None:
+        self.small_pool, self.large_pool = FakePool(), FakePool()
+        self.scheduler = GenerationScheduler(self.config, GenerationLane("small", self.small_pool, 2),
+                                             GenerationLane("large", self.large_pool, 1))
+        self.generations: typing.List[FakeGeneration] = []
+
+    def queue(self, owner: UUID, players: int) -> FakeGeneration:
+        generation = FakeGeneration(owner, players)
+        self.generations.append(generation)
+        return generation
+
+    def schedule(self) -> None:
+        self.scheduler.schedule([generation for generation in self.generations if generation.state == STATE_QUEUED])
+
+    def test_cost(self) -> None:
+        self.assertEqual(estimate_generation_cost({"A": {"game": "A"}, "B": {"game": "A"}, "C": {"game": "B"}}), 5)
+
+    def test_large_jobs_keep_to_their_lane(self) -> None:
+        """Ensure large generations can't take small lane workers, while small ones may use idle large ones."""
+        owner = uuid4()
+        large = [self.queue(owner, 20), self.queue(owner, 20)]
+        small = [self.queue(owner, 1) for _ in range(3)]
+        self.schedule()
+        self.assertEqual([sid for sid, _ in self.large_pool.jobs], [large[0].id])
+        self.assertEqual([sid for sid, _ in self.small_pool.jobs], [small[0].id, small[1].id])
+        self.assertEqual(large[1].state, STATE_QUEUED)
+        self.small_pool.finish(small[0].id)
+        self.schedule()
+        self.assertEqual(small[2].state, STATE_STARTED)
+        self.assertEqual(large[1].state, STATE_QUEUED)
+        self.large_pool.finish(large[0].id)
+        self.schedule()
+        self.assertEqual(large[1].state, STATE_STARTED)
+
+    def test_owner_fairness(self) -> None:
+        """Ensure an owner with many queued generations doesn't get every free worker."""
+        busy, other = uuid4(), uuid4()
+        busy_generations = [self.queue(busy, 1) for _ in range(3)]
+        other_generation = self.queue(other, 1)
+        self.schedule()
+        self.assertEqual([sid for sid, _ in self.small_pool.jobs], [busy_generations[0].id, other_generation.id])
+        self.assertEqual([sid for sid, _ in self.large_pool.jobs], [busy_generations[1].id])
+
+    def test_memory_admission(self) -> None:
+        """Ensure generations wait while the memory they're expected to take doesn't fit the budget."""
+        owner = uuid4()
+        first = self.queue(owner, 3)  # cost 4
+        self.schedule()
+        self.small_pool.finish(first.id, 100, 500)  # 100 when idle, then 100 per cost
+        self.assertEqual(self.scheduler.estimate_memory(GenerationJob(uuid4(), owner, 7, 8, 0)), 900)
+        second, third = self.queue(owner, 3), self.queue(owner, 5)
+        self.schedule()
+        self.assertEqual(second.state, STATE_STARTED)
+        self.assertEqual(third.state, STATE_QUEUED)  # 500 + 700 doesn't fit
+        fourth = self.queue(owner, 1)
+        self.schedule()
+        self.assertEqual(fourth.state, STATE_QUEUED)  # would fit, but mustn't starve the one waiting longer
+        self.small_pool.finish(second.id, 100, 500)
+        self.schedule()
+        self.assertEqual(third.state, STATE_STARTED)
+        self.assertEqual(fourth.state, STATE_STARTED)
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual([job["id"] for job in metrics["finished"]], [first.id, second.id])
+        self.assertEqual(metrics["finished"][0]["memory"], 500)
+        self.assertEqual([job["id"] for job in metrics["running"]], [third.id, fourth.id])
+
+
+class FakeHoster:
+    def __init__(self, rooms: int, connections: int, memory: int) -> None:
+        self.room_ids = set(range(rooms))
+        self.load = [rooms, connections, memory]
+
+
+class TestRoomPlacement(unittest.TestCase):
+    def test_least_loaded(self) -> None:
+        """Ensure new rooms go to the hoster with the least rooms, connections and memory, relative to the others."""
+        busy, idle = FakeHoster(10, 40, 1000), FakeHoster(10, 0, 1000)
+        self.assertIs(get_least_loaded([busy, idle]), idle)
+        large = FakeHoster(10, 0, 3000)
+        self.assertIs(get_least_loaded([large, idle]), idle)
+        self.assertIs(get_least_loaded([FakeHoster(20, 0, 2000), idle]), idle)
+
+    def test_unreported(self) -> None:
+        """Ensure hosters that didn't report yet get placed by their room count."""
+        hosters = [FakeHoster(2, 0, 0), FakeHoster(1, 0, 0), FakeHoster(3, 0, 0)]
+        self.assertIs(get_least_loaded(hosters), hosters[1])
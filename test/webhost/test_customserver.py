@@ -0,0 +1,121 @@
+import asyncio
+import datetime
+import logging
+import pickle
+import unittest
+from pathlib import Path
+from uuid import uuid4
+
+from flask import url_for
+
+from WebHostLib.customserver import StaticGameNames, WebHostContext, get_static_server_data
+from . import TestBase
+
+
+class TestStaticGameNames(unittest.TestCase):
+    def test_rooms_share_static_names(self) -> None:
+        """Ensure rooms use the names looked up once for the static data packages, instead of their own copies."""
+        static_server_data = get_static_server_data()
+        names = StaticGameNames(static_server_data)
+        self.assertEqual(names.item_names["Archipelago"][-1], "Nothing")
+        for game, package in static_server_data["gamespackage"].items():
+            self.assertEqual(dict(names.location_names[game]),
+                             {**{location_id: location_name
+                                 for location_name, location_id in package["location_name_to_id"].items()},
+                              **names.location_names["Archipelago"]})
+
+        async def load() -> WebHostContext:
+            WebHostContext.static_names = names
+            try:
+                ctx = WebHostContext(static_server_data, logging.getLogger("TestStaticGameNames"))
+                custom = {**static_server_data["gamespackage"]["Archipelago"], "checksum": "custom"}
+                ctx.gamespackage = {**ctx.gamespackage, "Custom": custom}
+                ctx.item_name_groups = {**ctx.item_name_groups, "Custom": {}}
+                ctx._init_game_data()
+                return ctx
+            finally:
+                WebHostContext.static_names = None
+
+        ctx = asyncio.run(load())
+        self.assertIs(ctx.item_names["Archipelago"], names.item_names["Archipelago"])
+        self.assertIs(ctx.all_location_and_group_names["Archipelago"],
+                      names.all_location_and_group_names["Archipelago"])
+        self.assertNotIn("Custom", names.item_names)
+        self.assertEqual(ctx.item_names["Custom"], names.item_names["Archipelago"])
+        self.assertEqual(ctx.checksums["Custom"], "custom")
+
+
+class TestHibernation(TestBase):
+    def setUp(self) -> None:
+        from pony.orm import db_session
+        from MultiServer import Context
+        from WebHostLib.models import GameDataPackage, Room, Seed
+
+        super().setUp()
+        with (Path(__file__).parent / "data" / "One_Archipelago.archipelago").open("rb") as f:
+            data = f.read()
+        self.tracker_uuid = uuid4()
+        with db_session:
+            for game_data in Context.decompress(data)["datapackage"].values():
+                if not GameDataPackage.get(checksum=game_data["checksum"]):
+                    GameDataPackage(checksum=game_data["checksum"], data=pickle.dumps(game_data))
+            seed = Seed(multidata=data, owner=uuid4())
+            self.room_id = Room(seed=seed, owner=seed.owner, tracker=self.tracker_uuid, last_port=12345).id
+
+    def tearDown(self) -> None:
+        from pony.orm import db_session
+        from WebHostLib.models import Room
+
+        with db_session:
+            room = Room.get(id=self.room_id)
+            room.seed.delete()
+            room.delete()
+
+    def test_resume(self) -> None:
+        """Ensure a room resumes from its resume image as it was, while trackers read the save from hibernating."""
+        from pony.orm import db_session
+        from WebHostLib.customserver import load_room_save
+        from WebHostLib.models import Room
+
+        deadline = datetime.datetime.now(datetime.timezone.utc)
+
+        async def hibernate_and_resume() -> WebHostContext:
+            ctx = WebHostContext(get_static_server_data(), logging.getLogger("TestHibernation"))
+            ctx.load(self.room_id)
+            ctx.init_save()
+            ctx.auto_shutdown = 60
+            ctx.hints_used[0, 1] = 3
+            ctx.name_aliases[0, 1] = "Alias"
+            image = ctx.hibernate(deadline)
+            self.assertTrue(ctx.exit_event.is_set())
+            self.assertEqual((image.port, image.auto_shutdown, image.deadline), (12345, 60, deadline))
+
+            resumed = WebHostContext(get_static_server_data(), logging.getLogger("TestHibernation"))
+            resumed.resume(image)
+            resumed.exit_event.set()
+            return resumed
+
+        ctx = asyncio.run(hibernate_and_resume())
+        self.assertEqual(ctx.room_id, self.room_id)
+        self.assertEqual(ctx.hints_used[0, 1], 3)
+        self.assertEqual(ctx.name_aliases[0, 1], "Alias")
+        self.assertEqual(ctx.player_names[0, 1], "Player1")
+        with db_session:
+            self.assertEqual(load_room_save(Room.get(id=self.room_id))["hints_used"], {(0, 1): 3})
+        with self.app.app_context(), self.app.test_request_context():
+            response = self.client.get(url_for("get_player_tracker", tracker=self.tracker_uuid,
+                                               tracked_team=0, tracked_player=1))
+            self.assertEqual(response.status_code, 200)
+
+    def test_pending_commands(self) -> None:
+        """Ensure commands sent to a hibernating room are noticed, so they can wake it."""
+        from pony.orm import db_session
+        from WebHostLib.customserver import has_pending_commands
+        from WebHostLib.models import Command, Room
+
+        self.assertFalse(has_pending_commands(self.room_id))
+        with db_session:
+            command = Command(room=Room.get(id=self.room_id), commandtext="/help")
+        self.assertTrue(has_pending_commands(self.room_id))
+        with db_session:
+            Command[command.id].delete()
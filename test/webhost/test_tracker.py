@@ -93,3 +93,115 @@ class TestTracker(TestBase):
                 headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00"},  # missing timezone
             )
             self.assertEqual(response.status_code, 400)
+
+    def test_decoded_data_is_shared(self) -> None:
+        """
+        Verify that trackers share the decoded multidata of a seed and the data packages it uses
+        """
+        from pony.orm import db_session
+        from WebHostLib.models import Room
+        from WebHostLib.tracker import TrackerData
+
+        with self.app.app_context(), db_session:
+            room = Room.get(id=self.room_id)
+            first, second = TrackerData(room), TrackerData(room)
+            self.assertIs(first._multidata, second._multidata)
+            for game in first._multidata["datapackage"]:
+                self.assertIs(first.item_id_to_name[game], second.item_id_to_name[game])
+                self.assertIs(first.location_name_to_id[game], second.location_name_to_id[game])
+
+    def test_sized_lru_cache(self) -> None:
+        """
+        Verify that the decoded data cache evicts the least recently used entries once it is over its size limit
+        """
+        from WebHostLib.tracker import _SizedLRUCache
+
+        self.app.config["TEST_CACHE_SIZE"] = 10
+        cache = _SizedLRUCache("TEST_CACHE_SIZE")
+        self.assertEqual(cache.get(1, lambda: ("a", 6)), "a")
+        self.assertEqual(cache.get(2, lambda: ("b", 4)), "b")
+        self.assertEqual(cache.get(1, lambda: ("x", 6)), "a")
+        self.assertEqual(cache.get(3, lambda: ("c", 3)), "c")  # evicts 2, as 1 was used more recently
+        self.assertEqual(cache.get(1, lambda: ("x", 6)), "a")
+        self.assertEqual(cache.get(2, lambda: ("d", 4)), "d")  # evicts 3
+        self.assertEqual(cache.size, 10)
+
+    def test_live_progress(self) -> None:
+        """
+        Verify that trackers of running rooms show the progress published by the room and return to the database after
+        """
+        from pony.orm import db_session
+        from NetUtils import NetworkItem
+        from WebHostLib.models import Room
+        from WebHostLib.tracker import TrackerData, apply_room_progress
+
+        item = NetworkItem(1, 2, 1, 0)
+        with self.app.app_context(), db_session:
+            room = Room.get(id=self.room_id)
+            apply_room_progress(self.tracker_uuid, {"location_checks": {(0, 1): {2}},
+                                                    "received_items": {(0, 1, True): (0, [item])}})
+            apply_room_progress(self.tracker_uuid, {"location_checks": {(0, 1): {3}},
+                                                    "received_items": {(0, 1, True): (0, [item])}})
+            tracker_data = TrackerData(room)
+            self.assertEqual(tracker_data.get_player_checked_locations(0, 1), {2, 3})
+            self.assertEqual(tracker_data.get_player_received_items(0, 1), [item])
+            apply_room_progress(self.tracker_uuid, None)
+            self.assertEqual(TrackerData(room).get_player_checked_locations(0, 1), set())
+
+    def test_aggregates_follow_progress(self) -> None:
+        """
+        Verify that aggregates updated from live progress match aggregates computed from the whole save
+        """
+        from NetUtils import ClientStatus, NetworkItem
+        from WebHostLib.tracker import LiveRoom, RoomAggregates, apply_room_progress, _live_rooms
+
+        apply_room_progress(self.tracker_uuid, {
+            "location_checks": {(0, 1): {1, 2}},
+            "received_items": {(0, 1, True): (0, [NetworkItem(5, 1, 1, 0)])},
+            "client_game_state": {(0, 1): ClientStatus.CLIENT_PLAYING},
+        })
+        apply_room_progress(self.tracker_uuid, {
+            "location_checks": {(0, 1): {3}},
+            "received_items": {(0, 1, True): (1, [NetworkItem(5, 2, 1, 0), NetworkItem(6, 3, 1, 0)])},
+            "client_game_state": {(0, 1): ClientStatus.CLIENT_GOAL},
+            "client_activity_timers": (((0, 1), 1.0),),
+        })
+        live_room: LiveRoom = _live_rooms[self.tracker_uuid]
+        apply_room_progress(self.tracker_uuid, None)
+        self.assertEqual(live_room.aggregates, RoomAggregates.from_save(live_room.savedata))
+        self.assertEqual(live_room.aggregates.checked_counts, {(0, 1): 3})
+        self.assertEqual(live_room.aggregates.inventories, {(0, 1): {5: 2, 6: 1}})
+        self.assertEqual(live_room.aggregates.goals, {(0, 1)})
+
+    def test_stored_aggregates(self) -> None:
+        """
+        Verify that trackers use the aggregates stored along with a room's save, without loading the save for them
+        """
+        import collections
+        from pony.orm import db_session
+        from NetUtils import NetworkItem
+        from WebHostLib.models import Room, TrackerAggregates
+        from WebHostLib.tracker import RoomAggregates, TrackerData
+
+        savedata = {"location_checks": {(0, 1): {1, 2}},
+                    "received_items": {(0, 1, True): [NetworkItem(5, 1, 1, 0), NetworkItem(5, 2, 1, 0)]}}
+        aggregates = RoomAggregates.from_save(savedata)
+        self.assertEqual(RoomAggregates.from_record(aggregates.to_record()), aggregates)
+        with db_session:
+            room = Room.get(id=self.room_id)
+            room.multisave = pickle.dumps(savedata)
+            TrackerAggregates(room=room, data=aggregates.to_record())
+        with self.app.app_context(), db_session:
+            tracker_data = TrackerData(Room.get(id=self.room_id))
+            self.assertEqual(tracker_data.get_player_inventory_counts(0, 1), collections.Counter({5: 2}))
+            self.assertEqual(tracker_data._aggregates, aggregates)
+            self.assertIsNone(tracker_data._loaded_multisave)
+            self.assertEqual(tracker_data.get_player_checked_locations(0, 1), {1, 2})
+
+    def test_event_stream_falls_back_to_polling(self) -> None:
+        """Verify that viewers of a room without a live model in this process are told to poll"""
+        with self.app.app_context(), self.app.test_request_context():
+            response = self.client.get(url_for("get_tracker_events", tracker=self.tracker_uuid))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.mimetype, "text/event-stream")
+            self.assertTrue(response.get_data(as_text=True).startswith("event: poll\n"))
@@ -188,9 +188,17 @@ def call_single(multiworld: "MultiWorld", method_name: str, player: int, *args:
         return ret
 
 
-def call_all(multiworld: "MultiWorld", method_name: str, *args: Any) -> None:
+def call_all(multiworld: "MultiWorld", method_name: str, *args: Any,
+             isolated_items: Optional[Mapping[int, Mapping[str, List["Item"]]]] = None) -> None:
+    """
+    :param isolated_items: the items of worlds that already ran this step in a separate process, by player and step,
+        which get added to the itempool where calling their world would have added them
+    """
     world_types: Set[AutoWorldRegister] = set()
     for player in multiworld.player_ids:
+        if isolated_items and method_name in isolated_items.get(player, {}):
+            multiworld.itempool += isolated_items[player][method_name]
+            continue
         prev_item_count = len(multiworld.itempool)
         world_types.add(multiworld.worlds[player].__class__)
         call_single(multiworld, method_name, player, *args)
@@ -315,6 +323,13 @@ class World(metaclass=AutoWorldRegister):
     If False, everything is rechecked at every step, which is slower computationally, 
     but may be desirable in complex/dynamic worlds."""
 
+    isolated_generation: ClassVar[bool] = False
+    """If True, generate_early, create_regions, create_items and set_rules only read and modify this world's own data
+    and only use self.random, so each of them can run in a separate process when world_generation_processes is set in
+    the host.yaml. A step runs in the main process instead if it changed data outside of the world or leaves anything
+    in the world that can't be pickled, like lambdas used as rules. Worlds with stage methods for these steps are never
+    isolated."""
+
     multiworld: "MultiWorld"
     """autoset on creation. The MultiWorld object for the currently generating multiworld."""
     player: int
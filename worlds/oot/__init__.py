@@ -883,7 +883,7 @@ class OOTWorld(World):
         def prefill_state(base_state):
             state = base_state.copy()
             for item in self.get_pre_fill_items():
-                self.collect(state, item)
+                state.collect(item, True)
             state.sweep_for_advancements(locations=self.get_locations())
             return state
 
@@ -2,6 +2,7 @@ import asyncio
 import json
 import os
 import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from CommonClient import get_base_parser, CommonContext, gui_enabled, server_loop, logger
 from NetUtils import NetworkItem
@@ -9,12 +10,86 @@ from settings import get_settings
 from worlds.tboirp.Settings import TBOISettings
 
 
+class GameOutputWatcher:
+    """
+    Follows the file the game writes its events to.
+    The mod appends one JSON record per line and never rewrites earlier lines, so only the bytes past the last read
+    are parsed. A file that was replaced, shrank, or no longer ends in the last parsed bytes at the offset is a new
+    file and is read from the start again. A file without any line ending is a whole-file snapshot (as written by older
+    mod versions) and is parsed as a single record.
+    """
+    interval: float = 0.2 # Seconds between checks of the file's size and modification time
+    tail_size: int = 64 # How many of the parsed bytes are kept to recognize rewritten files
+
+    path: str
+    offset: int # Byte offset up to which records have been parsed
+    tail: bytes # The last parsed bytes, which have to still be in front of the offset for it to be valid
+    last_stat: Optional[Tuple[int, int, int]] # (inode, modification time, size) of the file when it was last read
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        self.tail = b""
+        self.last_stat = None
+
+    def modified(self) -> Optional[float]:
+        """Returns the time the file was last written to, or None if it doesn't exist."""
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def read(self) -> List[Dict[str, Any]]:
+        """Returns the records written since the last call, without opening the file if it hasn't changed."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return []
+
+        if (stat.st_ino, stat.st_mtime_ns, stat.st_size) == self.last_stat:
+            return []
+        if (self.last_stat and stat.st_ino != self.last_stat[0]) or stat.st_size < self.offset:
+            self.offset, self.tail = 0, b""
+        self.last_stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        # We want to leave the file handle open as little as we can, so quickly read the new data and drop the handle
+        with open(self.path, "rb") as file:
+            file.seek(self.offset - len(self.tail))
+            if file.read(len(self.tail)) != self.tail: # Rewritten in place to the same or a larger size
+                self.offset, self.tail = 0, b""
+                file.seek(0)
+            data = file.read()
+
+        if self.offset == 0 and data and b"\n" not in data:
+            try:
+                return [json.loads(data)]
+            except ValueError: # Caught while the game is writing the file, the next change will have all of it
+                return []
+
+        # A partially written last line is left for the next read
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        self.tail = (self.tail + data[:end])[-self.tail_size:]
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logger.warning(f"Skipping malformed record from the game: {line[:100]!r}")
+        return records
+
+    async def wait(self) -> None:
+        await asyncio.sleep(self.interval)
+
+
 class TBOIContext(CommonContext):
     game = "The Binding of Isaac: Repentance+"
     items_handling = 0b111
 
-    locations_checked = set[int] # Location IDs that have been checked locally
-    locations_scouted = set[int] # Location IDs that have been scouted locally
+    locations_checked: set[int] # Location IDs that have been checked locally
+    locations_scouted: set[int] # Location IDs that have been scouted locally
 
     items_received: list[NetworkItem] # Items received from server
     missing_locations: set[int] # Unchecked locations from server
@@ -28,14 +103,26 @@ class TBOIContext(CommonContext):
     save_slot: int
 
     game_output_file_path: str # The file that will be scanned for outgoing messages from the game, then deleted (the primary mod)
-    game_input_file_path: str # The file that will be written to pass data to the game (the supplemental mod)
+    game_input_file_path: Optional[str] # The file that will be written to pass data to the game (the supplemental mod)
+    game_output: GameOutputWatcher
+
+    game_number: int # The last message number the game wrote
+    game_input_content: Optional[str] # What was last written to the input file
 
     def __init__(self, server_address, password, game_directory: str, save_slot: int):
         super().__init__(server_address, password)
 
         self.game_directory = game_directory
+        self.save_slot = save_slot
 
         self.game_output_file_path = os.path.join(game_directory, "data", "archipelago", "save{slot}.dat".format(slot=save_slot))
+        self.game_input_file_path = None
+        self.game_output = GameOutputWatcher(self.game_output_file_path)
+
+        self.locations_checked = set()
+        self.locations_scouted = set()
+        self.game_number = 0
+        self.game_input_content = None
 
     def run_gui(self):
         from kvui import GameManager
@@ -53,33 +140,27 @@ class TBOIContext(CommonContext):
         logger.info("Please start a run with the Archipelago mod and the supplemental mod installed.")
 
         while not self.auth:
-            await asyncio.sleep(5)
+            await self.game_output.wait()
 
-            if not os.path.isfile(self.game_output_file_path): # File doesn't exist
+            timestamp = self.game_output.modified()
+            if timestamp is None: # File doesn't exist
                 continue
 
-            timestamp = os.path.getmtime(self.game_output_file_path)
-
             # File is too old, it needs to have been written to in the last minute for the game to be considered active
             if time.time() - timestamp > 60:
                 continue
 
-            # File is new enough, try to get the slot name from it
-            contents: str
-            with open(self.game_output_file_path, "r") as file:
-                contents = file.read()
-                file.close()
+            records = self.game_output.read()
+            if not records:
+                continue
 
-            # Ensure the ap-data object exists
-            data = json.loads(contents)
-            if "ap_data" not in data:
+            # Ensure the ap-data object exists, in an event log it is part of the first record of the run
+            ap_data = next((record["ap_data"] for record in records if "ap_data" in record), None)
+            if ap_data is None:
                 logger.info("No Archipelago data in file! Is the supplemental mod installed?")
+                self.game_output.offset = 0 # Look at the whole file again once it changes
                 continue
 
-            ap_data = data["ap_data"]
-
-            logger.info(ap_data)
-
             # Ensure the data is there
             if "seed_name" not in ap_data or "slot_name" not in ap_data:
                 logger.info("Critical data missing from file!!")
@@ -89,6 +170,9 @@ class TBOIContext(CommonContext):
             self.auth = ap_data["slot_name"]
             self.seed_name = ap_data["seed_name"] # Will automatically get disconnect if there is a mismatch
 
+        # Everything the game has written so far still needs to be delivered once connected
+        self.game_output.offset = 0
+        self.game_output.last_stat = None
 
     async def server_auth(self, password_requested: bool = False):
         if password_requested and not self.password:
@@ -99,38 +183,33 @@ class TBOIContext(CommonContext):
 
 async def progression_watcher(ctx: TBOIContext):
     while not ctx.exit_event.is_set():
+        await ctx.game_output.wait()
+
         if not ctx.slot_name: # Game isn't connected yet
-            await asyncio.sleep(5)
             continue
 
         # Set the input file path
         if ctx.game_input_file_path is None:
-            ctx.game_input_file_path = os.path.join(ctx.game_directory, "mods", f"_AP-TBOIRP-{ctx.seed_name}-{ctx.slot_info[ctx.slot].name}", "incoming_ap_data.lua".format(slot=ctx.save_slot))
+            ctx.game_input_file_path = os.path.join(ctx.game_directory, "mods", f"_AP-TBOIRP-{ctx.seed_name}-{ctx.slot_info[ctx.slot].name}", "incoming_ap_data.lua")
 
         send_locations = []
         hint_locations = []
-        number = 0
         try:
-            # We want to leave the file handle open as much as we can, so quickly read the file and drop the handle
-            with open(ctx.game_output_file_path ,"r") as file:
-                content = file.read()
-                file.close()
-
-            data = json.loads(content)
-
-            logger.info(content)
-
-            number = data["number"] if data["number"] else 0
-
-            # Send any locations that need to be sent
-            if "send_locations" in data:
-                for location_id in data["send_locations"]:
-                    send_locations.append(location_id)
-
-            # Send any hints that need to be sent
-            if "hint_locations" in data:
-                for location_id in data["hint_locations"]:
-                    hint_locations.append(location_id)
+            for record in ctx.game_output.read():
+                if record.get("number"):
+                    ctx.game_number = record["number"]
+
+                # Send any locations that haven't been sent yet, a snapshot of the whole file repeats earlier ones
+                for location_id in record.get("send_locations", ()):
+                    if location_id not in ctx.locations_checked:
+                        ctx.locations_checked.add(location_id)
+                        send_locations.append(location_id)
+
+                # Send any hints that haven't been sent yet
+                for location_id in record.get("hint_locations", ()):
+                    if location_id not in ctx.locations_scouted:
+                        ctx.locations_scouted.add(location_id)
+                        hint_locations.append(location_id)
         except Exception as exc:
             logger.error(exc)
         finally:
@@ -147,19 +226,20 @@ async def progression_watcher(ctx: TBOIContext):
                     "create_as_hint": int(2)
                 }])
 
-        try:
-            # We need to convert the JSON to a lua string so we can import it properly in-game
-            out_json = json.dumps({"number": number + 1}).replace('"', '\\\"')
-            out_content = "jsonString=\"{json}\"".format(json=out_json) # All quotes need to be escaped
-
-            # We want to leave the file handle open as much as we can, so quickly read the file and drop the handle
-            with open(ctx.game_input_file_path ,"w") as file:
-                content = file.write(out_content)
-                file.close()
-        finally:
-            pass
+        # We need to convert the JSON to a lua string so we can import it properly in-game
+        out_json = json.dumps({"number": ctx.game_number + 1}).replace('"', '\\\"')
+        out_content = "jsonString=\"{json}\"".format(json=out_json) # All quotes need to be escaped
+
+        # Only touch the file when there is something new for the game
+        if out_content == ctx.game_input_content:
+            continue
 
-        await asyncio.sleep(5)
+        try:
+            with open(ctx.game_input_file_path, "w") as file:
+                file.write(out_content)
+            ctx.game_input_content = out_content
+        except OSError as exc:
+            logger.error(exc)
 
 settings: TBOISettings = get_settings().tboirp_options
 
@@ -33,41 +33,79 @@ character_items = [
     "The Zealot", "The Deserter"
 ]
 
+class PlayerItems:
+    """
+    A player's changes to the shared items table. Only items the player changed are stored here, every other item is
+    looked up in items_data.
+    """
+    changed: Dict[str, ItemData]
+
+    def __init__(self):
+        self.changed = {}
+
+    def __getitem__(self, name: str) -> ItemData:
+        data = self.changed.get(name)
+        return items_data[name] if data is None else data
+
+    def set_item_classification(self, name: str, classification: ItemClassification):
+        """
+        Just sets an item's classification in the items table.
+        """
+        self.changed[name] = self[name]._replace(classification=classification)
+
+    def add_count_to_item(self, name: str, amount_to_add: int):
+        """
+        Adds copies of the item to the pool
+        """
+        data = self[name]
+        self.changed[name] = data._replace(amount=data.amount + amount_to_add)
+
+    def set_pools_to_item(self, name: str, pools: list[Pool]):
+        """
+        Sets the item's pools
+        """
+        self.changed[name] = self[name]._replace(pools=pools)
+
+baby_items = [name for name, data in items_data.items() if "Co-Op_Baby" in data.categories]
+challenge_items = [name for name, data in items_data.items() if "Challenge" in data.categories]
+collectible_items = [name for name, data in items_data.items() if "Item" in data.categories[0] and len(data.pools) > 0]
+
 """
-The way this works, is that we'll modify the existing items table(IDs are not changed), and then use that modified items table to specify
-items. *These* items will actually be used in the Archipelago world (not unlocked by default).
+The way this works, is that we'll modify the player's items table (IDs are not changed), and then use that modified items
+table to specify items. *These* items will actually be used in the Archipelago world (not unlocked by default).
 """
 def generate_items_for_pool(world: "TBOIWorld", location_count: int, included_locations_count: int, exclude_items: list[str]) -> Dict[str, ItemData]:
     print("Need to generate {count} items".format(count=location_count))
+    items = world.player_items
 
     # If we're in Baby Hunt, pick some babies to make Progressive
     if world.options.game_mode.option_baby_hunt:
-        for name in world.random.choices([name for name in items_data if "Co-Op_Baby" in items_data[name].categories]):
-            set_item_classification(name, ItemClassification.progression_skip_balancing)
+        for name in world.random.choices(baby_items):
+            items.set_item_classification(name, ItemClassification.progression_skip_balancing)
 
     # Set challenges to filler if they don't contribute anything
     if world.options.include_challenges == world.options.include_challenges.option_remove:
-        for name in world.random.choices([name for name in items_data if "Challenge" in items_data[name].categories]):
-            set_item_classification(name, ItemClassification.filler)
+        for name in world.random.choices(challenge_items):
+            items.set_item_classification(name, ItemClassification.filler)
 
     # Filter out any of the 'excluded' items (as well as victory, and traps/fillers)
-    filtered_items = {name: data for name, data in items_data.items() if name not in exclude_items and data.categories[0] not in ["Victory", "Trap", "Filler"]}
+    filtered_items = {name: items[name] for name, data in items_data.items() if name not in exclude_items and data.categories[0] not in ["Victory", "Trap", "Filler"]}
 
     # All of these MUST get added
     progression_items = [name for name, data in filtered_items.items() if data.classification in [ItemClassification.progression]]
 
     # If on Baby Hunt, select some babies to add
     if world.options.game_mode == world.options.game_mode.option_baby_hunt:
-        all_babies = [name for name, data in items_data.items() if "Co-Op_Baby" in data.categories]
+        all_babies = baby_items.copy()
         world.random.shuffle(all_babies)
 
         # Set chosen babies to be progression & add them to the progression items list
         for baby in all_babies[:world.options.max_babies]:
-            set_item_classification(baby, ItemClassification.progression_skip_balancing)
+            items.set_item_classification(baby, ItemClassification.progression_skip_balancing)
             progression_items.append(baby)
 
     # Items to add to the pool as filler
-    shuffle_items = [name for name, data in filtered_items.items() if data.classification == ItemClassification.filler and "Co-Op_Baby" not in items_data[name].categories]
+    shuffle_items = [name for name, data in filtered_items.items() if data.classification == ItemClassification.filler and "Co-Op_Baby" not in data.categories]
 
     # If we're locking only the standard unlockable items, then filter the default items out
     if not world.options.lock_all_items:
@@ -77,74 +115,51 @@ def generate_items_for_pool(world: "TBOIWorld", location_count: int, included_lo
     # Do this by selecting a number of high quality items, removing them from the shuffle pool and inserting them into
     # the progression pool
     higher_tier_items = [name for name in shuffle_items if items_data[name].quality is not None and items_data[name].quality >= 3]
+    promoted_items = set()
     for name in world.random.choices(higher_tier_items, k=floor(included_locations_count / 4)):
-        if not name in shuffle_items:
-            continue # The item is actually a default item (and we're filtering them out), so we don't need to remove it here
+        if name in promoted_items:
+            continue # The item was picked more than once
 
-        shuffle_items.remove(name)
+        promoted_items.add(name)
         progression_items.append(name)
+    shuffle_items = [name for name in shuffle_items if name not in promoted_items]
 
     # At this point, we simply select items from the filler until we max out the location count
-    items_to_use = {name: items_data[name] for name in progression_items}
+    items_to_use = {name: items[name] for name in progression_items}
 
     location_count -= len(items_to_use.items()) # Since they are guaranteed to appear...
     world.random.shuffle(shuffle_items) # Shuffle the items, so we take a 'random' selection of them
     other_items_to_add = shuffle_items[:min(location_count, len(shuffle_items))]
     for name in other_items_to_add:
-        items_to_use[name] = items_data[name]
+        items_to_use[name] = items[name]
 
     location_count -= len(other_items_to_add)
 
     # We still have unfilled locations, so let's get some random items and fill
     while location_count > 0:
         name = world.get_filler_item_name()
-        add_count_to_item(name, 1) # Add a copy of the item
+        items.add_count_to_item(name, 1) # Add a copy of the item
         location_count -= 1
 
-        items_to_use[name] = items_data[name]
-
-    # Ensure that this is all correct, I guess?
-    total = 0
-    for name, data in items_to_use.items():
-        total += data.amount
+        items_to_use[name] = items[name]
 
     return items_to_use
 
-"""
-Just sets an item's classification in the items table.
-"""
-def set_item_classification(name: str, classification: ItemClassification):
-    data = items_data[name]
-    items_data[name] = ItemData(data.code, classification, data.categories, data.achievement, data.internal_id, data.amount, data.quality, data.pools)
-
-"""
-Adds 1 copy of the item to the pool
-"""
-def add_count_to_item(name: str, amount_to_add: int):
-    data = items_data[name]
-    items_data[name] = ItemData(data.code, data.classification, data.categories, data.achievement, data.internal_id, data.amount + amount_to_add, data.quality, data.pools)
-
-"""
-Sets the item's pools
-"""
-def set_pools_to_item(name: str, pools: list[Pool]):
-    data = items_data[name]
-    items_data[name] = ItemData(data.code, data.classification, data.categories, data.achievement, data.internal_id, data.amount, data.quality, pools)
-
 # TODO: Make this shuffle greed mode separately (ideally)
 def do_pool_rando_shuffle(world: "TBOIWorld"):
-    collectibles: dict[str, ItemData] = {name: data for name, data in items_data.items() if "Item" in data.categories[0] and len(data.pools) > 0}
+    items = world.player_items
 
     pool_pool: list[Pool] = [] # This is hilarious
-    for name, data in collectibles.items():
-        pool_pool.extend(data.pools)
+    for name in collectible_items:
+        pool_pool.extend(items[name].pools)
 
     world.random.shuffle(pool_pool) # Shuffle em
 
     returned_pools: dict[str, list[TBOIPoolEntry]] = {} # These will be set in the world's data
 
     # Do shuffle
-    for name, data in collectibles.items():
+    for name in collectible_items:
+        data = items[name]
         num_of_pools = len(data.pools)
 
         new_pools: list[Pool] = []
@@ -156,8 +171,8 @@ def do_pool_rando_shuffle(world: "TBOIWorld"):
             # Set in world data
             returned_pools.setdefault(entry.pool, []).append(TBOIPoolEntry(data.internal_id, entry.weight))
 
-        # Set in items table
-        set_pools_to_item(name, new_pools)
+        # Set in the player's items table
+        items.set_pools_to_item(name, new_pools)
 
     return returned_pools
 
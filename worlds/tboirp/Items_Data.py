@@ -0,0 +1 @@
+items_data.py
\ No newline at end of file
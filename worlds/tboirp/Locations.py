@@ -1,15 +1,18 @@
+from functools import lru_cache
 from math import floor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Tuple
 
 from BaseClasses import Location, Region, LocationProgressType
-from .Locations_Data import locations_data, LocationData
-from ..generic.Rules import CollectionRule
+from .Locations_Data import locations_data, LocationData, PlayerRule
+from .Options import IncludeChallenges, IncludeGreedMode, IncludeRepetitiousLocations
+from .Rules import RegionRule
 
 if TYPE_CHECKING:
     from . import TBOIWorld
 
 class TBOILocation(Location):
     game = "The Binding of Isaac: Repentance+"
+    region_rule: Optional[RegionRule] = None # Compiled into the access rule in set_rules
 
     def __init__(self, player: int, data: LocationData, region: Region):
         name = data.name
@@ -17,90 +20,108 @@ class TBOILocation(Location):
             name = "{name} ({repeats}x)".format(name = data.name, repeats = data.repetitions)
 
         super().__init__(player, name, data.code, region)
-        self.access_rule = data.access_rule
+        rule = data.access_rule
+        self.access_rule = lambda state: rule(state, player)
+        if isinstance(rule, RegionRule):
+            self.region_rule = rule
         self.progress_type = data.progress_type
 
-def make_locations(world: "TBOIWorld") -> list[LocationData]:
-    ply = world.player
-    babies = world.options.max_babies
-    baby_ratio = world.options.baby_ratio_required
-
-    locations = locations_data(world.player)
+class LocationOptions(NamedTuple):
+    """The options that decide which locations a player has, worlds with the same ones share their locations."""
+    greed_mode: int
+    challenges: int
+    repetitious: int
+    shop_donations: int
+    greed_donations: int
+    consumable_locations: int
+    required_babies: int
+
+def get_location_options(world: "TBOIWorld") -> LocationOptions:
+    options = world.options
+    return LocationOptions(options.include_greed_mode.value, options.include_challenges.value,
+                           options.include_repetitious.value, options.shop_donations.value,
+                           options.greed_donations.value, options.consumable_locations.value,
+                           floor(options.max_babies.value * (options.baby_ratio_required.value / 100)))
+
+def make_locations(world: "TBOIWorld") -> Tuple[LocationData, ...]:
+    """Returns the locations that exist for a player, excluded ones included."""
+    return locations_for_options(get_location_options(world))
+
+@lru_cache(maxsize=64) # Bounded, as long running processes keep seeing new option combinations
+def locations_for_options(options: LocationOptions) -> Tuple[LocationData, ...]:
+    locations = list(locations_data())
+    index: Dict[str, int] = {data.name: i for i, data in enumerate(locations)}
 
     # Set location access rule for co-op baby victory
-    set_location_access_rule(locations, [data for data in locations if data.name == "Victory (Baby Hunt)"][0],
-                             lambda s: s.has_group("Co-Op Baby", ply, floor(babies * (baby_ratio / 100))))
+    required_babies = options.required_babies
+    set_location_access_rule(locations, index["Victory (Baby Hunt)"],
+                             lambda s, p: s.has_group("Co-Op Baby", p, required_babies))
 
      # Exclude some locations
-    greed_value = world.options.include_greed_mode.value
-    challenge_value = world.options.include_challenges.value
-    repetitious_value = world.options.include_repetitious.value
-    for location in locations:
+    greed_value = options.greed_mode
+    challenge_value = options.challenges
+    repetitious_value = options.repetitious
+    for i, location in enumerate(locations):
 
         # Edit challenges
         if "Challenge" in location.categories:
-            if challenge_value == world.options.include_challenges.option_exclude: # Exclude
-                exclude_location(locations, location)
-            elif challenge_value == world.options.include_challenges.option_remove: # Remove
-                remove_location(locations, location)
+            if challenge_value == IncludeChallenges.option_exclude: # Exclude
+                exclude_location(locations, i)
+            elif challenge_value == IncludeChallenges.option_remove: # Remove
+                remove_location(locations, i)
 
         # No Greed Mode? (Insert Megamind image)
-        if greed_value != world.options.include_greed_mode.option_greed_and_greedier and (location.region in ["Greed Mode", "Greedier Mode"] or "All Marks" in location.categories):
-            if location.region == "Greed Mode" and greed_value == world.options.include_greed_mode.option_greed_mode_only:
+        if greed_value != IncludeGreedMode.option_greed_and_greedier and (location.region in ["Greed Mode", "Greedier Mode"] or "All Marks" in location.categories):
+            if location.region == "Greed Mode" and greed_value == IncludeGreedMode.option_greed_mode_only:
                 continue
 
-            if location.region == "Greedier Mode" and greed_value == world.options.include_greed_mode.option_greedier_mode_only:
+            if location.region == "Greedier Mode" and greed_value == IncludeGreedMode.option_greedier_mode_only:
                 continue
 
-            exclude_location(locations, location)
+            exclude_location(locations, i)
 
         # If we are excluding/removing repetitious locations
-        if repetitious_value != world.options.include_repetitious.option_include and location.repetitions > 1:
-            if repetitious_value == world.options.include_repetitious.option_exclude: # Exclude
-                exclude_location(locations, location)
-            elif repetitious_value == world.options.include_repetitious.option_remove: # Remove
-                remove_location(locations, location)
+        if repetitious_value != IncludeRepetitiousLocations.option_include and location.repetitions > 1:
+            if repetitious_value == IncludeRepetitiousLocations.option_exclude: # Exclude
+                exclude_location(locations, i)
+            elif repetitious_value == IncludeRepetitiousLocations.option_remove: # Remove
+                remove_location(locations, i)
 
     # Remove any superfluous AP locations
-    remove_ap_locations(locations, "Shop Donation", world.options.shop_donations.value, 50)
-    remove_ap_locations(locations, "Greed Donation", world.options.greed_donations.value, 50)
-    remove_ap_locations(locations, "AP Consumable", world.options.consumable_locations.value, 50)
+    remove_ap_locations(locations, index, "Shop Donation", options.shop_donations, 50)
+    remove_ap_locations(locations, index, "Greed Donation", options.greed_donations, 50)
+    remove_ap_locations(locations, index, "AP Consumable", options.consumable_locations, 50)
 
-    return locations
+    return tuple(locations)
 
 """
 Removes all the AP locations of a type, after the given index
 """
-def remove_ap_locations(locations: list[LocationData], starts_with: str, past: int, up_to: int):
+def remove_ap_locations(locations: list[LocationData], index: Dict[str, int], starts_with: str, past: int, up_to: int):
     for i in range(up_to):
-        index = i + 1
-        if index < past:
+        number = i + 1
+        if number < past:
             continue
 
-        loc = [data for data in locations if
-               data.name.startswith(starts_with) and data.name.endswith("({index}x)".format(index=index))][0]
-        remove_location(locations, loc)
+        remove_location(locations, index["{name} ({number}x)".format(name=starts_with, number=number)])
 
 """
 Sets a location to "EXCLUDED" (Only filler)
 """
-def exclude_location(locations: list[LocationData], data: LocationData):
-    index = locations.index(data)
+def exclude_location(locations: list[LocationData], index: int):
+    if locations[index].progress_type is None: # Already removed
+        return
 
-    locations[index] = LocationData(data.name, data.code, data.region, data.categories, data.repetitions, LocationProgressType.EXCLUDED, data.custom, data.access_rule)
+    locations[index] = locations[index]._replace(progress_type=LocationProgressType.EXCLUDED)
 
 """
 Entirely removes a location
 """
-def remove_location(locations: list[LocationData], data: LocationData):
-    index = locations.index(data)
-
-    locations[index] = LocationData(data.name, data.code, data.region, data.categories, data.repetitions, None, data.custom, data.access_rule)
+def remove_location(locations: list[LocationData], index: int):
+    locations[index] = locations[index]._replace(progress_type=None)
 
 """
 Sets a location's access rule
 """
-def set_location_access_rule(locations: list[LocationData], data: LocationData, rule: CollectionRule):
-    index = locations.index(data)
-
-    locations[index] = LocationData(data.name, data.code, data.region, data.categories, data.repetitions, data.progress_type, data.custom, rule)
\ No newline at end of file
+def set_location_access_rule(locations: list[LocationData], index: int, rule: PlayerRule):
+    locations[index] = locations[index]._replace(access_rule=rule)
@@ -1,9 +1,9 @@
+from functools import lru_cache
 from math import floor
-from typing import NamedTuple, Optional
+from typing import Callable, NamedTuple, Optional, Tuple
 
-from BaseClasses import LocationProgressType
-from worlds.generic.Rules import CollectionRule
-from worlds.tboirp.Rules import can_reach_big4, can_reach_br_hush, has_all_characters, can_reach_all_marks, \
+from BaseClasses import CollectionState, LocationProgressType
+from worlds.tboirp.Rules import RegionRule, big4_regions, br_hush_regions, all_marks_regions, has_all_characters, \
     has_all_normal_characters
 
 # The more repeating locations you have, the more tight the requirement for them becomes. This is to prevent
@@ -28,1768 +28,1772 @@ class LocationData(NamedTuple):
     repetitions: int # For locations where you need to do a task X number of times
     progress_type: Optional[LocationProgressType] # When None, don't parse to a Location
     custom: bool
-    access_rule: CollectionRule
+    access_rule: "PlayerRule"
 
-def locations_data(player: Optional[int]):
-    if player is not None:
-        p = player
+PlayerRule = Callable[[CollectionState, int], bool] # A location's access rule for the given player
 
+@lru_cache(maxsize=None)
+def locations_data() -> Tuple[LocationData, ...]:
+    """
+    The locations of every player, built once. Access rules take the player they are checked for, so the same table
+    is shared by every TBOI world in the multiworld.
+    """
     locs = [
         LocationData("Chapter 1 Cleared", 1, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 2 Cleared", 2, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 3 Cleared", 3, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 4 Cleared", 4, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 5 Cleared", 5, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 6 Cleared", 6, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 1 Cleared (No Damage)", 7, "Chapter 1", ['Stage_Clear', 'No_Damage'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Chapter 2 Cleared (No Damage)", 8, "Chapter 2", ['Stage_Clear', 'No_Damage'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Chapter 3 Cleared (No Damage)", 9, "Chapter 3", ['Stage_Clear', 'No_Damage'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Chapter 4 Cleared (No Damage)", 10, "Chapter 4", ['Stage_Clear', 'No_Damage'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Chapter 6 Cleared (No Damage)", 11, "Chapter 6", ['Stage_Clear', 'No_Damage'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Basement Cleared", 12, "Basement", ['Stage_Clear'], 40, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 2 Cleared", 13, "Chapter 2", ['Stage_Clear'], 30, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter 3 Cleared", 14, "Chapter 3", ['Stage_Clear'], 20, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chapter >1 Cleared w/ Only 0.5 Hearts", 15, "Chapter 2", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Isaac (Chapter 1)", 16, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Tainted Isaac (Chapter 1)", 17, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Broken", p)),
+                     True, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Chapter 1)", 18, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Tainted Magdalene (Chapter 1)", 19, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Dauntless", p)),
+                     True, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Chapter 1)", 20, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Tainted Judas (Chapter 1)", 21, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deceiver", p)),
+                     True, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Chapter 1)", 22, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Tainted Cain (Chapter 1)", 23, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Hoarder", p)),
+                     True, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Chapter 1)", 24, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("Tainted ??? (Chapter 1)", 25, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Soiled", p)),
+                     lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Chapter 1)", 26, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Tainted Samson (Chapter 1)", 27, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Savage", p)),
+                     True, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Chapter 1)", 28, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Tainted Eve (Chapter 1)", 29, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Curdled", p)),
+                     lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Chapter 1)", 30, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Tainted Azazel (Chapter 1)", 31, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Benighted", p)),
+                     True, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Chapter 1)", 32, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Tainted Lazarus (Chapter 1)", 33, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Enigma", p)),
+                     True, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Chapter 1)", 34, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Tainted Eden (Chapter 1)", 35, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Capricious", p)),
+                     True, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Chapter 1)", 36, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Tainted Lost (Chapter 1)", 37, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Baleful", p)),
+                     True, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Chapter 1)", 38, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Tainted Lilith (Chapter 1)", 39, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harlot", p)),
+                     True, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Chapter 1)", 40, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Tainted Keeper (Chapter 1)", 41, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Miser", p)),
+                     True, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Chapter 1)", 42, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Chapter 1)", 43, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Empty", p)),
+                     True, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Chapter 1)", 44, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Tainted Forgotten (Chapter 1)", 45, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Fettered", p)),
+                     True, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Chapter 1)", 46, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Tainted Bethany (Chapter 1)", 47, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Zealot", p)),
+                     True, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Chapter 1)", 48, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Jacob and Esau", p)),
+                     True, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Tainted Jacob (Chapter 1)", 49, "Chapter 1", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deserter", p)),
+                     True, lambda s, p: s.has("The Deserter", p)),
         LocationData("Isaac (Chapter 2)", 50, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Tainted Isaac (Chapter 2)", 51, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Broken", p)),
+                     True, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Chapter 2)", 52, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Tainted Magdalene (Chapter 2)", 53, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Dauntless", p)),
+                     True, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Chapter 2)", 54, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Tainted Judas (Chapter 2)", 55, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deceiver", p)),
+                     True, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Chapter 2)", 56, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Tainted Cain (Chapter 2)", 57, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Hoarder", p)),
+                     True, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Chapter 2)", 58, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("Tainted ??? (Chapter 2)", 59, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Soiled", p)),
+                     lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Chapter 2)", 60, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Tainted Samson (Chapter 2)", 61, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Savage", p)),
+                     True, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Chapter 2)", 62, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Tainted Eve (Chapter 2)", 63, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Curdled", p)),
+                     lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Chapter 2)", 64, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Tainted Azazel (Chapter 2)", 65, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Benighted", p)),
+                     True, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Chapter 2)", 66, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Tainted Lazarus (Chapter 2)", 67, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Enigma", p)),
+                     True, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Chapter 2)", 68, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Tainted Eden (Chapter 2)", 69, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Capricious", p)),
+                     True, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Chapter 2)", 70, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Tainted Lost (Chapter 2)", 71, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Baleful", p)),
+                     True, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Chapter 2)", 72, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Tainted Lilith (Chapter 2)", 73, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harlot", p)),
+                     True, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Chapter 2)", 74, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Tainted Keeper (Chapter 2)", 75, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Miser", p)),
+                     True, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Chapter 2)", 76, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Chapter 2)", 77, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Empty", p)),
+                     True, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Chapter 2)", 78, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Tainted Forgotten (Chapter 2)", 79, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Fettered", p)),
+                     True, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Chapter 2)", 80, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Tainted Bethany (Chapter 2)", 81, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Zealot", p)),
+                     True, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Chapter 2)", 82, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Jacob and Esau", p)),
+                     True, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Tainted Jacob (Chapter 2)", 83, "Chapter 2", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deserter", p)),
+                     True, lambda s, p: s.has("The Deserter", p)),
         LocationData("Isaac (Chapter 3)", 84, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Tainted Isaac (Chapter 3)", 85, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Broken", p)),
+                     True, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Chapter 3)", 86, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Tainted Magdalene (Chapter 3)", 87, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Dauntless", p)),
+                     True, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Chapter 3)", 88, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Tainted Judas (Chapter 3)", 89, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deceiver", p)),
+                     True, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Chapter 3)", 90, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Tainted Cain (Chapter 3)", 91, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Hoarder", p)),
+                     True, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Chapter 3)", 92, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("Tainted ??? (Chapter 3)", 93, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Soiled", p)),
+                     lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Chapter 3)", 94, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Tainted Samson (Chapter 3)", 95, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Savage", p)),
+                     True, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Chapter 3)", 96, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Tainted Eve (Chapter 3)", 97, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Curdled", p)),
+                     lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Chapter 3)", 98, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Tainted Azazel (Chapter 3)", 99, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Benighted", p)),
+                     True, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Chapter 3)", 100, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Tainted Lazarus (Chapter 3)", 101, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Enigma", p)),
+                     True, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Chapter 3)", 102, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Tainted Eden (Chapter 3)", 103, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Capricious", p)),
+                     True, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Chapter 3)", 104, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Tainted Lost (Chapter 3)", 105, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Baleful", p)),
+                     True, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Chapter 3)", 106, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Tainted Lilith (Chapter 3)", 107, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harlot", p)),
+                     True, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Chapter 3)", 108, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Tainted Keeper (Chapter 3)", 109, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Miser", p)),
+                     True, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Chapter 3)", 110, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Chapter 3)", 111, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Empty", p)),
+                     True, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Chapter 3)", 112, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Tainted Forgotten (Chapter 3)", 113, "Chapter 3", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Chapter 3)", 114, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Tainted Bethany (Chapter 3)", 115, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Zealot", p)),
+                     True, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Chapter 3)", 116, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Jacob and Esau", p)),
+                     True, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Tainted Jacob (Chapter 3)", 117, "Chapter 3", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deserter", p)),
+                     True, lambda s, p: s.has("The Deserter", p)),
         LocationData("Isaac (Chapter 4)", 118, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Tainted Isaac (Chapter 4)", 119, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Broken", p)),
+                     True, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Chapter 4)", 120, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Tainted Magdalene (Chapter 4)", 121, "Chapter 4", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Chapter 4)", 122, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Tainted Judas (Chapter 4)", 123, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deceiver", p)),
+                     True, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Chapter 4)", 124, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Tainted Cain (Chapter 4)", 125, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Hoarder", p)),
+                     True, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Chapter 4)", 126, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("Tainted ??? (Chapter 4)", 127, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Soiled", p)),
+                     True, lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Chapter 4)", 128, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Tainted Samson (Chapter 4)", 129, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Savage", p)),
+                     True, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Chapter 4)", 130, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Tainted Eve (Chapter 4)", 131, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Curdled", p)),
+                     True, lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Chapter 4)", 132, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Tainted Azazel (Chapter 4)", 133, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Benighted", p)),
+                     True, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Chapter 4)", 134, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Tainted Lazarus (Chapter 4)", 135, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Enigma", p)),
+                     True, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Chapter 4)", 136, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Tainted Eden (Chapter 4)", 137, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Capricious", p)),
+                     True, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Chapter 4)", 138, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Tainted Lost (Chapter 4)", 139, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Baleful", p)),
+                     True, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Chapter 4)", 140, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Tainted Lilith (Chapter 4)", 141, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harlot", p)),
+                     True, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Chapter 4)", 142, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Tainted Keeper (Chapter 4)", 143, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Miser", p)),
+                     True, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Chapter 4)", 144, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Chapter 4)", 145, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Empty", p)),
+                     True, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Chapter 4)", 146, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Tainted Forgotten (Chapter 4)", 147, "Chapter 4", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Chapter 4)", 148, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Tainted Bethany (Chapter 4)", 149, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Zealot", p)),
+                     True, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Chapter 4)", 150, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Jacob and Esau", p)),
+                     True, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Tainted Jacob (Chapter 4)", 151, "Chapter 4", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deserter", p)),
+                     True, lambda s, p: s.has("The Deserter", p)),
         LocationData("Isaac (Chapter 5)", 152, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Tainted Isaac (Chapter 5)", 153, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Broken", p)),
+                     True, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Chapter 5)", 154, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Tainted Magdalene (Chapter 5)", 155, "Chapter 5", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Chapter 5)", 156, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Tainted Judas (Chapter 5)", 157, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deceiver", p)),
+                     True, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Chapter 5)", 158, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Tainted Cain (Chapter 5)", 159, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Hoarder", p)),
+                     True, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Chapter 5)", 160, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("Tainted ??? (Chapter 5)", 161, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Soiled", p)),
+                     True, lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Chapter 5)", 162, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Tainted Samson (Chapter 5)", 163, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Savage", p)),
+                     True, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Chapter 5)", 164, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Tainted Eve (Chapter 5)", 165, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Curdled", p)),
+                     True, lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Chapter 5)", 166, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Tainted Azazel (Chapter 5)", 167, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Benighted", p)),
+                     True, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Chapter 5)", 168, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Tainted Lazarus (Chapter 5)", 169, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Enigma", p)),
+                     True, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Chapter 5)", 170, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Tainted Eden (Chapter 5)", 171, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Capricious", p)),
+                     True, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Chapter 5)", 172, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Tainted Lost (Chapter 5)", 173, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Baleful", p)),
+                     True, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Chapter 5)", 174, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Tainted Lilith (Chapter 5)", 175, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harlot", p)),
+                     True, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Chapter 5)", 176, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Tainted Keeper (Chapter 5)", 177, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Miser", p)),
+                     True, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Chapter 5)", 178, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Chapter 5)", 179, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Empty", p)),
+                     True, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Chapter 5)", 180, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Tainted Forgotten (Chapter 5)", 181, "Chapter 5", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Chapter 5)", 182, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Tainted Bethany (Chapter 5)", 183, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Zealot", p)),
+                     True, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Chapter 5)", 184, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Jacob and Esau", p)),
+                     True, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Tainted Jacob (Chapter 5)", 185, "Chapter 5", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deserter", p)),
+                     True, lambda s, p: s.has("The Deserter", p)),
         LocationData("Isaac (Chapter 6)", 186, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Tainted Isaac (Chapter 6)", 187, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Broken", p)),
+                     True, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Chapter 6)", 188, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Tainted Magdalene (Chapter 6)", 189, "Chapter 6", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Chapter 6)", 190, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Tainted Judas (Chapter 6)", 191, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deceiver", p)),
+                     True, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Chapter 6)", 192, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Tainted Cain (Chapter 6)", 193, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Hoarder", p)),
+                     True, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Chapter 6)", 194, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("Tainted ??? (Chapter 6)", 195, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Soiled", p)),
+                     True, lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Chapter 6)", 196, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Tainted Samson (Chapter 6)", 197, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Savage", p)),
+                     True, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Chapter 6)", 198, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Tainted Eve (Chapter 6)", 199, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Curdled", p)),
+                     True, lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Chapter 6)", 200, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Tainted Azazel (Chapter 6)", 201, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Benighted", p)),
+                     True, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Chapter 6)", 202, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Tainted Lazarus (Chapter 6)", 203, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Enigma", p)),
+                     True, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Chapter 6)", 204, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Tainted Eden (Chapter 6)", 205, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Capricious", p)),
+                     True, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Chapter 6)", 206, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Tainted Lost (Chapter 6)", 207, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Baleful", p)),
+                     True, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Chapter 6)", 208, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Tainted Lilith (Chapter 6)", 209, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harlot", p)),
+                     True, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Chapter 6)", 210, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Tainted Keeper (Chapter 6)", 211, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Miser", p)),
+                     True, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Chapter 6)", 212, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Chapter 6)", 213, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Empty", p)),
+                     True, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Chapter 6)", 214, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Tainted Forgotten (Chapter 6)", 215, "Chapter 6", ['Stage_Clear'], 1,
-                     LocationProgressType.DEFAULT, True, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, True, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Chapter 6)", 216, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Tainted Bethany (Chapter 6)", 217, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Zealot", p)),
+                     True, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Chapter 6)", 218, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Jacob and Esau", p)),
+                     True, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Tainted Jacob (Chapter 6)", 219, "Chapter 6", ['Stage_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Deserter", p)),
+                     True, lambda s, p: s.has("The Deserter", p)),
         LocationData("Dingle Defeated", 220, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Duke of Flies Defeated", 221, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: True),
+                     True, lambda s, p: True),
         LocationData("Gemini Defeated", 222, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Steven Defeated", 223, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Something From The Future", p)),
+                     lambda s, p: s.has("Something From The Future", p)),
         LocationData("Larry Jr. Defeated", 224, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Monstro Defeated", 225, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Gurglings Defeated", 226, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Famine Defeated", 227, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Harbingers", p)),
+                     lambda s, p: s.has("The Harbingers", p)),
         LocationData("Headless Horseman Defeated", 228, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("The Harbingers", p)),
+                     True, lambda s, p: s.has("The Harbingers", p)),
         LocationData("The Fallen Defeated", 229, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Dangle Defeated", 230, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Little Horn Defeated", 231, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Turdlings Defeated", 232, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Rag Man Defeated", 233, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Baby Plum Defeated", 234, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Blighted Ovum Defeated", 235, "Cellar", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Haunt Defeated", 236, "Cellar", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Pin Defeated", 237, "Cellar", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Widow Defeated", 238, "Cellar", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Fistula Defeated", 239, "Cellar", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Lil Blub Defeated", 240, "Downpour", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Wormwood Defeated", 241, "Downpour", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Rainmaker Defeated", 242, "Downpour", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Min-Min Defeated", 243, "Downpour", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Clog Defeated", 244, "Dross", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Colostomia Defeated", 245, "Dross", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Turdlet Defeated", 246, "Dross", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chub Defeated", 247, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("C.H.A.D. Defeated", 248, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Something Cute", p)),
+                     lambda s, p: s.has("Something Cute", p)),
         LocationData("Gurdy Defeated", 249, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Gurdy Jr. Defeated", 250, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mega Fatty Defeated", 251, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mega Maw Defeated", 252, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Peep Defeated", 253, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Dark One Defeated", 254, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Pestilence Defeated", 255, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Harbingers", p)),
+                     lambda s, p: s.has("The Harbingers", p)),
         LocationData("The Stain Defeated", 256, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Frail Defeated", 257, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Forsaken Defeated", 258, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Big Horn Defeated", 259, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Rag Mega Defeated", 260, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Bumbino Defeated", 261, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Carrion Queen Defeated", 262, "Catacombs", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Hollow Defeated", 263, "Catacombs", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Husk Defeated", 264, "Catacombs", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Polycephalus Defeated", 265, "Catacombs", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Wretched Defeated", 266, "Catacombs", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Reap Creep Defeated", 267, "Mines", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Tuff Twins Defeated", 268, "Mines", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Hornfel Defeated", 269, "Mines", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Great Gideon Defeated", 270, "Mines", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Pile Defeated", 271, "Ashpit", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Shell Defeated", 272, "Ashpit", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Singe Defeated", 273, "Ashpit", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Clutch Defeated", 274, "Ashpit", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Cage Defeated", 275, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Gate Defeated", 276, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Monstro II Defeated", 277, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Gish Defeated", 278, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Something Sticky", p)),
+                     lambda s, p: s.has("Something Sticky", p)),
         LocationData("Loki Defeated", 279, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Adversary Defeated", 280, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("War Defeated", 281, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Harbingers", p)),
+                     lambda s, p: s.has("The Harbingers", p)),
         LocationData("Brownie Defeated", 282, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Sisters Vis Defeated", 283, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Bloat Defeated", 284, "Necropolis", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mask of Infamy Defeated", 285, "Necropolis", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: True),
+                     True, lambda s, p: True),
         LocationData("Mom Defeated", 286, "Chapter 3", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Siren Defeated", 287, "Mausoleum", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Heretic Defeated", 288, "Mausoleum", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Visage Defeated", 289, "Gehenna", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Horny Boys Defeated", 290, "Gehenna", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Blastocyst Defeated", 291, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Lokii Defeated", 292, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mama Gurdy Defeated", 293, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mr. Fred Defeated", 294, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Scolex Defeated", 295, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Daddy Long Legs Defeated", 296, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Triachnid Defeated", 297, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Something Icky", p)),
+                     lambda s, p: s.has("Something Icky", p)),
         LocationData("Teratoma Defeated", 298, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Death Defeated", 299, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("The Harbingers", p)),
+                     lambda s, p: s.has("The Harbingers", p)),
         LocationData("Conquest Defeated", 300, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("A Forgotten Horseman", p)),
+                     lambda s, p: s.has("A Forgotten Horseman", p)),
         LocationData("The Matriarch Defeated", 301, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 302, "The Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Rotgut Defeated", 303, "Corpse", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Chimera Defeated", 304, "Corpse", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Scourge Defeated", 305, "Corpse", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mother Defeated", 306, "Corpse", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Hush Defeated", 307, "Blue Womb", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Delirium Defeated", 308, "The Void", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Satan Defeated", 309, "Sheol", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Isaac Defeated", 310, "Cathedral", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Lamb Defeated", 311, "Dark Room", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("??? Defeated", 312, "The Chest", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Dogma Defeated", 313, "Ascent", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Famine Defeated", 314, "Ascent", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Pestilence Defeated", 315, "Ascent", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra War Defeated", 316, "Ascent", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Death Defeated", 317, "Ascent", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Beast Defeated", 318, "Ascent", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Greed Defeated", 319, "Greed Mode", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Greedier Defeated", 320, "Greedier Mode", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: True),
+                     True, lambda s, p: True),
         LocationData("Mega Satan Defeated", 321, "Mega Satan", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Krampus Defeated", 322, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Krampus", p)),
+                     lambda s, p: s.has("Krampus", p)),
         LocationData("Envy Defeated", 323, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Gluttony Defeated", 324, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Wrath Defeated", 325, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Pride Defeated", 326, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Lust Defeated", 327, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Greed Defeated", 328, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Sloth Defeated", 329, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Envy Defeated", 330, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Gluttony Defeated", 331, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Wrath Defeated", 332, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Pride Defeated", 333, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Lust Defeated", 334, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Greed Defeated", 335, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Super Sloth Defeated", 336, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Pride Defeated", 337, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Uriel Defeated", 338, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Angels", p)),
+                     lambda s, p: s.has("Angels", p)),
         LocationData("Gabriel Defeated", 339, "Chapter 2", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.has("Angels", p)),
+                     lambda s, p: s.has("Angels", p)),
         LocationData("Baby Plum Defeated", 340, "Chapter 1", ['Boss_Clear'], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Baby Plum Spared", 341, "Chapter 1", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("All 7 Sins Defeated", 342, "Menu", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Any Harbinger Defeated", 343, "Menu", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Harbingers", p)),
+                     lambda s, p: s.has("The Harbingers", p)),
         LocationData("All 5 Harbingers Defeated", 344, "Chapter 4", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Angel Defeated", 345, "Chapter 2", ['Boss_Clear'], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Angels", p)),
+                     lambda s, p: s.has("Angels", p)),
         LocationData("??? and The Lamb Defeated", 346, "Chapter 6", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Hush Defeated", 347, "Blue Womb", ['Boss_Clear'], 3, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 348, "Chapter 4", ['Boss_Clear'], 2, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 349, "Chapter 4", ['Boss_Clear'], 3, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 350, "Chapter 4", ['Boss_Clear'], 4, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 351, "Chapter 4", ['Boss_Clear'], 5, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 352, "Chapter 4", ['Boss_Clear'], 6, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 353, "Chapter 4", ['Boss_Clear'], 7, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 354, "Chapter 4", ['Boss_Clear'], 8, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 355, "Chapter 4", ['Boss_Clear'], 9, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 356, "Chapter 4", ['Boss_Clear'], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated", 357, "Chapter 4", ['Boss_Clear'], 11, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Mom's Heart Defeated (As Lazarus w/ No Deaths)", 358, "Chapter 4", ['Boss_Clear'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Satan Defeated", 359, "Sheol", ['Boss_Clear'], 5, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("The Lamb Defeated (<20 Minutes)", 360, "Dark Room", ['Boss_Clear'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Isaac Defeated", 361, "Cathedral", ['Boss_Clear'], 5, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Isaac Defeated", 362, "Cathedral", ['Boss_Clear'], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Ultra Greed Defeated (As Azazel)", 363, "Greedier Mode", ['Boss_Clear'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("Azazel", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("Azazel", p)),
         LocationData("Defeat All Bosses in Basement", 364, "Basement", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Defeat All Bosses in Caves", 365, "Caves", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Defeat All Bosses in Depths", 366, "Depths", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Defeat All Bosses in Downpour", 367, "Downpour", ['Boss_Clear'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Defeat All Bosses in Mines", 368, "Mines", ['Boss_Clear'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Defeat All Bosses in Mausoleum", 369, "Mausoleum", ['Boss_Clear'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("It Lives! Defeated", 370, "Chapter 4", ['Boss_Clear'], 16, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("It Lives!", p)),
+                     lambda s, p: s.has("It Lives!", p)),
         LocationData("It Lives! Defeated", 371, "Chapter 4", ['Boss_Clear'], 21, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("It Lives!", p)),
+                     lambda s, p: s.has("It Lives!", p)),
         LocationData("It Lives! Defeated", 372, "Chapter 4", ['Boss_Clear'], 30, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("It Lives!", p)),
+                     lambda s, p: s.has("It Lives!", p)),
         LocationData("Little Horn Defeated", 373, "Basement", ['Boss_Clear'], 20, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Challenge #1 (Pitch Black)", 374, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #1 (Pitch Black)", p)),
+                     lambda s, p: s.has("Challenge #1 (Pitch Black)", p)),
         LocationData("Challenge #2 (High Brow)", 375, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #2 (High Brow)", p)),
+                     lambda s, p: s.has("Challenge #2 (High Brow)", p)),
         LocationData("Challenge #3 (Head Trauma)", 376, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #3 (Head Trauma)", p)),
+                     lambda s, p: s.has("Challenge #3 (Head Trauma)", p)),
         LocationData("Challenge #4 (Darkness Falls)", 377, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #4 (Darkness Falls)", p)),
+                     False, lambda s, p: s.has("Challenge #4 (Darkness Falls)", p)),
         LocationData("Challenge #5 (The Tank)", 378, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #5 (The Tank)", p)),
+                     lambda s, p: s.has("Challenge #5 (The Tank)", p)),
         LocationData("Challenge #6 (Solar System)", 379, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #6 (Solar System)", p)),
+                     lambda s, p: s.has("Challenge #6 (Solar System)", p)),
         LocationData("Challenge #7 (Suicide King)", 380, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #7 (Suicide King)", p)),
+                     lambda s, p: s.has("Challenge #7 (Suicide King)", p)),
         LocationData("Challenge #8 (Cat Got Your Tongue)", 381, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #8 (Cat Got Your Tongue)", p)),
+                     False, lambda s, p: s.has("Challenge #8 (Cat Got Your Tongue)", p)),
         LocationData("Challenge #9 (Demo Man)", 382, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #9 (Demo Man)", p)),
+                     lambda s, p: s.has("Challenge #9 (Demo Man)", p)),
         LocationData("Challenge #10 (Cursed!)", 383, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #10 (Cursed!)", p)),
+                     lambda s, p: s.has("Challenge #10 (Cursed!)", p)),
         LocationData("Challenge #11 (Glass Cannon)", 384, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #11 (Glass Cannon)", p)),
+                     lambda s, p: s.has("Challenge #11 (Glass Cannon)", p)),
         LocationData("Challenge #12 (When Life Gives You Lemons)", 385, "Menu", ['Challenge'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #12 (When Life Gives You Lemons)", p)),
+                     lambda s, p: s.has("Challenge #12 (When Life Gives You Lemons)", p)),
         LocationData("Challenge #13 (Beans!)", 386, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #13 (Beans!)", p)),
+                     lambda s, p: s.has("Challenge #13 (Beans!)", p)),
         LocationData("Challenge #14 (It's in the Cards)", 387, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #14 (It's in the Cards)", p)),
+                     False, lambda s, p: s.has("Challenge #14 (It's in the Cards)", p)),
         LocationData("Challenge #15 (Slow Roll)", 388, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #15 (Slow Roll)", p)),
+                     lambda s, p: s.has("Challenge #15 (Slow Roll)", p)),
         LocationData("Challenge #16 (Computer Savvy)", 389, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #16 (Computer Savvy)", p)),
+                     False, lambda s, p: s.has("Challenge #16 (Computer Savvy)", p)),
         LocationData("Challenge #17 (Waka Waka)", 390, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #17 (Waka Waka)", p)),
+                     lambda s, p: s.has("Challenge #17 (Waka Waka)", p)),
         LocationData("Challenge #18 (The Host)", 391, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #18 (The Host)", p)),
+                     lambda s, p: s.has("Challenge #18 (The Host)", p)),
         LocationData("Challenge #19 (The Family Man)", 392, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #19 (The Family Man)", p)),
+                     False, lambda s, p: s.has("Challenge #19 (The Family Man)", p)),
         LocationData("Challenge #20 (Purist)", 393, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #20 (Purist)", p)),
+                     lambda s, p: s.has("Challenge #20 (Purist)", p)),
         LocationData("Challenge #21 (XXXXXXXXL)", 394, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #21 (XXXXXXXXL)", p)),
+                     lambda s, p: s.has("Challenge #21 (XXXXXXXXL)", p)),
         LocationData("Challenge #22 (SPEED!)", 395, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #22 (SPEED!)", p)),
+                     lambda s, p: s.has("Challenge #22 (SPEED!)", p)),
         LocationData("Challenge #23 (Blue Bomber)", 396, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #23 (Blue Bomber)", p)),
+                     lambda s, p: s.has("Challenge #23 (Blue Bomber)", p)),
         LocationData("Challenge #24 (PAY TO PLAY)", 397, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #24 (PAY TO PLAY)", p)),
+                     lambda s, p: s.has("Challenge #24 (PAY TO PLAY)", p)),
         LocationData("Challenge #25 (Have a Heart)", 398, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #25 (Have a Heart)", p)),
+                     lambda s, p: s.has("Challenge #25 (Have a Heart)", p)),
         LocationData("Challenge #26 (I RULE!)", 399, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #26 (I RULE!)", p)),
+                     lambda s, p: s.has("Challenge #26 (I RULE!)", p)),
         LocationData("Challenge #27 (BRAINS!)", 400, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #27 (BRAINS!)", p)),
+                     lambda s, p: s.has("Challenge #27 (BRAINS!)", p)),
         LocationData("Challenge #28 (PRIDE DAY!)", 401, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #28 (PRIDE DAY!)", p)),
+                     lambda s, p: s.has("Challenge #28 (PRIDE DAY!)", p)),
         LocationData("Challenge #29 (Onan's Streak)", 402, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #29 (Onan's Streak)", p)),
+                     False, lambda s, p: s.has("Challenge #29 (Onan's Streak)", p)),
         LocationData("Challenge #30 (The Guardian)", 403, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #30 (The Guardian)", p)),
+                     lambda s, p: s.has("Challenge #30 (The Guardian)", p)),
         LocationData("Challenge #31 (Backasswards)", 404, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #31 (Backasswards)", p)),
+                     lambda s, p: s.has("Challenge #31 (Backasswards)", p)),
         LocationData("Challenge #32 (Aprils Fool)", 405, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #32 (Aprils Fool)", p)),
+                     lambda s, p: s.has("Challenge #32 (Aprils Fool)", p)),
         LocationData("Challenge #33 (Pokey Mans)", 406, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #33 (Pokey Mans)", p)),
+                     lambda s, p: s.has("Challenge #33 (Pokey Mans)", p)),
         LocationData("Challenge #34 (Ultra Hard)", 407, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #34 (Ultra Hard)", p)),
+                     lambda s, p: s.has("Challenge #34 (Ultra Hard)", p)),
         LocationData("Challenge #35 (Pong)", 408, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #35 (Pong)", p)),
+                     lambda s, p: s.has("Challenge #35 (Pong)", p)),
         LocationData("Challenge #36 (Scat Man)", 409, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #36 (Scat Man)", p)),
+                     lambda s, p: s.has("Challenge #36 (Scat Man)", p)),
         LocationData("Challenge #37 (Bloody Mary)", 410, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #37 (Bloody Mary)", p)),
+                     lambda s, p: s.has("Challenge #37 (Bloody Mary)", p)),
         LocationData("Challenge #38 (Baptism by Fire)", 411, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #38 (Baptism by Fire)", p)),
+                     False, lambda s, p: s.has("Challenge #38 (Baptism by Fire)", p)),
         LocationData("Challenge #39 (Isaac's Awakening)", 412, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #39 (Isaac's Awakening)", p)),
+                     False, lambda s, p: s.has("Challenge #39 (Isaac's Awakening)", p)),
         LocationData("Challenge #40 (Seeing Double)", 413, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #40 (Seeing Double)", p)),
+                     False, lambda s, p: s.has("Challenge #40 (Seeing Double)", p)),
         LocationData("Challenge #41 (Pica Run)", 414, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #41 (Pica Run)", p)),
+                     lambda s, p: s.has("Challenge #41 (Pica Run)", p)),
         LocationData("Challenge #42 (Hot Potato)", 415, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #42 (Hot Potato)", p)),
+                     lambda s, p: s.has("Challenge #42 (Hot Potato)", p)),
         LocationData("Challenge #43 (Cantripped!)", 416, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #43 (Cantripped!)", p)),
+                     lambda s, p: s.has("Challenge #43 (Cantripped!)", p)),
         LocationData("Challenge #44 (Red Redemption)", 417, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Challenge #44 (Red Redemption)", p)),
+                     False, lambda s, p: s.has("Challenge #44 (Red Redemption)", p)),
         LocationData("Challenge #45 (DELETE THIS)", 418, "Menu", ['Challenge'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Challenge #45 (DELETE THIS)", p)),
+                     lambda s, p: s.has("Challenge #45 (DELETE THIS)", p)),
         LocationData("Super Bandage Girl Made", 419, "Chapter 4", ['Item_Collection'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Ball of Bandages", p)),
+                     False, lambda s, p: s.has("Ball of Bandages", p)),
         LocationData("Super Meat Boy Made", 420, "Chapter 4", ['Item_Collection'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.has("Cube of Meat", p)),
+                     True, lambda s, p: s.has("Cube of Meat", p)),
         LocationData("2 Dead Items Collected", 421, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("3 Mom Items Collected", 422, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("2 Syringe Items Collected", 423, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("2 Battery Items Collected", 424, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("2 Technology Items Collected", 425, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Key Pieces Collected", 426, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Angels", p)),
+                     lambda s, p: s.has("Angels", p)),
         LocationData("3 Celestial Items Collected", 427, "Menu", ['Item_Collection'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: True),
+                     False, lambda s, p: True),
         LocationData("Items Owned At Once", 428, "Menu", ['Item_Collection'], 50, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Collected Battery, 9 Volt, & Car Battery", 429, "Menu", ['Item_Collection'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Rubber Cement Collected", 430, "Menu", ['Item_Collection'], 5, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Rubber Cement", p)),
+                     False, lambda s, p: s.has("Rubber Cement", p)),
         LocationData("5 Familiars Collected in One Run", 431, "Menu", ['Item_Collection'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Stop Watch and Broken Stop Watch Collected", 432, "Menu", ['Item_Collection'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has_all(["Stop Watch", "Broken Watch"], p)),
-        LocationData("Corpse Entered", 433, "Corpse", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("4 Soul Hearts", 434, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("55 Coins", 435, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("7 Heart Containers", 436, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has_all(["Stop Watch", "Broken Watch"], p)),
+        LocationData("Corpse Entered", 433, "Corpse", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("4 Soul Hearts", 434, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("55 Coins", 435, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("7 Heart Containers", 436, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("No Hearts For Two Floors", 437, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("No Damage For Two Floors", 438, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Died In Sacrifice Room w/ Missing Poster", 439, "Menu", [''], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Missing Poster", p)),
+                     False, lambda s, p: s.has("Missing Poster", p)),
         LocationData("Dark Room Mom's Shovel Spot", 440, "Dark Room", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Tinted Rock Destroyed", 441, "Menu", [''], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Tinted Rock Destroyed", 442, "Menu", [''], 100, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
-        LocationData("Arcade Visited", 443, "Menu", [''], 10, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: True),
+        LocationData("Arcade Visited", 443, "Menu", [''], 10, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Bible Used on Mom", 444, "Chapter 3", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Bible", p)),
-        LocationData("Death", 445, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("XIII - Death Used", 446, "Menu", [''], 4, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: s.has("The Bible", p)),
+        LocationData("Death", 445, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("XIII - Death Used", 446, "Menu", [''], 4, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Shopkeepers Exploded", 447, "Menu", [''], 20, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
-        LocationData("Shell Game Played", 448, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: True),
+        LocationData("Shell Game Played", 448, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Devil Deals Taken (3x In One Run)", 449, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
-        LocationData("Devil Deals Taken", 450, "Menu", [''], 20, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Devil Deals Taken", 451, "Menu", [''], 25, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Devil Deals Taken", 452, "Menu", [''], 30, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Poop Destroyed", 453, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Locked Chest Opened", 454, "Menu", [''], 20, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Blood Donated", 455, "Menu", [''], 30, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: True),
+        LocationData("Devil Deals Taken", 450, "Menu", [''], 20, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Devil Deals Taken", 451, "Menu", [''], 25, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Devil Deals Taken", 452, "Menu", [''], 30, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Poop Destroyed", 453, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Locked Chest Opened", 454, "Menu", [''], 20, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Blood Donated", 455, "Menu", [''], 30, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Slot Machine Exploded", 456, "Menu", [''], 30, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
-        LocationData("Win Streak", 457, "Chapter 6", [''], 3, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Win Streak", 458, "Chapter 6", [''], 5, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Bestiary Completed", 459, "Ascent", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("It's The Key", 460, "Dark Room", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Reset", 461, "Menu", [''], 7, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Secret Room Found", 462, "Menu", [''], 50, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: True),
+        LocationData("Win Streak", 457, "Chapter 6", [''], 3, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Win Streak", 458, "Chapter 6", [''], 5, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Bestiary Completed", 459, "Ascent", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("It's The Key", 460, "Dark Room", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Reset", 461, "Menu", [''], 7, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Secret Room Found", 462, "Menu", [''], 50, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Blood Clot Collected", 463, "Menu", [''], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Blood Clot", p)),
-        LocationData("Tears Up Collected", 464, "Menu", [''], 10, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: s.has("Blood Clot", p)),
+        LocationData("Tears Up Collected", 464, "Menu", [''], 10, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("6 Shops Entered in One Run", 465, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Angel Items Taken", 466, "Chapter 2", [''], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Angel Items Taken", 467, "Chapter 2", [''], 25, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Exploded By Own Ipecac Shot", 468, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Ipecac", p)),
-        LocationData("Bed Slept In", 469, "Menu", [''], 10, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: s.has("Ipecac", p)),
+        LocationData("Bed Slept In", 469, "Menu", [''], 10, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Gulp Pill Used", 470, "Menu", [''], 5, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Gulp!", p)),
+                     lambda s, p: s.has("Gulp!", p)),
         LocationData("3 Enemies Charmed at Once", 471, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("20 Blue Flies at Once", 472, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Get Temporary Homing w/ Homing", 473, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Exploded Siren's Skull", 474, "Mausoleum", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
-        LocationData("Open Mom's Chest", 475, "Ascent", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Battery Bum Payout", 476, "Menu", [''], 5, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: True),
+        LocationData("Open Mom's Chest", 475, "Ascent", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Battery Bum Payout", 476, "Menu", [''], 5, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Battery Bum Exploded", 477, "Menu", [''], 10, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("$0.40 Spent in One Shop", 478, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("$0.99 Spent in One Shop", 479, "Menu", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Blank Card Used While Holding XIX - The Sun", 480, "Menu", [''], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Blank Card", p)),
-        LocationData("Portal Defeated", 481, "The Void", [''], 20, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Rock Destroyed", 482, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Rock Destroyed", 483, "Menu", [''], 500, LocationProgressType.DEFAULT, False, lambda s: True),
+                     False, lambda s, p: s.has("Blank Card", p)),
+        LocationData("Portal Defeated", 481, "The Void", [''], 20, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Rock Destroyed", 482, "Menu", [''], 100, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Rock Destroyed", 483, "Menu", [''], 500, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Rainbow Poop Destroyed", 484, "Menu", [''], 5, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Lil' Batteries Picked Up", 485, "Menu", [''], 20, LocationProgressType.DEFAULT, False,
-                     lambda s: True),
+                     lambda s, p: True),
         LocationData("Pandora's Box Used in Dark Room", 486, "Dark Room", [''], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Pandora's Box", p)),
+                     lambda s, p: s.has("Pandora's Box", p)),
         LocationData("Be Larger", 487, "Menu", [''], 3, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("One Makes You Larger", p)),
-        LocationData("Bed Slept In", 488, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s: True),
-        LocationData("Cards or Runes Used", 489, "Menu", [''], 20, LocationProgressType.DEFAULT, False, lambda s: True),
+                     lambda s, p: s.has("One Makes You Larger", p)),
+        LocationData("Bed Slept In", 488, "Menu", [''], 1, LocationProgressType.DEFAULT, False, lambda s, p: True),
+        LocationData("Cards or Runes Used", 489, "Menu", [''], 20, LocationProgressType.DEFAULT, False, lambda s, p: True),
         LocationData("Tainted Isaac Unlock", 490, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Isaac", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Isaac", "Cracked Key"], p)),
         LocationData("Tainted Magdalene Unlock", 491, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has_all(["Magdalene", "Cracked Key"], p)),
+                     False, lambda s, p: s.has_all(["Magdalene", "Cracked Key"], p)),
         LocationData("Tainted Cain Unlock", 492, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Cain", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Cain", "Cracked Key"], p)),
         LocationData("Tainted Judas Unlock", 493, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Judas", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Judas", "Cracked Key"], p)),
         LocationData("Tainted ??? Unlock", 494, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["???", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["???", "Cracked Key"], p)),
         LocationData("Tainted Eve Unlock", 495, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Eve", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Eve", "Cracked Key"], p)),
         LocationData("Tainted Samson Unlock", 496, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Samson", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Samson", "Cracked Key"], p)),
         LocationData("Tainted Azazel Unlock", 497, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Azazel", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Azazel", "Cracked Key"], p)),
         LocationData("Tainted Lazarus Unlock", 498, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has_all(["Lazarus", "Cracked Key"], p)),
+                     False, lambda s, p: s.has_all(["Lazarus", "Cracked Key"], p)),
         LocationData("Tainted Eden Unlock", 499, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Eden", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Eden", "Cracked Key"], p)),
         LocationData("Tainted Lost Unlock", 500, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Lost", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Lost", "Cracked Key"], p)),
         LocationData("Tainted Lilith Unlock", 501, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Lilith", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Lilith", "Cracked Key"], p)),
         LocationData("Tainted Keeper Unlock", 502, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Keeper", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Keeper", "Cracked Key"], p)),
         LocationData("Tainted Apollyon Unlock", 503, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has_all(["Apollyon", "Cracked Key"], p)),
+                     False, lambda s, p: s.has_all(["Apollyon", "Cracked Key"], p)),
         LocationData("Tainted Forgotten Unlock", 504, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has_all(["Forgotten", "Cracked Key"], p)),
+                     False, lambda s, p: s.has_all(["Forgotten", "Cracked Key"], p)),
         LocationData("Tainted Bethany Unlock", 505, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has_all(["Bethany", "Cracked Key"], p)),
+                     False, lambda s, p: s.has_all(["Bethany", "Cracked Key"], p)),
         LocationData("Tainted Jacob Unlock", 506, "Ascent", ['Tainted_Unlock'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has_all(["Jacob and Esau", "Cracked Key"], p)),
+                     lambda s, p: s.has_all(["Jacob and Esau", "Cracked Key"], p)),
         LocationData("Isaac (Boss Rush)", 507, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Mom's Heart)", 508, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Satan)", 509, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Isaac)", 510, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (???)", 511, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (The Lamb)", 512, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Mega Satan)", 513, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Hush)", 514, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Delirium)", 515, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Mother)", 516, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (The Beast)", 517, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Ultra Greed)", 518, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (Ultra Greedier)", 519, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Isaac", p)),
+                     lambda s, p: s.has("Isaac", p)),
         LocationData("Isaac (All Marks)", 520, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Isaac", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Isaac", p))),
         LocationData("Tainted Isaac (Isaac, ???, Satan, The Lamb)", 521, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Broken", p))),
         LocationData("Tainted Isaac (Mega Satan)", 522, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Broken", p)),
         LocationData("Tainted Isaac (Hush & Boss Rush)", 523, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Broken", p))),
         LocationData("Tainted Isaac (Delirium)", 524, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Broken", p)),
         LocationData("Tainted Isaac (Mother)", 525, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Broken", p)),
+                     False, lambda s, p: s.has("The Broken", p)),
         LocationData("Tainted Isaac (The Beast)", 526, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Broken", p)),
         LocationData("Tainted Isaac (Ultra Greed)", 527, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Broken", p)),
         LocationData("Tainted Isaac (Ultra Greedier)", 528, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Broken", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Broken", p)),
         LocationData("Magdalene (Boss Rush)", 529, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Mom's Heart)", 530, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Satan)", 531, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Isaac)", 532, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (???)", 533, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (The Lamb)", 534, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Mega Satan)", 535, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Hush)", 536, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Delirium)", 537, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Mother)", 538, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (The Beast)", 539, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Ultra Greed)", 540, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Magdalene", p)),
+                     lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (Ultra Greedier)", 541, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Magdalene", p)),
+                     False, lambda s, p: s.has("Magdalene", p)),
         LocationData("Magdalene (All Marks)", 542, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Magdalene", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Magdalene", p))),
         LocationData("Tainted Magdalene (Isaac, ???, Satan, The Lamb)", 543, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Dauntless", p))),
         LocationData("Tainted Magdalene (Mega Satan)", 544, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Tainted Magdalene (Hush & Boss Rush)", 545, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Dauntless", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Dauntless", p))),
         LocationData("Tainted Magdalene (Delirium)", 546, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Tainted Magdalene (Mother)", 547, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Tainted Magdalene (The Beast)", 548, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Tainted Magdalene (Ultra Greed)", 549, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Tainted Magdalene (Ultra Greedier)", 550, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Dauntless", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Dauntless", p)),
         LocationData("Judas (Boss Rush)", 551, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Mom's Heart)", 552, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Satan)", 553, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Isaac)", 554, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (???)", 555, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (The Lamb)", 556, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Mega Satan)", 557, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Hush)", 558, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Delirium)", 559, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Mother)", 560, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (The Beast)", 561, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Ultra Greed)", 562, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (Ultra Greedier)", 563, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Judas", p)),
+                     lambda s, p: s.has("Judas", p)),
         LocationData("Judas (All Marks)", 564, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Judas", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Judas", p))),
         LocationData("Tainted Judas (Isaac, ???, Satan, The Lamb)", 565, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deceiver", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Deceiver", p))),
         LocationData("Tainted Judas (Mega Satan)", 566, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deceiver", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Tainted Judas (Hush & Boss Rush)", 567, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Deceiver", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Deceiver", p))),
         LocationData("Tainted Judas (Delirium)", 568, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deceiver", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Tainted Judas (Mother)", 569, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Deceiver", p)),
+                     False, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Tainted Judas (The Beast)", 570, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deceiver", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Tainted Judas (Ultra Greed)", 571, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deceiver", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Tainted Judas (Ultra Greedier)", 572, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deceiver", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deceiver", p)),
         LocationData("Cain (Boss Rush)", 573, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Mom's Heart)", 574, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Satan)", 575, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Isaac)", 576, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (???)", 577, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (The Lamb)", 578, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Mega Satan)", 579, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Hush)", 580, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Delirium)", 581, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Mother)", 582, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (The Beast)", 583, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Ultra Greed)", 584, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (Ultra Greedier)", 585, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Cain", p)),
+                     lambda s, p: s.has("Cain", p)),
         LocationData("Cain (All Marks)", 586, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Cain", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Cain", p))),
         LocationData("Tainted Cain (Isaac, ???, Satan, The Lamb)", 587, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Hoarder", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Hoarder", p))),
         LocationData("Tainted Cain (Mega Satan)", 588, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Hoarder", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Hoarder", p)),
         LocationData("Tainted Cain (Hush & Boss Rush)", 589, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Hoarder", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Hoarder", p))),
         LocationData("Tainted Cain (Delirium)", 590, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Hoarder", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Hoarder", p)),
         LocationData("Tainted Cain (Mother)", 591, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Hoarder", p)),
+                     False, lambda s, p: s.has("The Hoarder", p)),
         LocationData("Tainted Cain (The Beast)", 592, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Hoarder", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Hoarder", p)),
         LocationData("Tainted Cain (Ultra Greed)", 593, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Hoarder", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Hoarder", p)),
         LocationData("Tainted Cain (Ultra Greedier)", 594, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Hoarder", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Hoarder", p)),
         LocationData("??? (Boss Rush)", 595, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Mom's Heart)", 596, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Satan)", 597, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Isaac)", 598, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (???)", 599, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (The Lamb)", 600, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Mega Satan)", 601, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Hush)", 602, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Delirium)", 603, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Mother)", 604, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (The Beast)", 605, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Ultra Greed)", 606, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (Ultra Greedier)", 607, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("???", p)),
+                     lambda s, p: s.has("???", p)),
         LocationData("??? (All Marks)", 608, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("???", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("???", p))),
         LocationData("Tainted ??? (Isaac, ???, Satan, The Lamb)", 609, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Soiled", p))),
         LocationData("Tainted ??? (Mega Satan)", 610, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Soiled", p)),
         LocationData("Tainted ??? (Hush & Boss Rush)", 611, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Soiled", p))),
         LocationData("Tainted ??? (Delirium)", 612, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Soiled", p)),
         LocationData("Tainted ??? (Mother)", 613, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Soiled", p)),
+                     False, lambda s, p: s.has("The Soiled", p)),
         LocationData("Tainted ??? (The Beast)", 614, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Soiled", p)),
         LocationData("Tainted ??? (Ultra Greed)", 615, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Soiled", p)),
         LocationData("Tainted ??? (Ultra Greedier)", 616, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Soiled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Soiled", p)),
         LocationData("Samson (Boss Rush)", 617, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Mom's Heart)", 618, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Satan)", 619, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Isaac)", 620, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (???)", 621, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (The Lamb)", 622, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Mega Satan)", 623, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Hush)", 624, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Delirium)", 625, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Mother)", 626, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (The Beast)", 627, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Ultra Greed)", 628, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (Ultra Greedier)", 629, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Samson", p)),
+                     lambda s, p: s.has("Samson", p)),
         LocationData("Samson (All Marks)", 630, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Samson", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Samson", p))),
         LocationData("Tainted Samson (Isaac, ???, Satan, The Lamb)", 631, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Savage", p))),
         LocationData("Tainted Samson (Mega Satan)", 632, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Savage", p)),
         LocationData("Tainted Samson (Hush & Boss Rush)", 633, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Savage", p))),
         LocationData("Tainted Samson (Delirium)", 634, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Savage", p)),
         LocationData("Tainted Samson (Mother)", 635, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Savage", p)),
         LocationData("Tainted Samson (The Beast)", 636, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Savage", p)),
         LocationData("Tainted Samson (Ultra Greed)", 637, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Savage", p)),
         LocationData("Tainted Samson (Ultra Greedier)", 638, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Savage", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Savage", p)),
         LocationData("Eve (Boss Rush)", 639, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Mom's Heart)", 640, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Satan)", 641, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Isaac)", 642, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (???)", 643, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (The Lamb)", 644, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Mega Satan)", 645, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Hush)", 646, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Delirium)", 647, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Mother)", 648, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (The Beast)", 649, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Ultra Greed)", 650, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (Ultra Greedier)", 651, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eve", p)),
+                     lambda s, p: s.has("Eve", p)),
         LocationData("Eve (All Marks)", 652, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Eve", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Eve", p))),
         LocationData("Tainted Eve (Isaac, ???, Satan, The Lamb)", 653, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Curdled", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Curdled", p))),
         LocationData("Tainted Eve (Mega Satan)", 654, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Curdled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Curdled", p)),
         LocationData("Tainted Eve (Hush & Boss Rush)", 655, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Curdled", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Curdled", p))),
         LocationData("Tainted Eve (Delirium)", 656, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Curdled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Curdled", p)),
         LocationData("Tainted Eve (Mother)", 657, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Curdled", p)),
+                     False, lambda s, p: s.has("The Curdled", p)),
         LocationData("Tainted Eve (The Beast)", 658, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Curdled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Curdled", p)),
         LocationData("Tainted Eve (Ultra Greed)", 659, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Curdled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Curdled", p)),
         LocationData("Tainted Eve (Ultra Greedier)", 660, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Curdled", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Curdled", p)),
         LocationData("Azazel (Boss Rush)", 661, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Mom's Heart)", 662, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Satan)", 663, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Isaac)", 664, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (???)", 665, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (The Lamb)", 666, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Mega Satan)", 667, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Hush)", 668, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Delirium)", 669, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Mother)", 670, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (The Beast)", 671, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Ultra Greed)", 672, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (Ultra Greedier)", 673, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Azazel", p)),
+                     lambda s, p: s.has("Azazel", p)),
         LocationData("Azazel (All Marks)", 674, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Azazel", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Azazel", p))),
         LocationData("Tainted Azazel (Isaac, ???, Satan, The Lamb)", 675, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Benighted", p))),
         LocationData("Tainted Azazel (Mega Satan)", 676, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Benighted", p)),
         LocationData("Tainted Azazel (Hush & Boss Rush)", 677, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Benighted", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Benighted", p))),
         LocationData("Tainted Azazel (Delirium)", 678, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Benighted", p)),
         LocationData("Tainted Azazel (Mother)", 679, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Benighted", p)),
         LocationData("Tainted Azazel (The Beast)", 680, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Benighted", p)),
         LocationData("Tainted Azazel (Ultra Greed)", 681, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Benighted", p)),
         LocationData("Tainted Azazel (Ultra Greedier)", 682, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Benighted", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Benighted", p)),
         LocationData("Lazarus (Boss Rush)", 683, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Mom's Heart)", 684, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Satan)", 685, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Isaac)", 686, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (???)", 687, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (The Lamb)", 688, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Mega Satan)", 689, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Hush)", 690, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Delirium)", 691, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Mother)", 692, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (The Beast)", 693, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Ultra Greed)", 694, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (Ultra Greedier)", 695, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lazarus", p)),
+                     lambda s, p: s.has("Lazarus", p)),
         LocationData("Lazarus (All Marks)", 696, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Lazarus", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Lazarus", p))),
         LocationData("Tainted Lazarus (Isaac, ???, Satan, The Lamb)", 697, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Enigma", p))),
         LocationData("Tainted Lazarus (Mega Satan)", 698, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Enigma", p)),
         LocationData("Tainted Lazarus (Hush & Boss Rush)", 699, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Enigma", p))),
         LocationData("Tainted Lazarus (Delirium)", 700, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Enigma", p)),
         LocationData("Tainted Lazarus (Mother)", 701, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Enigma", p)),
         LocationData("Tainted Lazarus (The Beast)", 702, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Enigma", p)),
         LocationData("Tainted Lazarus (Ultra Greed)", 703, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Enigma", p)),
         LocationData("Tainted Lazarus (Ultra Greedier)", 704, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Enigma", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Enigma", p)),
         LocationData("Eden (Boss Rush)", 705, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Mom's Heart)", 706, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Satan)", 707, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Isaac)", 708, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (???)", 709, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (The Lamb)", 710, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Mega Satan)", 711, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Hush)", 712, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Delirium)", 713, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Mother)", 714, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (The Beast)", 715, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Ultra Greed)", 716, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (Ultra Greedier)", 717, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Eden", p)),
+                     lambda s, p: s.has("Eden", p)),
         LocationData("Eden (All Marks)", 718, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Eden", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Eden", p))),
         LocationData("Tainted Eden (Isaac, ???, Satan, The Lamb)", 719, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Capricious", p) and can_reach_big4(p, s)),
+                     RegionRule(big4_regions, lambda s, p: s.has("The Capricious", p))),
         LocationData("Tainted Eden (Mega Satan)", 720, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Capricious", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Capricious", p)),
         LocationData("Tainted Eden (Hush & Boss Rush)", 721, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Capricious", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Capricious", p))),
         LocationData("Tainted Eden (Delirium)", 722, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Capricious", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Capricious", p)),
         LocationData("Tainted Eden (Mother)", 723, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Capricious", p)),
+                     False, lambda s, p: s.has("The Capricious", p)),
         LocationData("Tainted Eden (The Beast)", 724, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Capricious", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Capricious", p)),
         LocationData("Tainted Eden (Ultra Greed)", 725, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Capricious", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Capricious", p)),
         LocationData("Tainted Eden (Ultra Greedier)", 726, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Capricious", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Capricious", p)),
         LocationData("Lost (Boss Rush)", 727, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Mom's Heart)", 728, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Satan)", 729, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Isaac)", 730, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (???)", 731, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (The Lamb)", 732, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Mega Satan)", 733, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Hush)", 734, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Delirium)", 735, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Mother)", 736, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (The Beast)", 737, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Ultra Greed)", 738, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (Ultra Greedier)", 739, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lost", p)),
+                     lambda s, p: s.has("Lost", p)),
         LocationData("Lost (All Marks)", 740, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Lost", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Lost", p))),
         LocationData("Tainted Lost (Isaac, ???, Satan, The Lamb)", 741, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Baleful", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Baleful", p))),
         LocationData("Tainted Lost (Mega Satan)", 742, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Baleful", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Baleful", p)),
         LocationData("Tainted Lost (Hush & Boss Rush)", 743, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Baleful", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Baleful", p))),
         LocationData("Tainted Lost (Delirium)", 744, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Baleful", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Baleful", p)),
         LocationData("Tainted Lost (Mother)", 745, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Baleful", p)),
+                     False, lambda s, p: s.has("The Baleful", p)),
         LocationData("Tainted Lost (The Beast)", 746, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Baleful", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Baleful", p)),
         LocationData("Tainted Lost (Ultra Greed)", 747, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Baleful", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Baleful", p)),
         LocationData("Tainted Lost (Ultra Greedier)", 748, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Baleful", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Baleful", p)),
         LocationData("Lilith (Boss Rush)", 749, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Mom's Heart)", 750, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Satan)", 751, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Isaac)", 752, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (???)", 753, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (The Lamb)", 754, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Mega Satan)", 755, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Hush)", 756, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Delirium)", 757, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Mother)", 758, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (The Beast)", 759, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Ultra Greed)", 760, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (Ultra Greedier)", 761, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Lilith", p)),
+                     lambda s, p: s.has("Lilith", p)),
         LocationData("Lilith (All Marks)", 762, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Lilith", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Lilith", p))),
         LocationData("Tainted Lilith (Isaac, ???, Satan, The Lamb)", 763, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Harlot", p))),
         LocationData("Tainted Lilith (Mega Satan)", 764, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Harlot", p)),
         LocationData("Tainted Lilith (Hush & Boss Rush)", 765, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Harlot", p))),
         LocationData("Tainted Lilith (Delirium)", 766, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Harlot", p)),
         LocationData("Tainted Lilith (Mother)", 767, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Harlot", p)),
         LocationData("Tainted Lilith (The Beast)", 768, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Harlot", p)),
         LocationData("Tainted Lilith (Ultra Greed)", 769, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Harlot", p)),
         LocationData("Tainted Lilith (Ultra Greedier)", 770, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Harlot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Harlot", p)),
         LocationData("Keeper (Boss Rush)", 771, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Mom's Heart)", 772, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Satan)", 773, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Isaac)", 774, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (???)", 775, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (The Lamb)", 776, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Mega Satan)", 777, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Hush)", 778, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Delirium)", 779, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Mother)", 780, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (The Beast)", 781, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Ultra Greed)", 782, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (Ultra Greedier)", 783, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Keeper", p)),
+                     lambda s, p: s.has("Keeper", p)),
         LocationData("Keeper (All Marks)", 784, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Keeper", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Keeper", p))),
         LocationData("Tainted Keeper (Isaac, ???, Satan, The Lamb)", 785, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Miser", p))),
         LocationData("Tainted Keeper (Mega Satan)", 786, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Miser", p)),
         LocationData("Tainted Keeper (Hush & Boss Rush)", 787, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Miser", p))),
         LocationData("Tainted Keeper (Delirium)", 788, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Miser", p)),
         LocationData("Tainted Keeper (Mother)", 789, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Miser", p)),
         LocationData("Tainted Keeper (The Beast)", 790, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Miser", p)),
         LocationData("Tainted Keeper (Ultra Greed)", 791, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Miser", p)),
         LocationData("Tainted Keeper (Ultra Greedier)", 792, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Miser", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Miser", p)),
         LocationData("Apollyon (Boss Rush)", 793, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Mom's Heart)", 794, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Satan)", 795, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Isaac)", 796, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (???)", 797, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (The Lamb)", 798, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Mega Satan)", 799, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Hush)", 800, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Delirium)", 801, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Mother)", 802, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (The Beast)", 803, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Ultra Greed)", 804, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Apollyon", p)),
+                     lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (Ultra Greedier)", 805, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Apollyon", p)),
+                     False, lambda s, p: s.has("Apollyon", p)),
         LocationData("Apollyon (All Marks)", 806, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Apollyon", p)),
+                     False, lambda s, p: s.has("Apollyon", p)),
         LocationData("Tainted Apollyon (Isaac, ???, Satan, The Lamb)", 807, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Empty", p))),
         LocationData("Tainted Apollyon (Mega Satan)", 808, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Empty", p)),
         LocationData("Tainted Apollyon (Hush & Boss Rush)", 809, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Empty", p))),
         LocationData("Tainted Apollyon (Delirium)", 810, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Empty", p)),
         LocationData("Tainted Apollyon (Mother)", 811, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Empty", p)),
         LocationData("Tainted Apollyon (The Beast)", 812, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Empty", p)),
         LocationData("Tainted Apollyon (Ultra Greed)", 813, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Empty", p)),
         LocationData("Tainted Apollyon (Ultra Greedier)", 814, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Empty", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Empty", p)),
         LocationData("Forgotten (Boss Rush)", 815, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Mom's Heart)", 816, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Satan)", 817, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Isaac)", 818, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (???)", 819, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (The Lamb)", 820, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Mega Satan)", 821, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Hush)", 822, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Delirium)", 823, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Mother)", 824, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (The Beast)", 825, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Ultra Greed)", 826, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Forgotten", p)),
+                     lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (Ultra Greedier)", 827, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Forgotten", p)),
+                     False, lambda s, p: s.has("Forgotten", p)),
         LocationData("Forgotten (All Marks)", 828, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Forgotten", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Forgotten", p))),
         LocationData("Tainted Forgotten (Isaac, ???, Satan, The Lamb)", 829, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Fettered", p))),
         LocationData("Tainted Forgotten (Mega Satan)", 830, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Fettered", p)),
         LocationData("Tainted Forgotten (Hush & Boss Rush)", 831, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Fettered", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Fettered", p))),
         LocationData("Tainted Forgotten (Delirium)", 832, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Fettered", p)),
         LocationData("Tainted Forgotten (Mother)", 833, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Fettered", p)),
         LocationData("Tainted Forgotten (The Beast)", 834, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Fettered", p)),
         LocationData("Tainted Forgotten (Ultra Greed)", 835, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Fettered", p)),
         LocationData("Tainted Forgotten (Ultra Greedier)", 836, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Fettered", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Fettered", p)),
         LocationData("Bethany (Boss Rush)", 837, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Mom's Heart)", 838, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Satan)", 839, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Isaac)", 840, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (???)", 841, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (The Lamb)", 842, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Mega Satan)", 843, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Hush)", 844, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Delirium)", 845, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Mother)", 846, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (The Beast)", 847, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Ultra Greed)", 848, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (Ultra Greedier)", 849, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Bethany", p)),
+                     lambda s, p: s.has("Bethany", p)),
         LocationData("Bethany (All Marks)", 850, "Mega Satan", ['Mark', 'All_Marks'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Bethany", p) and can_reach_all_marks(p, s)),
+                     False, RegionRule(all_marks_regions, lambda s, p: s.has("Bethany", p))),
         LocationData("Tainted Bethany (Isaac, ???, Satan, The Lamb)", 851, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Zealot", p))),
         LocationData("Tainted Bethany (Mega Satan)", 852, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Zealot", p)),
         LocationData("Tainted Bethany (Hush & Boss Rush)", 853, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p) and can_reach_br_hush(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(br_hush_regions, lambda s, p: s.has("The Zealot", p))),
         LocationData("Tainted Bethany (Delirium)", 854, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Zealot", p)),
         LocationData("Tainted Bethany (Mother)", 855, "Corpse", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Zealot", p)),
         LocationData("Tainted Bethany (The Beast)", 856, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Zealot", p)),
         LocationData("Tainted Bethany (Ultra Greed)", 857, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Zealot", p)),
         LocationData("Tainted Bethany (Ultra Greedier)", 858, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Zealot", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Zealot", p)),
         LocationData("Jacob and Esau (Boss Rush)", 859, "Chapter 3", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Mom's Heart)", 860, "Chapter 4", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Satan)", 861, "Sheol", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Isaac)", 862, "Cathedral", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (???)", 863, "The Chest", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (The Lamb)", 864, "Dark Room", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Mega Satan)", 865, "Mega Satan", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Hush)", 866, "Blue Womb", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Delirium)", 867, "The Void", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Mother)", 868, "Corpse", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (The Beast)", 869, "Ascent", ['Mark'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p)),
+                     lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Ultra Greed)", 870, "Greed Mode", ['Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Jacob and Esau", p)),
+                     False, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (Ultra Greedier)", 871, "Greedier Mode", ['Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("Jacob and Esau", p)),
+                     False, lambda s, p: s.has("Jacob and Esau", p)),
         LocationData("Jacob and Esau (All Marks)", 872, "Mega Satan", ['Mark', 'All_Marks'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("Jacob and Esau", p) and can_reach_all_marks(p, s)),
+                     RegionRule(all_marks_regions, lambda s, p: s.has("Jacob and Esau", p))),
         LocationData("Tainted Jacob (Isaac, ???, Satan, The Lamb)", 873, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deserter", p) and can_reach_big4(p, s)),
+                     LocationProgressType.DEFAULT, False, RegionRule(big4_regions, lambda s, p: s.has("The Deserter", p))),
         LocationData("Tainted Jacob (Mega Satan)", 874, "Mega Satan", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deserter", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deserter", p)),
         LocationData("Tainted Jacob (Hush & Boss Rush)", 875, "Blue Womb", ['Mark', 'Tainted_Mark'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: s.has("The Deserter", p) and can_reach_br_hush(p, s)),
+                     RegionRule(br_hush_regions, lambda s, p: s.has("The Deserter", p))),
         LocationData("Tainted Jacob (Delirium)", 876, "The Void", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deserter", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deserter", p)),
         LocationData("Tainted Jacob (Mother)", 877, "Corpse", ['Mark', 'Tainted_Mark'], 1, LocationProgressType.DEFAULT,
-                     False, lambda s: s.has("The Deserter", p)),
+                     False, lambda s, p: s.has("The Deserter", p)),
         LocationData("Tainted Jacob (The Beast)", 878, "Ascent", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deserter", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deserter", p)),
         LocationData("Tainted Jacob (Ultra Greed)", 879, "Greed Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deserter", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deserter", p)),
         LocationData("Tainted Jacob (Ultra Greedier)", 880, "Greedier Mode", ['Mark', 'Tainted_Mark'], 1,
-                     LocationProgressType.DEFAULT, False, lambda s: s.has("The Deserter", p)),
+                     LocationProgressType.DEFAULT, False, lambda s, p: s.has("The Deserter", p)),
         LocationData("All Completion Marks", 881, "Mega Satan", ['Mark', 'All_Marks', 'All_Chars'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: can_reach_all_marks(p, s) and has_all_characters(p, s)),
+                     RegionRule(all_marks_regions, lambda s, p: has_all_characters(p, s))),
         LocationData("Mega Satan Defeated (All Non-Tainted Characters)", 882, "Mega Satan",
                      ['Mark', 'All_Non_Tainted_Chars'], 1, LocationProgressType.DEFAULT, False,
-                     lambda s: has_all_normal_characters(p, s)),
+                     lambda s, p: has_all_normal_characters(p, s)),
         LocationData("All Non-Tainted Completion Marks", 883, "Mega Satan", ['Mark', 'All_Non_Tainted_Chars'], 1,
                      LocationProgressType.DEFAULT, False,
-                     lambda s: can_reach_all_marks(p, s) and has_all_normal_characters(p, s)),
+                     RegionRule(all_marks_regions, lambda s, p: has_all_normal_characters(p, s))),
 
         LocationData("Victory (Baby Hunt)", 1688, "Menu", ['Victory'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: True),
+                     lambda s, p: True),
     ]
 
     # Add extra locations
@@ -1797,9 +1801,9 @@ def locations_data(player: Optional[int]):
         region = ap_location_regions[floor((i/50) * len(ap_location_regions))]
 
         locs.append(LocationData("Shop Donation ({i}x)".format(i=i+1), 1086 + i, "Chapter 1", ['AP', 'Shop_Donation'], 1, LocationProgressType.DEFAULT, True,
-                     lambda s: s.can_reach_region(region, p)))
+                     RegionRule((region,))))
         locs.append(LocationData("Greed Donation ({i}x)".format(i=i+1), 1287 + i, "Greed Mode", ['AP', 'Greed_Donation'], 1, LocationProgressType.DEFAULT,
-                     True, lambda s: s.can_reach_region(region, p)))
-        locs.append(LocationData("AP Consumable ({i}x)".format(i=i+1), 1488 + i, "Chapter 1", ['AP'], 1, LocationProgressType.DEFAULT, True, lambda s: s.can_reach_region(region, p)))
+                     True, RegionRule((region,))))
+        locs.append(LocationData("AP Consumable ({i}x)".format(i=i+1), 1488 + i, "Chapter 1", ['AP'], 1, LocationProgressType.DEFAULT, True, RegionRule((region,))))
 
-    return locs
\ No newline at end of file
+    return tuple(locs)
@@ -1,7 +1,8 @@
 import os
 import threading
+import time
 import zipfile
-from typing import TYPE_CHECKING, Optional, Union, Tuple, Callable, List, Any, Dict
+from typing import TYPE_CHECKING, Optional, Union, Tuple, Callable, List, Any, Dict, NamedTuple
 import xml.etree.ElementTree as ET
 
 import jinja2
@@ -21,15 +22,55 @@ template_env: Optional[jinja2.Environment] = None
 metadata_template: Optional[jinja2.Template] = None
 mainlua_template: Optional[jinja2.Template] = None
 
+code_to_state_lua: Optional[str] = None # The same for every player, so it is only rendered once
+
+class StaticMember(NamedTuple):
+    """A static mod file, read once and written into every player's mod."""
+    path: str # Relative to the mod directory
+    date_time: Tuple[int, int, int, int, int, int]
+    content: bytes
+
+static_members_lock = threading.Lock()
+static_members: Dict[Optional[str], List[StaticMember]] = {} # apworld path (None when unpacked) to its mod files
+
+def get_static_members(zip_path: Optional[str]) -> List[StaticMember]:
+    """Returns the files of the mod, reading them from the apworld or the world folder on first use."""
+    with static_members_lock:
+        if zip_path in static_members:
+            return static_members[zip_path]
+
+        members: List[StaticMember] = []
+        if zip_path:
+            with zipfile.ZipFile(zip_path) as zf:
+                for file in zf.infolist():
+                    if not file.is_dir() and "/data/mod/" in file.filename:
+                        path_part = Utils.get_text_after(file.filename, "/data/mod/")
+                        members.append(StaticMember(path_part, file.date_time, zf.read(file)))
+        else:
+            basepath = os.path.join(os.path.dirname(__file__), "data", "mod")
+            for dirpath, dirnames, filenames in os.walk(basepath):
+                for filename in filenames:
+                    file_path = os.path.join(dirpath, filename)
+                    path_part = os.path.relpath(file_path, basepath).replace(os.sep, "/")
+                    with open(file_path, "rb") as file:
+                        content = file.read()
+                    members.append(StaticMember(path_part, time.localtime(os.path.getmtime(file_path))[:6],
+                                                content))
+
+        static_members[zip_path] = members
+        return members
+
 class TBOIModFile(worlds.Files.APPlayerContainer):
     game = "The Binding of Isaac: Repentance+"
     patch_file_ending = ".zip"
     writing_tasks: List[Callable[[], Tuple[str, Union[str, bytes]]]]
+    static_members: List[Tuple[str, StaticMember]] # Target path and the member to write there
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
 
         self.writing_tasks = []
+        self.static_members = []
 
     def write_contents(self, opened_zipfile: zipfile.ZipFile) -> None:
         mod_dir = self.path[:-4]
@@ -39,6 +80,11 @@ class TBOIModFile(worlds.Files.APPlayerContainer):
                 filename = os.path.join(root, file)
                 opened_zipfile.write(filename, os.path.relpath(filename, os.path.join(mod_dir, '..')))
 
+        for target, member in self.static_members:
+            zinfo = zipfile.ZipInfo(target, member.date_time)
+            zinfo.external_attr = 0o600 << 16
+            opened_zipfile.writestr(zinfo, member.content, self.compression_method, self.compression_level)
+
         for task in self.writing_tasks:
             target, content = task()
             opened_zipfile.writestr(target, content)
@@ -104,7 +150,7 @@ def generate_mod(world: "TBOIWorld", output_directory: str):
     mw = world.multiworld
 
     # Load templates
-    global metadata_template, mainlua_template
+    global metadata_template, mainlua_template, template_env, code_to_state_lua
     with template_load_lock:
         if not metadata_template:
             def load_template(name: str):
@@ -116,6 +162,7 @@ def generate_mod(world: "TBOIWorld", output_directory: str):
 
             metadata_template = template_env.get_template("metadata.xml")
             mainlua_template = template_env.get_template("main.lua")
+            code_to_state_lua = str(template_env.get_template("macros.lua").module.dict_to_lua(make_code_to_state_table()))
 
     # Set template data
     mod_name = f"_Archipelago ({mw.get_file_safe_player_name(player)}) ({mw.seed_name})"
@@ -127,7 +174,7 @@ def generate_mod(world: "TBOIWorld", output_directory: str):
         "seed_name": mw.seed_name,
         "slot_name": mw.get_player_name(player),
         "item_states": make_item_states_table(world),
-        "item_code_to_item_state_key": make_code_to_state_table(),
+        "item_code_to_item_state_lua": code_to_state_lua,
         "shop_donation_location_count": world.options.shop_donations.value,
         "greed_donation_location_count": world.options.greed_donations.value,
         "consumable_location_count": world.options.consumable_locations.value
@@ -137,21 +184,8 @@ def generate_mod(world: "TBOIWorld", output_directory: str):
     zip_path = os.path.join(output_directory, f"{dir_name}.zip")
     mod = TBOIModFile(zip_path, player=player, player_name=world.player_name)
     
-    if world.zip_path:
-        with zipfile.ZipFile(world.zip_path) as zf:
-            for file in zf.infolist():
-                if not file.is_dir() and "/data/mod/" in file.filename:
-                    path_part = Utils.get_text_after(file.filename, "/data/mod/")
-                    mod.writing_tasks.append(lambda arcpath=dir_name+"/"+path_part, content=zf.read(file):
-                                             (arcpath, content))
-    else:
-        basepath = os.path.join(os.path.dirname(__file__), "data", "mod")
-        for dirpath, dirnames, filenames in os.walk(basepath):
-            base_arc_path = (dir_name+"/"+os.path.relpath(dirpath, basepath)).rstrip("/.\\")
-            for filename in filenames:
-                mod.writing_tasks.append(lambda arcpath=base_arc_path+"/"+filename,
-                                                file_path=os.path.join(dirpath, filename):
-                                         (arcpath, open(file_path, "rb").read()))
+    for member in get_static_members(world.zip_path):
+        mod.static_members.append((dir_name+"/"+member.path, member))
 
     # All files go in the root of the zip
     mod.writing_tasks.append(lambda: ("main.lua", mainlua_template.render(**template_data)))
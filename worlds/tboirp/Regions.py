@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING, NamedTuple, List, Optional, Dict
+from typing import TYPE_CHECKING, NamedTuple, List, Optional, Dict, Iterable
 
-from BaseClasses import Region, LocationProgressType
+from BaseClasses import Region
 from ..generic.Rules import CollectionRule
 from .Locations import LocationData, TBOILocation
 
@@ -13,9 +13,8 @@ class RegionExitData(NamedTuple):
 
 class TBOIRegionData(NamedTuple):
     to_regions: Optional[List[str]] = None
-    locations: Optional[List[LocationData]] = []
 
-def make_regions(world: "TBOIWorld", location_data: list[LocationData]):
+def make_regions(world: "TBOIWorld", location_data: Iterable[LocationData]):
     player = world.player
     multiworld = world.multiworld
 
@@ -85,19 +84,16 @@ def make_regions(world: "TBOIWorld", location_data: list[LocationData]):
     all_regions: Dict[str, TBOIRegionData] = {**stages, **chapters, **misc}
 
     # Set location data
+    region_locations: Dict[str, List[LocationData]] = {region_name: [] for region_name in all_regions}
     for location_datum in location_data:
-        all_regions[location_datum.region].locations.append(location_datum)
+        region_locations[location_datum.region].append(location_datum)
 
     # Create regions and locations, add them to multiworld
-    for region_name, region_data in all_regions.items():
+    for region_name in all_regions:
         region = Region(region_name, player, multiworld)
 
-        for location_datum in region_data.locations:
-            if location_datum.region == region_name: # Location is at this region
-                location = TBOILocation(player, location_datum, region)
-                if location.progress_type == LocationProgressType.EXCLUDED:
-                    pass
-                region.locations.append(location)
+        for location_datum in region_locations[region_name]:
+            region.locations.append(TBOILocation(player, location_datum, region))
 
         multiworld.regions.append(region)
 
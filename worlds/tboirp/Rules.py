@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, NamedTuple, Optional, Tuple
 
 from BaseClasses import MultiWorld, CollectionState
 from ..generic.Rules import CollectionRule
@@ -30,27 +30,43 @@ def has_all_normal_characters(player: int, state: CollectionState):
 def has_all_characters(player: int, state: CollectionState):
     return state.has_all(normal_character_items + tainted_character_tems, player)
 
-def can_reach_all_regions(player: int, state: CollectionState, regions: list[str]):
+def can_reach_all_regions(player: int, state: CollectionState, regions: Iterable[str]):
     for name in regions:
         if not state.can_reach_region(name, player):
             return False
 
     return True
 
-def can_reach_big4(player: int, state: CollectionState):
-    return can_reach_all_regions(player, state, ["Cathedral", "The Chest", "Sheol", "Dark Room"])
-
-def can_reach_br_hush(player: int, state: CollectionState):
-    return can_reach_all_regions(player, state, ["Chapter 3", "Blue Womb"])
-
-def can_reach_all_marks(player: int, state: CollectionState):
-    return can_reach_all_regions(player, state, [
-        "Chapter 3", "Chapter 4",
-        "Dark Room", "The Chest", "Mega Satan",
-        "Blue Womb", "The Void",
-        "Corpse", "Ascent",
-        "Greed Mode", "Greedier Mode"
-    ])
+big4_regions = ("Cathedral", "The Chest", "Sheol", "Dark Room")
+br_hush_regions = ("Chapter 3", "Blue Womb")
+all_marks_regions = (
+    "Chapter 3", "Chapter 4",
+    "Dark Room", "The Chest", "Mega Satan",
+    "Blue Womb", "The Void",
+    "Corpse", "Ascent",
+    "Greed Mode", "Greedier Mode"
+)
+
+class RegionRule(NamedTuple):
+    """
+    A location rule that needs all the given regions to be reachable, on top of an optional item rule.
+    It can be called like any other location rule, but make_rules compiles it against the player's regions so that
+    they aren't looked up by name every time it is checked.
+    """
+    regions: Tuple[str, ...]
+    rule: Optional[Callable[[CollectionState, int], bool]] = None
+
+    def __call__(self, state: CollectionState, player: int) -> bool:
+        return (self.rule is None or self.rule(state, player)) and can_reach_all_regions(player, state, self.regions)
+
+    def compile(self, mw: MultiWorld, player: int) -> CollectionRule:
+        regions = tuple(mw.get_region(name, player) for name in self.regions)
+        rule = self.rule
+
+        if rule is None:
+            return lambda state: all(region.can_reach(state) for region in regions)
+
+        return lambda state: rule(state, player) and all(region.can_reach(state) for region in regions)
 
 def set_region_access_rule(mw: MultiWorld, player: int, region: str, rule: CollectionRule):
     for entrance in mw.get_region(region, player).entrances:
@@ -100,3 +116,9 @@ def make_rules(world: "TBOIWorld"):
     set_region_access_rule(mw, ply, "Ascent", lambda state: state.has("A Strange Door", ply) and state.has_any(["The Polaroid", "The Negative"], ply))
 
     set_region_access_rule(mw, ply, "Greedier Mode", lambda state: state.has("Greedier!", ply))
+
+    # Location rules that need regions to be reachable were created before the regions existed, resolve them now.
+    # Only locations check regions, which are rechecked every sweep, so no indirect conditions need to be registered.
+    for location in world.get_locations():
+        if isinstance(location.region_rule, RegionRule):
+            location.access_rule = location.region_rule.compile(mw, ply)
@@ -1,9 +1,9 @@
 from typing import Dict, ClassVar
 
-from BaseClasses import Item, Tutorial, LocationProgressType
+from BaseClasses import Item, Tutorial, LocationProgressType, MultiWorld
 from worlds.AutoWorld import World, WebWorld
 from .Items import filler_items, trap_items, TBOIItem, ItemData, character_items, generate_items_for_pool, \
-    do_pool_rando_shuffle
+    do_pool_rando_shuffle, PlayerItems
 from .Items_Data import items_data, TBOIPoolEntry
 from .Locations import make_locations, LocationData
 from .Locations_Data import locations_data
@@ -49,14 +49,16 @@ class TBOIWorld(World):
     topology_present = False
     web = TBOIWebWorld()
     settings: ClassVar[TBOISettings]
+    isolated_generation = True
 
     options_dataclass = TBOIOptions
     options: TBOIOptions
 
     starting_character_item: str
+    player_items: PlayerItems # The player's changes to items_data
 
     item_name_to_id = {item[0]: item[1].code for item in items_data.items()}
-    location_name_to_id = {location.name: location.code for location in locations_data(None)}
+    location_name_to_id = {location.name: location.code for location in locations_data()}
 
     usable_items: Dict[str, ItemData] # Items that will appear in the multiworld
     default_items: Dict[str, ItemData] # Items that start unlocked for the player
@@ -69,11 +71,15 @@ class TBOIWorld(World):
 
     generate_output = generate_mod
 
+    def __init__(self, multiworld: MultiWorld, player: int):
+        super().__init__(multiworld, player)
+        self.player_items = PlayerItems()
+
     def set_rules(self):
         make_rules(self)
 
     def create_item(self, name: str) -> Item:
-        return TBOIItem(self.player, name, items_data[name])
+        return TBOIItem(self.player, name, self.player_items[name])
 
     def create_items(self):
         items_table: dict[str: ItemData] = {name: item for name, item in self.usable_items.items()}
@@ -88,9 +94,9 @@ class TBOIWorld(World):
 
     def get_filler_item_name(self) -> str:
         if self.random.random() < 0.25:
-            return self.multiworld.random.choice(trap_items)
+            return self.random.choice(trap_items)
 
-        return self.multiworld.random.choice(filler_items)
+        return self.random.choice(filler_items)
 
     def generate_early(self) -> None:
         self.starting_character_item = character_items[self.options.starting_character.value]
@@ -5,7 +5,7 @@ local mod = RegisterMod("{{ mod_formal_name }}", 1)
 ARCHIPELAGO_SEED = "{{ seed_name }}"
 ARCHIPELAGO_SLOT = "{{ slot_name }}"
 
-CODE_TO_STATE = {{ dict_to_lua(item_code_to_item_state_key) }}
+CODE_TO_STATE = {{ item_code_to_item_state_lua }}
 
 SHOP_DONATION_LOCATION_COUNT = {{ shop_donation_location_count }}
 GREED_DONATION_LOCATION_COUNT = {{ greed_donation_location_count }}
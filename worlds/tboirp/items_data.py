@@ -1,4 +1,5 @@
-from typing import Optional, NamedTuple
+from types import MappingProxyType
+from typing import Mapping, Optional, NamedTuple
 
 from BaseClasses import ItemClassification
 
@@ -20,7 +21,8 @@ class ItemData(NamedTuple):
     quality: Optional[int]
     pools: Optional[list[Pool]]
 
-items_data = {
+# Shared by every player and never changed, see Items.PlayerItems for a player's changes to it
+items_data: Mapping[str, ItemData] = MappingProxyType({
     "The Sad Onion"                 :ItemData(1, ItemClassification.filler, ['Item', 'Summonable', 'Tears_Up', 'Offensive'], None, 1, 1, 3, [Pool("treasure", 1), Pool("greedTreasure", 1), Pool("craneGame", 1)]),
     "The Inner Eye"                 :ItemData(2, ItemClassification.filler, ['Item', 'Summonable', 'Offensive'], None, 2, 1, 3, [Pool("treasure", 1), Pool("greedTreasure", 1)]),
     "Spoon Bender"                  :ItemData(3, ItemClassification.filler, ['Item', 'Summonable', 'Offensive'], None, 3, 1, 3, [Pool("treasure", 1), Pool("greedTreasure", 1), Pool("craneGame", 1)]),
@@ -1794,4 +1796,4 @@ items_data = {
     "Three Bombs"                   :ItemData(1789, ItemClassification.filler, ['Filler'], None, None, 0, None, []),
     "Three Keys"                    :ItemData(1790, ItemClassification.filler, ['Filler'], None, None, 0, None, []),
     "Victory"                       :ItemData(1791, ItemClassification.progression, ['Victory'], None, None, 1, None, []),
-}
+})
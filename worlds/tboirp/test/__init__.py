@@ -0,0 +1,5 @@
+from test.bases import WorldTestBase
+
+
+class TBOITestBase(WorldTestBase):
+    game = "The Binding of Isaac: Repentance+"
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+from ..Client import GameOutputWatcher
+
+
+class TestGameOutputWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "save1.dat")
+        self.watcher = GameOutputWatcher(self.path)
+        self.writes = 0
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, data: bytes, mode: str = "ab") -> None:
+        with open(self.path, mode) as file:
+            file.write(data)
+        # Make every write visible, even on file systems with coarse modification times
+        self.writes += 1
+        os.utime(self.path, ns=(self.writes * 1_000_000_000, self.writes * 1_000_000_000))
+
+    def test_missing_file(self) -> None:
+        """Tests that nothing is read before the game created its file."""
+        self.assertEqual(self.watcher.read(), [])
+
+    def test_partial_line(self) -> None:
+        """Tests that a record the game is still writing is only read once its line is complete."""
+        self.write(b'{"a": 1}\n{"b"')
+        self.assertEqual(self.watcher.read(), [{"a": 1}])
+        self.assertEqual(self.watcher.read(), [])
+        self.write(b': 2}\n')
+        self.assertEqual(self.watcher.read(), [{"b": 2}])
+
+    def test_whole_file_snapshot(self) -> None:
+        """Tests that a file without line endings is read whole every time it is rewritten."""
+        self.write(b'{"checked": [1]}', "wb")
+        self.assertEqual(self.watcher.read(), [{"checked": [1]}])
+        self.write(b'{"checked": [1, 2]', "wb")
+        self.assertEqual(self.watcher.read(), [])
+        self.write(b'{"checked": [1, 2]}', "wb")
+        self.assertEqual(self.watcher.read(), [{"checked": [1, 2]}])
+
+    def test_truncated_file(self) -> None:
+        """Tests that a file which shrank is read from the start again."""
+        self.write(b'{"a": 1}\n{"b": 2}\n')
+        self.assertEqual(self.watcher.read(), [{"a": 1}, {"b": 2}])
+        self.write(b'{"c": 3}\n', "wb")
+        self.assertEqual(self.watcher.read(), [{"c": 3}])
+        self.write(b'{"d": 4}\n')
+        self.assertEqual(self.watcher.read(), [{"d": 4}])
+
+    def test_rewritten_file(self) -> None:
+        """Tests that a file rewritten to the same or a larger size is read from the start again."""
+        self.write(b'{"a": 1}\n')
+        self.assertEqual(self.watcher.read(), [{"a": 1}])
+        self.write(b'{"b": 2}\n', "wb")
+        self.assertEqual(self.watcher.read(), [{"b": 2}])
+        self.write(b'{"c": 3}\n{"d": 4}\n', "wb")
+        self.assertEqual(self.watcher.read(), [{"c": 3}, {"d": 4}])
+        self.write(b'{"e": 5}\n')
+        self.assertEqual(self.watcher.read(), [{"e": 5}])
+
+    def test_replaced_file(self) -> None:
+        """Tests that a file replaced by another one is read from the start, even if it begins the same way."""
+        self.write(b'{"a": 1}\n')
+        self.assertEqual(self.watcher.read(), [{"a": 1}])
+        replacement = self.path + ".new"
+        with open(replacement, "wb") as file:
+            file.write(b'{"a": 1}\n{"b": 2}\n')
+        os.replace(replacement, self.path)
+        self.assertEqual(self.watcher.read(), [{"a": 1}, {"b": 2}])
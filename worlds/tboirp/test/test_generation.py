@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from BaseClasses import MultiWorld
+from Fill import distribute_items_restrictive
+from test.general import gen_steps, setup_multiworld
+from worlds.AutoWorld import call_all
+from .. import TBOIWorld
+from ..Items_Data import items_data
+
+
+class TestMultiplePlayers(TestCase):
+    multiworld: MultiWorld
+
+    def setUp(self) -> None:
+        self.multiworld = setup_multiworld([TBOIWorld, TBOIWorld])
+
+    def test_locations_per_player(self) -> None:
+        """Tests that a second TBOI world gets its own locations instead of clashing with the first one's."""
+        names = {player: [location.name for location in self.multiworld.get_locations(player)]
+                 for player in self.multiworld.player_ids}
+        self.assertIn("Basement Cleared (40x)", names[1])
+        self.assertEqual(names[1], names[2])
+        for player in self.multiworld.player_ids:
+            for location in self.multiworld.get_locations(player):
+                self.assertEqual(location.parent_region.player, player)
+                self.assertIs(self.multiworld.get_location(location.name, player), location)
+
+    def test_fill(self) -> None:
+        """Tests that two TBOI worlds can be filled and beaten together."""
+        distribute_items_restrictive(self.multiworld)
+        self.assertFalse(self.multiworld.get_unfilled_locations())
+        self.assertTrue(self.multiworld.can_beat_game())
+
+
+class TestPlayerItems(TestCase):
+    def test_overlays_are_per_player(self) -> None:
+        """Tests that changes to a player's items stay in their overlay, without leaking to other players."""
+        shared_items = dict(items_data)
+        multiworld = setup_multiworld([TBOIWorld, TBOIWorld], ())
+        for world in multiworld.worlds.values():
+            world.options.pool_rando.value = world.options.pool_rando.option_shuffle
+        for step in gen_steps:
+            call_all(multiworld, step)
+
+        self.assertEqual(dict(items_data), shared_items)
+        world_1, world_2 = multiworld.worlds[1], multiworld.worlds[2]
+        self.assertTrue(world_1.player_items.changed)
+        for world, other_world in ((world_1, world_2), (world_2, world_1)):
+            for name in world.player_items.changed:
+                expected = other_world.player_items.changed.get(name, items_data[name])
+                self.assertIs(other_world.player_items[name], expected)
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import zipfile
+
+from . import TBOITestBase
+from .. import Mod
+from ..Mod import StaticMember, generate_mod
+
+
+class TestModOutput(TBOITestBase):
+    options = {
+        "pool_rando": "shuffle",
+    }
+
+    def test_mod_zip_is_valid(self) -> None:
+        """Tests that the mod archive, including the static mod files, can be read back."""
+        world = self.multiworld.worlds[1]
+        static_member = StaticMember("content/test.xml", (2020, 1, 1, 0, 0, 0), b"<test/>" * 100)
+        original_members = Mod.static_members.get(world.zip_path)
+        Mod.static_members[world.zip_path] = [static_member]
+        try:
+            with tempfile.TemporaryDirectory() as output_directory:
+                generate_mod(world, output_directory)
+                zip_files = os.listdir(output_directory)
+                self.assertEqual(len(zip_files), 1)
+                with zipfile.ZipFile(os.path.join(output_directory, zip_files[0])) as opened_zipfile:
+                    self.assertIsNone(opened_zipfile.testzip())
+                    names = opened_zipfile.namelist()
+                    self.assertIn("main.lua", names)
+                    self.assertIn("metadata.xml", names)
+                    self.assertIn("resources/itempools.xml", names)
+                    static_name = zip_files[0][:-4] + "/content/test.xml"
+                    self.assertEqual(opened_zipfile.read(static_name), static_member.content)
+                    self.assertEqual(opened_zipfile.getinfo(static_name).compress_type, zipfile.ZIP_DEFLATED)
+        finally:
+            if original_members is None:
+                Mod.static_members.pop(world.zip_path, None)
+            else:
+                Mod.static_members[world.zip_path] = original_members
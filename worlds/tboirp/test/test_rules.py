@@ -0,0 +1,24 @@
+from math import floor
+
+from . import TBOITestBase
+from ..Locations_Data import ap_location_regions
+
+
+class TestAPLocationRules(TBOITestBase):
+    options = {
+        "consumable_locations": 50,
+    }
+
+    def test_tiers_need_their_own_region(self) -> None:
+        """Tests that every tier of AP locations requires its own region instead of the last tier's."""
+        locations = [location for location in self.world.get_locations() if location.name.startswith("AP Consumable")]
+        self.assertGreater(len(locations), 40)
+        for location in locations:
+            i = int(location.name[len("AP Consumable ("):-len("x)")]) - 1
+            region = self.world.get_region(ap_location_regions[floor((i / 50) * len(ap_location_regions))])
+            with self.subTest(location=location.name):
+                self.assertEqual(location.region_rule.regions, (region.name,))
+                self.assertEqual(location.can_reach(self.multiworld.state), region.can_reach(self.multiworld.state))
+
+        self.assertTrue(self.can_reach_location("AP Consumable (1x)"))
+        self.assertFalse(self.can_reach_location(max(locations, key=lambda location: location.address).name))